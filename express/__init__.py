@@ -1,11 +1,43 @@
+import os
+import time
 import warnings
 import importlib
 
 from express import settings
+from express.parsers.utils import WorkDirIndex
+from express.cache import PropertyCache, hash_object
 
 # disable pymatgen warnings
 warnings.filterwarnings("ignore")
 
+# classes keyed on reference, e.g. express.parsers.apps.vasp.parser.VaspParser
+CLASSES = {}
+
+
+def memoize(func):
+    """
+    Returns a wrapper of a given function which caches its results keyed on arguments. Calls with unhashable arguments
+    are not cached.
+
+    Args:
+        func (function): function to memoize.
+
+    Returns:
+        function
+    """
+    cache = {}
+
+    def wrapper(*args, **kwargs):
+        try:
+            key = (args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+        if key not in cache: cache[key] = func(*args, **kwargs)
+        return cache[key]
+
+    return wrapper
+
 
 class ExPrESS(object):
     """
@@ -21,9 +53,14 @@ class ExPrESS(object):
             structure parser specific keys:
                 structure_string (str): structure string.
                 structure_format (str): structure format, poscar or espresso-in.
+            cache_dir (str): directory of the persistent property cache, see `express.cache.PropertyCache`. Extracted
+                properties are not cached if not given.
     """
 
     def __init__(self, parser_name=None, *args, **kwargs):
+        cache_dir = kwargs.pop("cache_dir", None)
+        self.cache = PropertyCache(cache_dir) if cache_dir else None
+        self.parser_name, self.parser_args, self.parser_kwargs = parser_name, args, kwargs
         self.parser = self._get_parser_class(parser_name)(*args, **kwargs) if parser_name else None
 
     def _get_parser_class(self, parser_name):
@@ -46,12 +83,16 @@ class ExPrESS(object):
         Args:
             reference (str): reference, e.g. express.parsers.apps.vasp.parser.VaspParser
 
+        Note: classes are resolved once.
+
         Returns:
              class
         """
-        class_name = reference.split('.')[-1]
-        module_name = '.'.join(reference.split('.')[:-1])
-        return getattr(importlib.import_module(module_name), class_name)
+        if reference not in CLASSES:
+            class_name = reference.split('.')[-1]
+            module_name = '.'.join(reference.split('.')[:-1])
+            CLASSES[reference] = getattr(importlib.import_module(module_name), class_name)
+        return CLASSES[reference]
 
     def _get_property_class(self, property_name):
         """
@@ -75,8 +116,103 @@ class ExPrESS(object):
             args (list): args passed to the underlying property method.
             kwargs (dict): kwargs passed to the underlying property method.
 
+        Note: the property is looked up in the persistent cache first if the cache is enabled. As the parser may reuse
+        data it parsed for other properties, all files the parser read so far (see `BaseParser.read_files`) are recorded
+        as inputs of the property. The listing of the working directory is part of the key, as files found through it
+        (e.g. pdos files) may appear later.
+
         Returns:
              dict
         """
+        if self.cache is None: return self._extract_property(property_name, *args, **kwargs)
+        key = [self.parser_name, self.parser_args, self.parser_kwargs, property_name, args, kwargs,
+               self._get_work_dir_listing_hash()]
+        data = self.cache.get(key)
+        if data is None:
+            data = self._extract_property(property_name, *args, **kwargs)
+            self.cache.set(key, getattr(self.parser, "read_files", ()), data)
+        return data
+
+    def _get_work_dir_listing_hash(self):
+        """
+        Returns the hash of the files listed in the working directory index of the parser. Cache files and files
+        generated by express (see `settings.GENERATED_FILE_SUFFIXES`) are excluded, as they change between runs.
+
+        Returns:
+            str: None if the parser has no working directory index.
+        """
+        index = getattr(self.parser, "work_dir_index", None)
+        if not isinstance(index, WorkDirIndex): return None
+        cache_dir, suffixes = os.path.join(self.cache.cache_dir, ""), tuple(settings.GENERATED_FILE_SUFFIXES)
+        paths = [p for p in map(os.path.abspath, index.files) if not p.startswith(cache_dir)]
+        return hash_object([p for p in paths if not p.endswith(suffixes)])
+
+    def _extract_property(self, property_name, *args, **kwargs):
         property_instance = self._get_property_class(property_name)(property_name, self.parser, *args, **kwargs)
         return property_instance.serialize_and_validate()
+
+    def properties(self, properties, *args, **kwargs):
+        """
+        Extracts given properties and validates them against their schemas.
+
+        Parser methods are memoized while the properties are extracted, hence data used by several properties, e.g.
+        eigenvalues used by band_gaps and band_structure, is parsed once. Parser results must therefore not be modified
+        by properties. Errors are captured per property and do not stop the extraction of the remaining properties.
+
+        Args:
+            properties (list): property names or (property name, kwargs) tuples for property-specific kwargs.
+            args (list): args passed to the underlying property methods.
+            kwargs (dict): kwargs passed to the underlying property methods.
+
+        Returns:
+             list: results in the order of given properties.
+
+        Example:
+            [
+                {
+                    "name": "total_energy",
+                    "data": {"name": "total_energy", "units": "eV", "value": -19.0089},
+                    "error": None,
+                    "time": 0.0012
+                },
+                {
+                    "name": "band_gaps",
+                    "data": None,
+                    "error": {"type": "ValueError", "message": "..."},
+                    "time": 0.0305
+                }
+            ]
+        """
+        memoized_methods = self._memoize_parser_methods()
+        try:
+            results = []
+            for property_ in properties:
+                name, property_kwargs = property_ if isinstance(property_, tuple) else (property_, {})
+                result = {"name": name, "data": None, "error": None}
+                start = time.time()
+                try:
+                    result["data"] = self.property(name, *args, **dict(kwargs, **property_kwargs))
+                except Exception as e:
+                    result["error"] = {"type": e.__class__.__name__, "message": str(e)}
+                result["time"] = time.time() - start
+                results.append(result)
+            return results
+        finally:
+            for method_name in memoized_methods:
+                delattr(self.parser, method_name)
+
+    def _memoize_parser_methods(self):
+        """
+        Shadows public methods of the parser by memoized instance attributes, see `memoize`. Methods calling each other
+        through self share the memoized results too.
+
+        Returns:
+            list: names of memoized methods.
+        """
+        if self.parser is None: return []
+        parser_class = self.parser.__class__
+        method_names = [n for n in dir(parser_class) if not n.startswith("_") and callable(getattr(parser_class, n))]
+        method_names = [n for n in method_names if n not in self.parser.__dict__]
+        for method_name in method_names:
+            setattr(self.parser, method_name, memoize(getattr(self.parser, method_name)))
+        return method_names
@@ -0,0 +1,247 @@
+import os
+import sys
+import glob
+import json
+import select
+import argparse
+import resource
+import multiprocessing
+
+import numpy as np
+
+from express import ExPrESS
+from express import settings
+
+
+def expand_job_dirs(patterns):
+    """
+    Expands given job directories or glob patterns into a list of existing directories without duplicates.
+
+    Args:
+        patterns (list): job directories or glob patterns, e.g. "/archive/jobs/*".
+
+    Returns:
+        list
+    """
+    job_dirs, seen = [], set()
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)):
+            path = os.path.abspath(path)
+            if os.path.isdir(path) and path not in seen:
+                seen.add(path)
+                job_dirs.append(path)
+    return job_dirs
+
+
+def extract_job(job):
+    """
+    Extracts properties of a single job directory. Errors are captured and returned in the record.
+
+    Args:
+        job (tuple): (job directory, parser name, properties, stdout file name, parser kwargs).
+
+    Returns:
+        dict
+
+    Example:
+        {
+            "work_dir": "/archive/jobs/job-001",
+            "results": [{"name": "total_energy", "data": {...}, "error": None, "time": 0.0012}],
+            "error": None
+        }
+    """
+    work_dir, parser_name, properties, stdout_file_name, parser_kwargs = job
+    record = {"work_dir": work_dir, "results": [], "error": None}
+    try:
+        stdout_file = os.path.join(work_dir, stdout_file_name)
+        express_ = ExPrESS(parser_name, work_dir=work_dir, stdout_file=stdout_file, **parser_kwargs)
+        record["results"] = express_.properties(properties)
+    except Exception as e:
+        record["error"] = {"type": e.__class__.__name__, "message": str(e)}
+    return record
+
+
+def limit_memory(max_memory):
+    """
+    Limits the address space of the current process, allocations beyond the limit raise MemoryError.
+
+    Args:
+        max_memory (int): maximum address space in bytes, no limit if None.
+    """
+    if max_memory: resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+
+
+def _work(connection, max_memory):
+    """
+    Worker process loop: extracts the jobs received through the connection and sends back their records until None is
+    received.
+
+    Args:
+        connection (multiprocessing.Connection): worker end of the pipe to receive (job index, job) tuples from.
+        max_memory (int): maximum address space of the worker in bytes.
+    """
+    limit_memory(max_memory)
+    for index, job in iter(connection.recv, None):
+        connection.send((index, extract_job(job)))
+
+
+class Worker(object):
+    """
+    Bulk extraction worker process handling one job at a time.
+
+    Every worker communicates through its own pipe, hence a worker killed in the middle of a transfer (e.g. by the OOM
+    killer) can not block the others, as it would with a shared queue. The pipe is readable when a record is available
+    or when the worker died.
+
+    Args:
+        max_memory (int): maximum address space of the worker in bytes.
+    """
+
+    def __init__(self, max_memory=None):
+        self.connection, connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_work, args=(connection, max_memory))
+        self.process.daemon = True
+        self.process.start()
+        connection.close()
+        self.job = None
+        self.tasks_count = 0
+
+    def fileno(self):
+        return self.connection.fileno()
+
+    def submit(self, index, job):
+        self.job = (index, job)
+        self.tasks_count += 1
+        self.connection.send(self.job)
+
+    def receive(self):
+        """
+        Receives the record of the submitted job.
+
+        Returns:
+            dict: error record if the worker died, see `lost_job_record`.
+        """
+        job, self.job = self.job, None
+        try:
+            return self.connection.recv()[1]
+        except Exception:
+            self.process.join()
+            return lost_job_record(job[1], self.process.exitcode)
+
+    def stop(self):
+        try:
+            self.connection.send(None)
+        except (IOError, OSError):
+            pass
+        self.process.join()
+        self.connection.close()
+
+    def terminate(self):
+        if self.process.is_alive(): self.process.terminate()
+        self.process.join()
+        self.connection.close()
+
+
+def lost_job_record(job, exitcode):
+    """
+    Returns the error record of a job whose worker process died, e.g. killed by the OOM killer.
+
+    Args:
+        job (tuple): job, see `extract_job`.
+        exitcode (int): worker exit code, negative signal number if the worker was killed by a signal.
+
+    Returns:
+        dict
+    """
+    message = "worker process exited with code {0} while extracting the job".format(exitcode)
+    return {"work_dir": job[0], "results": [], "error": {"type": "WorkerLostError", "message": message}}
+
+
+def extract_jobs(job_dirs, parser_name, properties, stdout_file_name, processes=None,
+                 max_tasks_per_child=settings.BULK_MAX_TASKS_PER_CHILD, max_memory_per_worker=None, **parser_kwargs):
+    """
+    Extracts properties of given job directories in worker processes. Workers are replaced after `max_tasks_per_child`
+    jobs to release the memory held by parsed data. The address space of workers is limited to
+    `max_memory_per_worker` bytes, hence an oversized job fails with a MemoryError record. Workers are watched, if one
+    dies while extracting a job (e.g. killed by the OOM killer or segfault) an error record is yielded for the job and
+    the worker is replaced.
+
+    Args:
+        job_dirs (list): job directories.
+        parser_name (str): parser name, e.g. espresso.
+        properties (list): property names or (property name, kwargs) tuples, see `ExPrESS.properties`.
+        stdout_file_name (str): name of the stdout file inside job directories.
+        processes (int): number of worker processes, number of CPUs by default.
+        max_tasks_per_child (int): number of jobs a worker process handles before it is replaced.
+        max_memory_per_worker (int): maximum address space of a worker process in bytes, no limit by default.
+        parser_kwargs (dict): kwargs passed to the parser.
+
+    Returns:
+        generator: records in the order jobs are completed, see `extract_job`.
+    """
+    jobs = [(job_dir, parser_name, properties, stdout_file_name, parser_kwargs) for job_dir in job_dirs]
+    pending = list(reversed(list(enumerate(jobs))))
+    processes = min(processes or multiprocessing.cpu_count(), len(jobs))
+    workers = [Worker(max_memory_per_worker) for _ in range(processes)]
+    try:
+        while pending or any(w.job for w in workers):
+            for index, worker in enumerate(workers):
+                if worker.job or not pending: continue
+                if not worker.process.is_alive():
+                    worker.terminate()
+                    workers[index] = worker = Worker(max_memory_per_worker)
+                worker.submit(*pending.pop())
+            ready, _, _ = select.select([w for w in workers if w.job], [], [], settings.BULK_WORKER_POLL_INTERVAL)
+            for worker in ready:
+                yield worker.receive()
+                if worker.tasks_count >= max_tasks_per_child or not worker.process.is_alive():
+                    worker.stop()
+                    workers[workers.index(worker)] = Worker(max_memory_per_worker)
+        for worker in workers:
+            worker.stop()
+    finally:
+        for worker in workers:
+            worker.terminate()
+
+
+def to_json(obj):
+    """
+    Converts numpy types to JSON serializable types.
+    """
+    if isinstance(obj, (np.ndarray, np.generic)): return obj.tolist()
+    raise TypeError("{0} is not JSON serializable".format(repr(obj)))
+
+
+def main(argv=None):
+    """
+    Bulk extraction command line entry point. Records are written as JSON Lines, one job per line.
+
+    Example:
+        express-bulk --parser espresso --stdout-file pw.out --properties total_energy band_gaps \
+            --output results.jsonl "/archive/jobs/*"
+    """
+    parser = argparse.ArgumentParser(description="Extracts properties of many job directories.")
+    parser.add_argument("job_dirs", nargs="+", help="job directories or glob patterns")
+    parser.add_argument("--parser", required=True, choices=sorted(settings.PARSERS_REGISTRY), help="parser name")
+    parser.add_argument("--properties", nargs="+", required=True, help="property names")
+    parser.add_argument("--stdout-file", required=True, help="name of the stdout file inside job directories")
+    parser.add_argument("--output", help="output JSON Lines file, standard output by default")
+    parser.add_argument("--processes", type=int, help="number of worker processes")
+    parser.add_argument("--max-tasks-per-child", type=int, default=settings.BULK_MAX_TASKS_PER_CHILD,
+                        help="number of jobs a worker process handles before it is replaced")
+    parser.add_argument("--max-memory-per-worker", type=int,
+                        help="maximum address space of a worker process in bytes, oversized jobs fail with MemoryError")
+    parser.add_argument("--cache-dir", help="directory of the persistent property cache, see express.cache")
+    args = parser.parse_args(argv)
+    parser_kwargs = {"cache_dir": args.cache_dir} if args.cache_dir else {}
+
+    output = open(args.output, "w") if args.output else sys.stdout
+    try:
+        records = extract_jobs(expand_job_dirs(args.job_dirs), args.parser, args.properties, args.stdout_file,
+                               args.processes, args.max_tasks_per_child, args.max_memory_per_worker,
+                               **parser_kwargs)
+        for record in records:
+            output.write(json.dumps(record, default=to_json) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout: output.close()
@@ -0,0 +1,218 @@
+import io
+import os
+import json
+import time
+import sqlite3
+import hashlib
+
+from express import settings
+
+
+def hash_file(file_path, chunk_size=1024 ** 2):
+    """
+    Returns SHA1 hex digest of a given file content.
+
+    Args:
+        file_path (str): file path.
+        chunk_size (int): number of bytes read at once.
+
+    Returns:
+        str
+    """
+    sha1 = hashlib.sha1()
+    with io.open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+def to_str(obj):
+    """
+    Converts unicode strings of a given JSON decoded object to str recursively, so that cached results are of the same
+    types as freshly extracted ones.
+
+    Args:
+        obj: JSON decoded object.
+
+    Returns:
+        object
+    """
+    if isinstance(obj, unicode): return obj.encode("utf-8")
+    if isinstance(obj, list): return [to_str(_) for _ in obj]
+    if isinstance(obj, dict): return dict((to_str(k), to_str(v)) for k, v in obj.iteritems())
+    return obj
+
+
+def hash_object(obj):
+    """
+    Returns SHA1 hex digest of JSON representation of a given object.
+
+    Args:
+        obj: JSON serializable object, other objects are represented by repr.
+
+    Returns:
+        str
+    """
+    return hashlib.sha1(json.dumps(obj, sort_keys=True, default=repr)).hexdigest()
+
+
+class PropertyCache(object):
+    """
+    Persistent cache of extracted properties stored in a SQLite database inside a given directory.
+
+    Results are keyed on a given key, e.g. parser name, parser kwargs, property name and property kwargs, and on the
+    content hashes of the input files the parser touched while extracting the property. The touched files are recorded
+    per key in a manifest, hence a lookup only rehashes the files of the manifest, and only if their size or
+    modification time changed. File hashes are also kept per cache instance, so that every file is hashed once as long
+    as it does not change. Least recently used results are evicted together with their manifests once their total size
+    exceeds `max_size` bytes. The total size is kept in the meta table, hence eviction does not scan all results.
+
+    Args:
+        cache_dir (str): cache directory.
+        max_size (int): maximum total size of cached results in bytes.
+    """
+
+    def __init__(self, cache_dir, max_size=settings.PROPERTY_CACHE_MAX_SIZE):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size = max_size
+        if not os.path.isdir(self.cache_dir): os.makedirs(self.cache_dir)
+        self.connection = sqlite3.connect(os.path.join(self.cache_dir, settings.PROPERTY_CACHE_FILE), timeout=60)
+        # [path, size, mtime, sha1] of the files hashed by this instance keyed on path.
+        self._signatures = {}
+        with self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS manifests (key TEXT PRIMARY KEY, files TEXT)")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS results "
+                                    "(key TEXT PRIMARY KEY, manifest TEXT, value TEXT, size INTEGER, accessed REAL)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS results_manifest ON results (manifest)")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER)")
+            self.connection.execute("INSERT OR IGNORE INTO meta VALUES ('size', 0)")
+
+    @property
+    def size(self):
+        """
+        Returns the total size of cached results and their manifests in bytes.
+
+        Returns:
+            int
+        """
+        return self.connection.execute("SELECT value FROM meta WHERE name = 'size'").fetchone()[0]
+
+    def _result_key(self, key, files):
+        """
+        Returns the content-addressed key of a result.
+
+        Args:
+            key (list): result key.
+            files (list): [path, size, mtime, sha1] of the touched files.
+
+        Returns:
+            str
+        """
+        return hash_object([key, [f[3] for f in files]])
+
+    def _files_signatures(self, paths, known_files=()):
+        """
+        Returns [path, size, mtime, sha1] of given files. Known hashes, given or computed by this instance before, are
+        reused if size and mtime did not change.
+
+        Args:
+            paths (list): file paths.
+            known_files (list): previously computed signatures.
+
+        Returns:
+            list: None if a file does not exist anymore.
+        """
+        known = dict((f[0], f) for f in known_files)
+        signatures = []
+        for path in sorted(paths):
+            if not os.path.isfile(path): return None
+            stat = os.stat(path)
+            candidates = [self._signatures.get(path), known.get(path)]
+            signature = next((c for c in candidates if c and c[1:3] == [stat.st_size, stat.st_mtime]), None)
+            if signature is None: signature = [path, stat.st_size, stat.st_mtime, hash_file(path)]
+            self._signatures[path] = signature
+            signatures.append(signature)
+        return signatures
+
+    def get(self, key):
+        """
+        Returns the cached result if the files touched to extract it did not change.
+
+        Args:
+            key (list): result key, JSON serializable.
+
+        Returns:
+            dict: None if there is no such result.
+        """
+        row = self.connection.execute("SELECT files FROM manifests WHERE key = ?", (hash_object(key),))
+        row = row.fetchone()
+        if row is None: return None
+        known_files = json.loads(row[0])
+        files = self._files_signatures([f[0] for f in known_files], known_files)
+        if files is None: return None
+        result_key = self._result_key(key, files)
+        row = self.connection.execute("SELECT value FROM results WHERE key = ?", (result_key,)).fetchone()
+        if row is None: return None
+        with self.connection:
+            if files != known_files: self._store_manifest(key, files)
+            self.connection.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), result_key))
+        return to_str(json.loads(row[0]))
+
+    def set(self, key, paths, value):
+        """
+        Stores a result together with the manifest of touched files and evicts least recently used results.
+
+        Args:
+            key (list): result key, JSON serializable.
+            paths (list): paths of the files touched to extract the result.
+            value (dict): result.
+        """
+        files = self._files_signatures([p for p in paths if not p.startswith(self.cache_dir + os.sep)])
+        if files is None: return
+        try:
+            value = json.dumps(value)
+        except TypeError:
+            # results which are not JSON serializable are not cached
+            return
+        result_key, manifest_key = self._result_key(key, files), hash_object(key)
+        # manifests are accounted in the size of their results, as they are evicted together.
+        size = len(value) + len(json.dumps(files))
+        with self.connection:
+            self._update_size(size, result_key)
+            self._store_manifest(key, files)
+            self.connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                                    (result_key, manifest_key, value, size, time.time()))
+            self._evict()
+
+    def _store_manifest(self, key, files):
+        self.connection.execute("INSERT OR REPLACE INTO manifests VALUES (?, ?)", (hash_object(key), json.dumps(files)))
+
+    def _update_size(self, size, replaced_key=None):
+        """
+        Adds a given size to the total size, the size of the replaced result is subtracted.
+
+        Args:
+            size (int): size in bytes.
+            replaced_key (str): key of the result being replaced.
+        """
+        self.connection.execute("UPDATE meta SET value = value + ? - COALESCE((SELECT size FROM results WHERE key = ?),"
+                                " 0) WHERE name = 'size'", (size, replaced_key))
+
+    def _evict(self, batch_size=64):
+        """
+        Removes least recently used results and their manifests until the total size does not exceed `max_size`.
+
+        Args:
+            batch_size (int): number of results looked up at once.
+        """
+        while self.size > self.max_size:
+            rows = self.connection.execute("SELECT key, manifest, size FROM results ORDER BY accessed LIMIT ?",
+                                           (batch_size,)).fetchall()
+            if not rows: return
+            for key, manifest_key, size in rows:
+                if self.size <= self.max_size: break
+                self._update_size(-size)
+                self.connection.execute("DELETE FROM results WHERE key = ?", (key,))
+                self.connection.execute("DELETE FROM manifests WHERE key = ? AND NOT EXISTS "
+                                        "(SELECT 1 FROM results WHERE manifest = ?)", (manifest_key, manifest_key))
@@ -1,27 +1,107 @@
 import os
+import sys
+import mmap
+from collections import OrderedDict
+
+from express.parsers.utils import map_file
+from express.parsers.settings import FILE_CONTENT_CACHE_MAX_SIZE, MMAP_FILE_SIZE_THRESHOLD
 
 
 class BaseParser(object):
     """
     Base Parser class.
+
+    Note: file contents are cached per parser instance and keyed on path, modification time and size, hence each file
+    is read from disk at most once as long as it does not change. The total size of cached content is capped by
+    `file_content_cache_max_size` kwarg (bytes), least recently used files are evicted first. Files larger than
+    `mmap_file_size_threshold` kwarg (bytes) are memory-mapped instead, so that peak memory does not grow with them.
+    Memory maps are accounted in the cache size too and are closed when they are evicted or invalidated.
+
+    Parsers record the absolute paths of the input files they read in `read_files`, e.g. to key cached results on their
+    content, see `express.cache.PropertyCache`. The set is shared with the underlying format parsers.
     """
 
     def __init__(self, *args, **kwargs):
         self.args = args
         self.kwargs = kwargs
+        self.file_content_cache_max_size = self.kwargs.get("file_content_cache_max_size", FILE_CONTENT_CACHE_MAX_SIZE)
+        self.mmap_file_size_threshold = self.kwargs.get("mmap_file_size_threshold", MMAP_FILE_SIZE_THRESHOLD)
+        self._file_content_cache = OrderedDict()
+        self._file_content_cache_size = 0
+        self.read_files = set()
 
     def _get_file_content(self, file_path):
         """
         Returns the content of a given file.
 
+        Note: content of large files is returned as a read-only memory map, see `express.parsers.utils.map_file`.
+
         Args:
             file_path (str): file path.
 
         Returns:
-             str
+             str|mmap.mmap
         """
         content = ""
         if file_path and os.path.exists(file_path):
-            with open(file_path) as f:
-                content = f.read()
+            key = os.path.abspath(file_path)
+            self.read_files.add(key)
+            stat = os.stat(key)
+            signature = (stat.st_mtime, stat.st_size)
+            cached = self._file_content_cache.pop(key, None)
+            if cached and cached[0] == signature:
+                self._file_content_cache[key] = cached
+                return cached[1]
+            if cached: self._drop_cached_content(cached[1])
+            if stat.st_size >= self.mmap_file_size_threshold:
+                content = map_file(file_path)
+            else:
+                with open(file_path) as f:
+                    content = f.read()
+            self._cache_file_content(key, signature, content)
         return content
+
+    def _drop_cached_content(self, content):
+        """
+        Subtracts the size of a content removed from the cache and closes it if it is a memory map. Memory maps still
+        referenced elsewhere, e.g. by a caller which is parsing them, are left open and closed once they are released.
+
+        Args:
+            content (str|mmap.mmap): file content.
+        """
+        self._file_content_cache_size -= len(content)
+        # references: the caller's variable, the argument and the one of getrefcount itself.
+        if isinstance(content, mmap.mmap) and sys.getrefcount(content) <= 3: content.close()
+
+    def _cache_file_content(self, key, signature, content):
+        """
+        Stores a given file content in the cache and evicts the least recently used entries to respect the size cap.
+
+        Args:
+            key (str): absolute file path.
+            signature (tuple): file modification time and size.
+            content (str|mmap.mmap): file content.
+        """
+        size = len(content)
+        max_size = self.file_content_cache_max_size
+        if size > max_size: return
+        while self._file_content_cache and self._file_content_cache_size + size > max_size:
+            _, (_, evicted_content) = self._file_content_cache.popitem(last=False)
+            self._drop_cached_content(evicted_content)
+        self._file_content_cache[key] = (signature, content)
+        self._file_content_cache_size += size
+
+    def invalidate_file_content_cache(self, file_path=None):
+        """
+        Drops the cached content of a given file, or of all files if no path is given.
+
+        Args:
+            file_path (str): file path.
+        """
+        if file_path is None:
+            while self._file_content_cache:
+                _, (_, content) = self._file_content_cache.popitem()
+                self._drop_cached_content(content)
+            return
+        cached = self._file_content_cache.pop(os.path.abspath(file_path), None)
+        if cached: self._drop_cached_content(cached[1])
@@ -0,0 +1,197 @@
+import os
+import re
+import copy
+
+from express.parsers.apps.espresso.formats.txt import PATTERNS
+from express.parsers.apps.espresso.settings import CONVERGENCE_STREAM_CHUNK_SIZE, CONVERGENCE_STREAM_PREFIX_SIZE
+
+
+class EspressoConvergenceStream(object):
+    """
+    Incremental convergence parser for a growing espresso stdout file.
+
+    The stream remembers the byte offset it has consumed so far together with the partially parsed state, hence each
+    `update` call only reads and scans the bytes appended since the previous call. Appended bytes are read in chunks of
+    `chunk_size` bytes, hence memory does not grow with the file. Only complete lines are consumed, the trailing partial
+    line is left for the next update. Text that can still be part of an unfinished SCF or BFGS block is buffered until
+    the block is complete, everything else is discarded after it is parsed.
+
+    The file is identified by its inode and its first bytes. The state is reset if the file is replaced or overwritten,
+    e.g. when the calculation is restarted, even if the new file is as large as the consumed part of the old one.
+
+    Args:
+        txt_parser (express.parsers.apps.espresso.formats.txt.EspressoTXTParser): text parser to extract data with.
+        file_path (str): path to stdout file.
+        chunk_size (int): number of bytes read at once.
+    """
+
+    def __init__(self, txt_parser, file_path, chunk_size=CONVERGENCE_STREAM_CHUNK_SIZE):
+        self.txt_parser = txt_parser
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.ionic_block_pattern = PATTERNS.pattern("convergence_ionic_blocks", re.DOTALL | re.MULTILINE)
+        self.bfgs_block_pattern = PATTERNS.pattern("bfgs_block", re.DOTALL)
+        self.electronic_pattern = PATTERNS.pattern("convergence_electronic")
+        self.reset()
+
+    def reset(self):
+        """
+        Drops the parsed state, the file is parsed from its beginning on the next update.
+        """
+        self.offset = 0
+        self.inode = None
+        self.prefix = ""
+        self.header = ""
+        self.header_complete = False
+        self.basis_text = ""
+        self.ionic_buffer = ""
+        self.bfgs_buffer = ""
+        self.electronic_data = []
+        self.ionic_steps = []
+        self.lattice_convergence = []
+        self.basis_convergence = []
+
+    def update(self):
+        """
+        Parses the bytes appended to the file since the last update. The state is reset if the file was replaced,
+        overwritten or truncated, e.g. when the calculation is restarted.
+        """
+        if not os.path.exists(self.file_path): return self.reset()
+        self.txt_parser.read_files.add(os.path.abspath(self.file_path))
+        with open(self.file_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_ino != self.inode or stat.st_size < self.offset or f.read(len(self.prefix)) != self.prefix:
+                self.reset()
+                self.inode = stat.st_ino
+            f.seek(self.offset)
+            for text in self._read_lines(f):
+                if len(self.prefix) < CONVERGENCE_STREAM_PREFIX_SIZE:
+                    self.prefix += text[:CONVERGENCE_STREAM_PREFIX_SIZE - len(self.prefix)]
+                self.offset += len(text)
+                self._consume(text)
+
+    def _read_lines(self, file_):
+        """
+        Reads complete lines from the current position of a given file in chunks of about `chunk_size` bytes.
+
+        Args:
+            file_ (file): file opened in binary mode.
+
+        Returns:
+            generator: chunks of text ending with a newline.
+        """
+        chunk = ""
+        while True:
+            data = file_.read(self.chunk_size)
+            chunk += data
+            index = chunk.rfind("\n") + 1
+            if index:
+                yield chunk[:index]
+                chunk = chunk[index:]
+            if len(data) < self.chunk_size: return
+
+    def _consume(self, text):
+        """
+        Parses a given chunk of complete lines.
+
+        Args:
+            text (str): newly appended text.
+        """
+        self.electronic_data.extend(float(_) for _ in self.electronic_pattern.findall(text))
+        self._update_header(text)
+        self._update_basis_text(text)
+        self.ionic_buffer, blocks = self._match_blocks(self.ionic_block_pattern, "Self-consistent Calculation",
+                                                       self.ionic_buffer + text)
+        self.ionic_steps.extend(self.txt_parser._convergence_ionic_step(block) for block in blocks)
+        self.bfgs_buffer, blocks = self._match_blocks(self.bfgs_block_pattern, "new unit-cell volume",
+                                                      self.bfgs_buffer + text)
+        self.lattice_convergence.extend(self.txt_parser._extract_lattice(block) for block in blocks)
+        self.basis_convergence.extend(self.txt_parser._extract_basis(block) for block in blocks)
+
+    def _match_blocks(self, pattern, head, text):
+        """
+        Finds complete blocks in a given text and returns the text that may still hold an unfinished block, i.e. the
+        text starting at the first line containing the block head after the last complete block.
+
+        Args:
+            pattern (re.RegexObject): block pattern.
+            head (str): literal every block starts with.
+            text (str): buffered text followed by newly appended text.
+
+        Returns:
+            tuple: remaining text and the list of blocks.
+        """
+        end = 0
+        blocks = []
+        for match in pattern.finditer(text):
+            blocks.append(match.group(1) if pattern.groups else match.group(0))
+            end = match.end()
+        index = text.find(head, end)
+        if index < 0: return "", blocks
+        return text[text.rfind("\n", 0, index) + 1:], blocks
+
+    def _update_header(self, text):
+        """
+        Collects the text preceding the first self-consistent calculation, which holds the initial lattice.
+
+        Args:
+            text (str): newly appended text.
+        """
+        if self.header_complete: return
+        index = text.find("Self-consistent Calculation")
+        self.header_complete = index >= 0
+        self.header += text if index < 0 else text[:index]
+
+    def _update_basis_text(self, text):
+        """
+        Keeps the text following the last "positions (alat units)" line, which holds the initial basis.
+
+        Args:
+            text (str): newly appended text.
+        """
+        flag = PATTERNS.entry("basis_alat", 0)["start_flag"]
+        index = text.rfind(flag)
+        if index >= 0:
+            self.basis_text = text[text.rfind("\n", 0, index) + 1:]
+        elif self.basis_text:
+            self.basis_text += text
+        # keep the flag line followed by one line per atom only
+        number_of_atoms = self.txt_parser._general_output_parser(self.header, **PATTERNS.entry("number_of_atoms"))
+        if self.basis_text and number_of_atoms:
+            lines = self.basis_text.split("\n", number_of_atoms[0] + 1)
+            if len(lines) > number_of_atoms[0] + 1: self.basis_text = "\n".join(lines[:-1]) + "\n"
+
+    def _initial_structure_text(self):
+        """
+        Returns the text to extract the initial basis from: the header up to its first basis followed by the last one.
+
+        Returns:
+             str
+        """
+        flag = PATTERNS.entry("basis_alat", 0)["start_flag"]
+        index = self.header.find(flag)
+        return (self.header if index < 0 else self.header[:index]) + self.basis_text
+
+    def convergence_electronic(self):
+        """
+        Returns convergence electronic data parsed so far.
+
+        Reference:
+            func: express.parsers.apps.espresso.formats.txt.EspressoTXTParser.convergence_electronic
+        """
+        return self.txt_parser._group_convergence_electronic(self.electronic_data, self.ionic_steps)
+
+    def convergence_ionic(self):
+        """
+        Returns convergence ionic data parsed so far.
+
+        Reference:
+            func: express.parsers.apps.espresso.formats.txt.EspressoTXTParser.convergence_ionic
+        """
+        if not self.ionic_steps: return []
+        return self.txt_parser._add_convergence_ionic_structures(copy.deepcopy(self.ionic_steps),
+                                                                 copy.deepcopy(self.lattice_convergence),
+                                                                 copy.deepcopy(self.basis_convergence),
+                                                                 self.txt_parser.initial_basis(
+                                                                     self._initial_structure_text()),
+                                                                 self.txt_parser.initial_lattice_vectors(self.header))
@@ -3,10 +3,11 @@ import re
 import StringIO
 import numpy as np
 
-from express.parsers.utils import find_file
 from express.parsers.settings import Constant
 from express.parsers.apps.espresso import settings
 from express.parsers.formats.txt import BaseTXTParser
+from express.parsers.formats.patterns import RegexRegistry
+from express.parsers.formats.extractor import RegexTableExtractor
 
 ORBITS = {
     's': [''],
@@ -14,14 +15,18 @@ ORBITS = {
     'd': ['z2', 'zx', 'zy', 'x2-y2', 'xy']
 }
 
+PATTERNS = RegexRegistry(settings.REGEX)
+
+TOTAL_ENERGY_CONTRIBUTIONS_EXTRACTOR = RegexTableExtractor(settings.TOTAL_ENERGY_CONTRIBUTIONS)
+
 
 class EspressoTXTParser(BaseTXTParser):
     """
     Espresso text parser class.
     """
 
-    def __init__(self, work_dir):
-        super(EspressoTXTParser, self).__init__(work_dir)
+    def __init__(self, work_dir, work_dir_index=None, read_files=None):
+        super(EspressoTXTParser, self).__init__(work_dir, work_dir_index, read_files)
 
     def total_energy(self, text):
         """
@@ -64,7 +69,7 @@ class EspressoTXTParser(BaseTXTParser):
                 ]
             }
         """
-        dos_tot_file = find_file(settings.PDOS_TOT_FILE, self.work_dir)
+        dos_tot_file = self.work_dir_index.find(settings.PDOS_TOT_FILE)
         energy_levels, total_dos = self._total_dos(dos_tot_file)
         partial_dos_values, partial_dos_infos = self._partial_dos(len(energy_levels))
         return {
@@ -127,9 +132,10 @@ class EspressoTXTParser(BaseTXTParser):
                     ]
         """
         pdos = {}
-        for file_name in os.listdir(self.work_dir):
+        pdos_file_pattern = PATTERNS.pattern('pdos_file', 0)
+        for file_name in self.work_dir_index.list_dir():
             file_path = os.path.join(self.work_dir, file_name)
-            match = re.compile(settings.REGEX['pdos_file']['regex']).match(file_name)
+            match = pdos_file_pattern.match(file_name)
             if match:
                 atm_pdos = self._extract_partial_dos(file_path, len(ORBITS[match.group('orbit_symbol')]))
                 atm_pdos = atm_pdos.T if atm_pdos.shape[0] > 1 else atm_pdos
@@ -183,8 +189,9 @@ class EspressoTXTParser(BaseTXTParser):
                     -99.939  0.000E+00  0.000E+00
                     -99.889  0.000E+00  0.000E+00
         """
+        self.read_files.add(os.path.abspath(dos_file))
         with open(dos_file) as f:
-            return '\n'.join(re.findall('^ *[-+]?\d*\.\d+(?:[eE][-+]?\d+)?.*$', f.read(), re.MULTILINE))
+            return '\n'.join(PATTERNS.pattern("dos_data_line", re.MULTILINE).findall(f.read()))
 
     def convergence_electronic(self, text):
         """
@@ -197,8 +204,22 @@ class EspressoTXTParser(BaseTXTParser):
              list[float]
         """
         data = self._general_output_parser(text, **settings.REGEX["convergence_electronic"])
+        return self._group_convergence_electronic(data, self.convergence_ionic(text))
+
+    def _group_convergence_electronic(self, data, convergence_ionic):
+        """
+        Groups electronic convergence data by ionic step. Data that is not part of a completed ionic step is appended
+        as the last step.
+
+        Args:
+            data (list): estimated scf accuracies in Ry.
+            convergence_ionic (list): convergence ionic data, see `convergence_ionic`.
+
+        Returns:
+             list[float]
+        """
         # The next 3 lines are necessary to have realtime data
-        ionic_data = [_["electronic"]["data"] for _ in self.convergence_ionic(text)]
+        ionic_data = [_["electronic"]["data"] for _ in convergence_ionic]
         last_step_data = data[sum([len(_) for _ in ionic_data]): len(data)]
         if last_step_data: ionic_data.append(last_step_data)
         return [(np.array(_) * Constant.RYDBERG).tolist() for _ in ionic_data]
@@ -213,24 +234,51 @@ class EspressoTXTParser(BaseTXTParser):
         Returns:
              list[dict]
         """
-        data = []
-        blocks = re.findall(settings.REGEX["convergence_ionic_blocks"]["regex"], text, re.DOTALL | re.MULTILINE)
-        for idx, block in enumerate(blocks):
-            energies = self._general_output_parser(block, **settings.REGEX["convergence_ionic_energies"])
-            energies = (np.array(energies) * Constant.RYDBERG).tolist()
-            data.append({
-                "energy": energies[-1],
-                "electronic": {
-                    "units": "eV",
-                    "data": self._general_output_parser(block, **settings.REGEX["convergence_electronic"])
-                },
-            })
-
+        blocks = PATTERNS.pattern("convergence_ionic_blocks", re.DOTALL | re.MULTILINE).findall(text)
+        data = [self._convergence_ionic_step(block) for block in blocks]
         if not data: return []
+        return self._add_convergence_ionic_structures(data, self._lattice_convergence(text),
+                                                      self._basis_convergence(text), self.initial_basis(text),
+                                                      self.initial_lattice_vectors(text))
+
+    def _convergence_ionic_step(self, block):
+        """
+        Extracts convergence data of a single ionic step.
+
+        Args:
+            block (str): text of a converged self-consistent calculation.
+
+        Returns:
+             dict
+        """
+        energies = self._general_output_parser(block, **settings.REGEX["convergence_ionic_energies"])
+        energies = (np.array(energies) * Constant.RYDBERG).tolist()
+        return {
+            "energy": energies[-1],
+            "electronic": {
+                "units": "eV",
+                "data": self._general_output_parser(block, **settings.REGEX["convergence_electronic"])
+            },
+        }
+
+    def _add_convergence_ionic_structures(self, data, lattice_convergence, basis_convergence, initial_basis,
+                                          initial_lattice):
+        """
+        Adds the structure of each ionic step to convergence ionic data.
+
+        Args:
+            data (list): convergence data of ionic steps, see `_convergence_ionic_step`.
+            lattice_convergence (list): lattices computed in each BFGS step.
+            basis_convergence (list): bases computed in each BFGS step.
+            initial_basis (dict): initial basis.
+            initial_lattice (dict): initial lattice.
 
+        Returns:
+             list[dict]
+        """
         # last structure is used for the next ionic step, hence [:max(0, len(data) - 1)]
-        lattice_convergence = self._lattice_convergence(text)[:max(0, len(data) - 1)]
-        basis_convergence = self._basis_convergence(text)[:max(0, len(data) - 1)]
+        lattice_convergence = lattice_convergence[:max(0, len(data) - 1)]
+        basis_convergence = basis_convergence[:max(0, len(data) - 1)]
         for idx, structure in enumerate(zip(lattice_convergence, basis_convergence)):
             structure[1]["units"] = "angstrom"
             lattice_matrix = np.array([structure[0]["vectors"][key] for key in ["a", "b", "c"]]).reshape((3, 3))
@@ -246,8 +294,8 @@ class EspressoTXTParser(BaseTXTParser):
         # inject initial structure
         data[0].update({
             "structure": {
-                "basis": self.initial_basis(text),
-                "lattice": self.initial_lattice_vectors(text)
+                "basis": initial_basis,
+                "lattice": initial_lattice
             }
         })
 
@@ -310,7 +358,7 @@ class EspressoTXTParser(BaseTXTParser):
         lattice_alat = self._general_output_parser(text, **settings.REGEX["lattice_parameter_alat"])[0]
         number_of_atoms = self._general_output_parser(text, **settings.REGEX["number_of_atoms"])[0]
         basis = {"units": "angstrom", "elements": [], "coordinates": []}
-        matches = self._general_output_parser(text, **settings.REGEX["basis_alat"](number_of_atoms))
+        matches = self._general_output_parser(text, **PATTERNS.entry("basis_alat", number_of_atoms))
         for idx, match in enumerate(matches):
             basis["elements"].append({"id": idx, "value": match[0]})
             coordinate = [float(match[1]), float(match[2]), float(match[3])]
@@ -364,8 +412,7 @@ class EspressoTXTParser(BaseTXTParser):
             list: list of information extracted using the provided function
         """
         results = []
-        bfgs_block_pattern = re.compile(settings.REGEX["bfgs_block"]["regex"], re.DOTALL)
-        bfgs_blocks = bfgs_block_pattern.findall(text)
+        bfgs_blocks = PATTERNS.pattern("bfgs_block", re.DOTALL).findall(text)
         for block in bfgs_blocks:
             results.append(func(block))
         return results
@@ -390,8 +437,8 @@ class EspressoTXTParser(BaseTXTParser):
                 }
             }
         """
-        text = text[text.find('Begin final coordinates'):] if last_value else text
-        match = re.search(settings.REGEX[regex]["regex"], text)
+        start_index = self._final_coordinates_index(text) if last_value else 0
+        match = PATTERNS.pattern(regex, 0).search(text, start_index)
         if match:
             lattice = [float(_) for _ in match.groups(1)]
             return {
@@ -430,6 +477,20 @@ class EspressoTXTParser(BaseTXTParser):
         """
         return self._extract_data_from_bfgs_blocks(text, self._extract_basis)
 
+    def _final_coordinates_index(self, text):
+        """
+        Returns the index of the final coordinates block, so that it is searched in place instead of slicing the text.
+        The last character is returned if there is no such block, as `text[text.find(...):]` did.
+
+        Args:
+            text (str|mmap.mmap): text to search.
+
+        Returns:
+            int
+        """
+        index = text.find("Begin final coordinates")
+        return index if index >= 0 else max(len(text) - 1, 0)
+
     def _extract_basis(self, text, last_value=False):
         """
         Extracts basis data.
@@ -447,13 +508,13 @@ class EspressoTXTParser(BaseTXTParser):
                 'coordinates': [{'id': 1, 'value': [0.0, 0.0, 0.0]}, {'id': 2, 'value': [0.0, 0.0, 0.0]}]
              }
         """
-        text = text[text.find("Begin final coordinates"):] if last_value else text
+        start_index = self._final_coordinates_index(text) if last_value else 0
         basis = {
             "units": "crystal",
             "elements": [],
             "coordinates": []
         }
-        matches = re.findall(settings.REGEX["ion_position"]["regex"], text)
+        matches = PATTERNS.pattern("ion_position", 0).findall(text, start_index)
         if matches:
             for idx, match in enumerate(matches):
                 basis["elements"].append({
@@ -524,8 +585,7 @@ class EspressoTXTParser(BaseTXTParser):
             dict
         """
         energy_contributions = {}
-        for contribution in settings.TOTAL_ENERGY_CONTRIBUTIONS:
-            value = self._general_output_parser(text, **settings.TOTAL_ENERGY_CONTRIBUTIONS[contribution])
+        for contribution, value in TOTAL_ENERGY_CONTRIBUTIONS_EXTRACTOR.extract(text).items():
             if value is not None:
                 energy_contributions.update({contribution: {
                     'name': contribution,
@@ -556,7 +616,7 @@ class EspressoTXTParser(BaseTXTParser):
                 'total': [0.0000E+00, 2.5386E-07, 1.0154E-06, 2.2847E-06, ....]
             }
         """
-        phonon_dos_tot_file = find_file(settings.PHONON_DOS_FILE, self.work_dir)
+        phonon_dos_tot_file = self.work_dir_index.find(settings.PHONON_DOS_FILE)
         frequencies, total_phonon_dos = self._total_dos(phonon_dos_tot_file)
         return {
             'frequency': frequencies.tolist(),
@@ -577,7 +637,7 @@ class EspressoTXTParser(BaseTXTParser):
                 ['29.3716', '30.0630', '70.4699', '568.0790', '569.7664', '569.9710'], ....]
             }
         """
-        modes_file = find_file(settings.PHONON_MODES_FILE, self.work_dir)
+        modes_file = self.work_dir_index.find(settings.PHONON_MODES_FILE)
         qpoints, frequencies = self.phonon_frequencies(modes_file)
         return {
             'qpoints': qpoints.tolist(),
@@ -631,10 +691,11 @@ class EspressoTXTParser(BaseTXTParser):
                 [4.5469E+02, 4.5469E+02]
             ])
         """
+        self.read_files.add(os.path.abspath(modes_file))
         with open(modes_file, 'r') as f:
             text = f.read()
-        qpoints = np.array(re.compile(settings.REGEX["qpoints"]["regex"]).findall(text), dtype=np.float)
-        frequencies = np.array(re.compile(settings.REGEX["phonon_frequencies"]["regex"]).findall(text), dtype=np.float)
+        qpoints = np.array(PATTERNS.pattern("qpoints", 0).findall(text), dtype=np.float)
+        frequencies = np.array(PATTERNS.pattern("phonon_frequencies", 0).findall(text), dtype=np.float)
         frequencies = np.transpose(frequencies.reshape(qpoints.shape[0], frequencies.shape[0] / qpoints.shape[0]))
         return qpoints, frequencies
 
@@ -722,6 +783,30 @@ class EspressoTXTParser(BaseTXTParser):
         data = self._general_output_parser(text, **settings.REGEX["charge_density_profile"])
         return [[e[i] for e in data] for i in range(2)]
 
+    def run_metadata(self, header):
+        """
+        Extracts the run metadata from the header of stdout file.
+
+        Args:
+            header (str): the top of stdout file, see `settings.STDOUT_HEADER_SIZE`.
+
+        Returns:
+            dict
+
+        Example:
+            {
+                'code': 'pwscf',
+                'version': '6.3',
+                'is_sternheimer_gw': False
+            }
+        """
+        match = PATTERNS.pattern("program").search(header)
+        return {
+            'code': match.group("code").lower() if match else None,
+            'version': match.group("version") if match else None,
+            'is_sternheimer_gw': settings.STERNHEIMER_GW_TITLE in header
+        }
+
     def eigenvalues_at_kpoints_from_sternheimer_gw_stdout(self, text, inverse_reciprocal_lattice_vectors):
         """
         Extracts eigenvalues for all kpoints from Sternheimer GW stdout file.
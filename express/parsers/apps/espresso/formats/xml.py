@@ -1,23 +1,49 @@
 from __future__ import absolute_import
 
 import os
-import re
+import copy
 import string
 import numpy as np
 import xml.etree.ElementTree as ET
+from multiprocessing.pool import ThreadPool
 
 from express.parsers.settings import Constant
 from express.parsers.settings import GENERAL_REGEX
 from express.parsers.formats.xml import BaseXMLParser
+from express.parsers.eigenvalues import EigenvalueData
+from express.parsers.apps.espresso.settings import EIGENVALUE_FILES_LOADING_WORKERS
+from express.parsers.formats.patterns import compile_pattern
+
+INT_NUMBER_PATTERN = compile_pattern(GENERAL_REGEX.int_number)
+DOUBLE_NUMBER_PATTERN = compile_pattern(GENERAL_REGEX.double_number)
 
 TAG_VALUE_CAST_MAP = {
     'character': lambda v, s, c: v,
-    'integer': lambda v, s, c: np.array([int(_) for _ in re.findall(GENERAL_REGEX.int_number, v)]).reshape([s / c, c]),
-    'real': lambda v, s, c: np.array([float(_) for _ in re.findall(GENERAL_REGEX.double_number, v)]).reshape([s / c, c]),
+    'integer': lambda v, s, c: np.array([int(_) for _ in INT_NUMBER_PATTERN.findall(v)]).reshape([s / c, c]),
+    'real': lambda v, s, c: np.array([float(_) for _ in DOUBLE_NUMBER_PATTERN.findall(v)]).reshape([s / c, c]),
     'logical': lambda v, s, c: False if 'F' in v else True
 
 }
 
+# thread pools loading eigenvalue files keyed on process id and number of threads, see `get_loading_pool`.
+LOADING_POOLS = {}
+
+
+def get_loading_pool(workers):
+    """
+    Returns the thread pool with a given number of threads. Pools are created once per process and reused by all
+    parsers, pools inherited from a parent process are not used as their threads do not exist after fork.
+
+    Args:
+        workers (int): number of threads.
+
+    Returns:
+        multiprocessing.pool.ThreadPool
+    """
+    key = (os.getpid(), workers)
+    if key not in LOADING_POOLS: LOADING_POOLS[key] = ThreadPool(workers)
+    return LOADING_POOLS[key]
+
 
 class EspressoXMLParser(BaseXMLParser):
     """
@@ -25,10 +51,16 @@ class EspressoXMLParser(BaseXMLParser):
 
     Args:
         xml_file_path (str): path to the xml file.
+        eigenvalue_files_loading_workers (int): number of threads used to load per kpoint eigenvalue files.
+        read_files (set): absolute paths of the files read by the parser, shared with the application parser.
     """
 
-    def __init__(self, xml_file_path):
-        super(EspressoXMLParser, self).__init__(xml_file_path)
+    def __init__(self, xml_file_path, eigenvalue_files_loading_workers=EIGENVALUE_FILES_LOADING_WORKERS,
+                 read_files=None):
+        super(EspressoXMLParser, self).__init__(xml_file_path, read_files)
+        self.eigenvalue_files_loading_workers = eigenvalue_files_loading_workers
+        self._cell = {}
+        self._eigenvalue_data = None
 
     def _get_xml_tag_value(self, tag):
         """
@@ -69,7 +101,7 @@ class EspressoXMLParser(BaseXMLParser):
 
     def final_lattice_vectors(self, reciprocal=False):
         """
-        Extracts lattice.
+        Extracts lattice. Lattices are extracted once per parser.
 
         Args:
             reciprocal (bool): whether to extract reciprocal lattice.
@@ -87,6 +119,20 @@ class EspressoXMLParser(BaseXMLParser):
                 }
              }
         """
+        key = "reciprocal" if reciprocal else "direct"
+        if key not in self._cell: self._cell[key] = self._extract_lattice_vectors(reciprocal)
+        return copy.deepcopy(self._cell[key])
+
+    def _extract_lattice_vectors(self, reciprocal=False):
+        """
+        Extracts lattice from CELL tag.
+
+        Args:
+            reciprocal (bool): whether to extract reciprocal lattice.
+
+        Returns:
+            dict
+        """
         vector_tag = 'a'
         lattice_tag = 'DIRECT_LATTICE_VECTORS'
         units_tag = 'UNITS_FOR_DIRECT_LATTICE_VECTORS'
@@ -110,11 +156,14 @@ class EspressoXMLParser(BaseXMLParser):
 
     def get_inverse_reciprocal_lattice_vectors(self):
         """
-        Returns inverse reciprocal lattice vectors to convert cartesian (2pi/a) point to crystal.
+        Returns inverse reciprocal lattice vectors to convert cartesian (2pi/a) point to crystal. The inverse is
+        computed once per parser.
         """
-        reciprocal_lattice = self.final_lattice_vectors(reciprocal=True)
-        lattice_array = [reciprocal_lattice['vectors'][i] for i in ['a', 'b', 'c']]
-        return np.linalg.inv(np.array(lattice_array))
+        if "inverse" not in self._cell:
+            reciprocal_lattice = self.final_lattice_vectors(reciprocal=True)
+            lattice_array = [reciprocal_lattice['vectors'][i] for i in ['a', 'b', 'c']]
+            self._cell["inverse"] = np.linalg.inv(np.array(lattice_array))
+        return self._cell["inverse"].copy()
 
     def eigenvalues_at_kpoints(self):
         """
@@ -139,25 +188,94 @@ class EspressoXMLParser(BaseXMLParser):
                 ...
             ]
         """
-        eigenvalues_at_kpoints = []
-        for eigenvalue_tag in self.root.find("EIGENVALUES"):
-            cartesianKPoint = self._get_xml_tag_value(eigenvalue_tag.find("K-POINT_COORDS"))[0]
-            crystalKPoint = np.dot(cartesianKPoint, self.get_inverse_reciprocal_lattice_vectors())
-            eigenvalues_at_kpoint = {
-                "kpoint": crystalKPoint.tolist(),
-                "weight": self._get_xml_tag_value(eigenvalue_tag.find("WEIGHT")),
-                "eigenvalues": []
-            }
-            for datafile_tag in [t for t in eigenvalue_tag.iter() if t.tag.startswith('DATAFILE')]:
-                eigenval_file = os.path.join(self.xml_dir_name, datafile_tag.attrib.get("iotk_link"))
-                energies, occupations = self._parse_eigenvalue_file(eigenval_file)
-                eigenvalues_at_kpoint['eigenvalues'].append({
-                    'energies': (np.array(energies) * Constant.HARTREE).tolist(),
-                    'occupations': occupations,
-                    'spin': 0.5 if datafile_tag.tag in ['DATAFILE', 'DATAFILE.1'] else -0.5
-                })
-            eigenvalues_at_kpoints.append(eigenvalues_at_kpoint)
-        return eigenvalues_at_kpoints
+        return self.eigenvalue_data().to_list()
+
+    def eigenvalue_data(self):
+        """
+        Returns eigenvalues for all kpoints in columnar form. Eigenvalues are parsed once, hence the returned data must
+        not be modified.
+
+        Returns:
+             EigenvalueData
+        """
+        if self._eigenvalue_data is None: self._eigenvalue_data = self._parse_eigenvalue_data()
+        return self._eigenvalue_data
+
+    def _parse_eigenvalue_data(self):
+        """
+        Parses eigenvalues for all kpoints into columnar form.
+
+        Returns:
+             EigenvalueData
+        """
+        eigenvalue_tags = list(self.root.find("EIGENVALUES"))
+        weights = [self._get_xml_tag_value(t.find("WEIGHT")) for t in eigenvalue_tags]
+        datafile_tags = [[t for t in _.iter() if t.tag.startswith('DATAFILE')] for _ in eigenvalue_tags]
+        spin_indices = [[0 if t.tag in ['DATAFILE', 'DATAFILE.1'] else 1 for t in _] for _ in datafile_tags]
+        nspins = max([len(_) for _ in datafile_tags] or [1])
+
+        eigenval_files = [os.path.join(self.xml_dir_name, t.attrib.get("iotk_link")) for _ in datafile_tags for t in _]
+        eigenvalues = iter(self._parse_eigenvalue_files(eigenval_files))
+        energies = [[None] * len(eigenvalue_tags) for _ in range(nspins)]
+        occupations = [[None] * len(eigenvalue_tags) for _ in range(nspins)]
+        for kp_id, kpoint_spin_indices in enumerate(spin_indices):
+            for spin_index in kpoint_spin_indices:
+                energies[spin_index][kp_id], occupations[spin_index][kp_id] = next(eigenvalues)
+
+        self._check_eigenvalue_shapes(energies, occupations)
+        return EigenvalueData(self._crystal_kpoints(eigenvalue_tags), weights,
+                              np.array(energies) * Constant.HARTREE, occupations)
+
+    def _check_eigenvalue_shapes(self, energies, occupations):
+        """
+        Checks that eigenvalues and occupations are given for all kpoints of each spin and have the same size across
+        kpoints and spins, so that they are stacked into rectangular arrays.
+
+        Args:
+            energies (list): energies with (ns, nk, nb) shape.
+            occupations (list): occupations with (ns, nk, nb) shape.
+
+        Raises:
+            ValueError: if a spin channel is missing for a kpoint or sizes differ.
+        """
+        for spin_index, spin_energies in enumerate(energies):
+            if None in spin_energies:
+                message = "eigenvalues of spin {0} are missing for kpoint {1}"
+                raise ValueError(message.format(spin_index, spin_energies.index(None)))
+        shapes = set((len(e), len(o)) for spin in zip(energies, occupations) for e, o in zip(*spin))
+        if len(shapes) > 1: raise ValueError("eigenvalues differ in size across kpoints: {0}".format(sorted(shapes)))
+
+    def _crystal_kpoints(self, eigenvalue_tags):
+        """
+        Reads cartesian (2pi/a) coordinates of all kpoints into one array and converts them to crystal coordinates with
+        a single matrix product.
+
+        Args:
+            eigenvalue_tags (list): K-POINT tags of EIGENVALUES tag.
+
+        Returns:
+            ndarray: crystal coordinates with (kpoints, 3) shape.
+        """
+        coordinates = " ".join(t.find("K-POINT_COORDS").text for t in eigenvalue_tags)
+        cartesian_kpoints = np.array([float(_) for _ in DOUBLE_NUMBER_PATTERN.findall(coordinates)]).reshape((-1, 3))
+        return np.dot(cartesian_kpoints, self.get_inverse_reciprocal_lattice_vectors())
+
+    def _parse_eigenvalue_files(self, eigenval_xml_paths):
+        """
+        Extracts eigenvalues from given files. Files are loaded concurrently by `eigenvalue_files_loading_workers`
+        threads of a shared pool (see `get_loading_pool`) as loading is dominated by I/O on network file systems,
+        results are returned in the given order.
+
+        Args:
+            eigenval_xml_paths (list): paths to eigenvalue xml files.
+
+        Returns:
+            list: list of (energies, occupations) tuples.
+        """
+        if min(self.eigenvalue_files_loading_workers, len(eigenval_xml_paths)) <= 1:
+            return [self._parse_eigenvalue_file(path) for path in eigenval_xml_paths]
+        pool = get_loading_pool(self.eigenvalue_files_loading_workers)
+        return pool.map(self._parse_eigenvalue_file, eigenval_xml_paths)
 
     def _parse_eigenvalue_file(self, eigenval_xml_path):
         """
@@ -169,9 +287,10 @@ class EspressoXMLParser(BaseXMLParser):
         Returns:
             tuple: (energies, occupations)
         """
+        self.read_files.add(os.path.abspath(eigenval_xml_path))
         root = ET.parse(eigenval_xml_path).getroot()
-        energies = [float(_) for _ in re.findall(GENERAL_REGEX.double_number, root.find('EIGENVALUES').text)]
-        occupations = [float(_) for _ in re.findall(GENERAL_REGEX.double_number, root.find('OCCUPATIONS').text)]
+        energies = [float(_) for _ in DOUBLE_NUMBER_PATTERN.findall(root.find('EIGENVALUES').text)]
+        occupations = [float(_) for _ in DOUBLE_NUMBER_PATTERN.findall(root.find('OCCUPATIONS').text)]
         return energies, occupations
 
     def final_basis(self):
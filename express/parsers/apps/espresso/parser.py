@@ -1,8 +1,8 @@
 import os
-import numpy as np
 
 from express.parsers import BaseParser
-from express.parsers.utils import find_file
+from express.parsers.utils import WorkDirIndex
+from express.parsers.eigenvalues import EigenvalueData
 from express.parsers.apps.espresso import settings
 from express.parsers.mixins.ionic import IonicDataMixin
 from express.parsers.apps.espresso.settings import NEB_DAT_FILE
@@ -10,19 +10,45 @@ from express.parsers.mixins.reciprocal import ReciprocalDataMixin
 from express.parsers.mixins.electronic import ElectronicDataMixin
 from express.parsers.apps.espresso.formats.txt import EspressoTXTParser
 from express.parsers.apps.espresso.formats.xml import EspressoXMLParser
+from express.parsers.apps.espresso.formats.stream import EspressoConvergenceStream
 
 
 class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalDataMixin):
     """
     Espresso parser class.
+
+    Note: text and XML parsers and the convergence stream are constructed on first access, hence properties extracted
+    from stdout only do not look up and parse the XML file.
     """
 
     def __init__(self, *args, **kwargs):
         super(EspressoParser, self).__init__(*args, **kwargs)
         self.work_dir = self.kwargs["work_dir"]
         self.stdout_file = self.kwargs["stdout_file"]
-        self.txt_parser = EspressoTXTParser(self.work_dir)
-        self.xml_parser = EspressoXMLParser(self.find_xml_file())
+        self.work_dir_index = WorkDirIndex(self.work_dir)
+        self._txt_parser = None
+        self._xml_parser = None
+        self._convergence_stream = None
+        self._run_metadata = None
+
+    @property
+    def txt_parser(self):
+        if self._txt_parser is None:
+            self._txt_parser = EspressoTXTParser(self.work_dir, self.work_dir_index, self.read_files)
+        return self._txt_parser
+
+    @property
+    def xml_parser(self):
+        if self._xml_parser is None:
+            workers = self.kwargs.get("eigenvalue_files_loading_workers", settings.EIGENVALUE_FILES_LOADING_WORKERS)
+            self._xml_parser = EspressoXMLParser(self.find_xml_file(), workers, self.read_files)
+        return self._xml_parser
+
+    @property
+    def convergence_stream(self):
+        if self._convergence_stream is None:
+            self._convergence_stream = EspressoConvergenceStream(self.txt_parser, self.stdout_file)
+        return self._convergence_stream
 
     def find_xml_file(self):
         """
@@ -33,12 +59,10 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         Returns:
             str
         """
-        is_sternheimer_gw = self._is_sternheimer_gw_calculation()
-        for root, dirs, files in os.walk(self.work_dir, followlinks=True):
-            for file_ in [f for f in files if settings.XML_DATA_FILE == f]:
-                file_path = os.path.join(root, file_)
-                if not is_sternheimer_gw or (is_sternheimer_gw and settings.STERNHEIMER_GW0_DIR_PATTERN in file_path):
-                    return file_path
+        is_sternheimer_gw = self.run_metadata()["is_sternheimer_gw"]
+        for file_path in self.work_dir_index.find_all(settings.XML_DATA_FILE, exact=True):
+            if not is_sternheimer_gw or (is_sternheimer_gw and settings.STERNHEIMER_GW0_DIR_PATTERN in file_path):
+                return file_path
 
     def total_energy(self):
         """
@@ -67,23 +91,27 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         """
         return self.xml_parser.nspins()
 
-    def _is_sternheimer_gw_calculation(self):
+    def run_metadata(self):
         """
-        Checks whether this is a Sternheimer GW calculation.
+        Returns the run metadata (code, version, Sternheimer GW) probed from the top of stdout file.
 
         The calculation is considered Sternheimer GW if "SternheimerGW" is written on top of the stdout file.
 
-        NOTE: DO NOT READ THE WHOLE FILE INTO MEMORY AS IT IS BIG.
+        NOTE: only the first `settings.STDOUT_HEADER_SIZE` bytes are read as the file is big. The metadata is probed
+        once per parser as soon as the stdout file is not empty.
 
-        Returns:
-             bool
+        Reference:
+            func: express.parsers.apps.espresso.formats.txt.EspressoTXTParser.run_metadata
         """
+        if self._run_metadata is not None: return self._run_metadata
+        header = ""
         if os.path.exists(self.stdout_file):
+            self.read_files.add(os.path.abspath(self.stdout_file))
             with open(self.stdout_file, "r") as f:
-                for index, line in enumerate(f):
-                    if index > 50: return False
-                    if settings.STERNHEIMER_GW_TITLE in line:
-                        return True
+                header = f.read(settings.STDOUT_HEADER_SIZE)
+        metadata = self.txt_parser.run_metadata(header)
+        if header: self._run_metadata = metadata
+        return metadata
 
     def eigenvalues_at_kpoints(self):
         """
@@ -94,7 +122,7 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         Reference:
             func: express.parsers.mixins.electronic.ElectronicDataMixin.eigenvalues_at_kpoints
         """
-        if self._is_sternheimer_gw_calculation():
+        if self.run_metadata()["is_sternheimer_gw"]:
             text = self._get_file_content(self.stdout_file)
             inverse_reciprocal_lattice_vectors = self.xml_parser.get_inverse_reciprocal_lattice_vectors()
             return self.txt_parser.eigenvalues_at_kpoints_from_sternheimer_gw_stdout(text,
@@ -102,6 +130,19 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         else:
             return self.xml_parser.eigenvalues_at_kpoints()
 
+    def eigenvalue_data(self):
+        """
+        Returns eigenvalues for all kpoints in columnar form.
+
+        NOTE: eigenvalues are extracted from Sternheimer GW stdout file if this is a Sternheimer GW calculation.
+
+        Reference:
+            func: express.parsers.mixins.electronic.ElectronicDataMixin.eigenvalue_data
+        """
+        if self.run_metadata()["is_sternheimer_gw"]:
+            return EigenvalueData.from_list(self.eigenvalues_at_kpoints())
+        return self.xml_parser.eigenvalue_data()
+
     def ibz_k_points(self):
         """
         Returns ibz_k_points.
@@ -113,7 +154,7 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         Reference:
             func: express.parsers.mixins.reciprocal.ReciprocalDataMixin.ibz_k_points
         """
-        return np.array([eigenvalueData["kpoint"] for eigenvalueData in self.eigenvalues_at_kpoints()])
+        return self.eigenvalue_data().kpoints
 
     def dos(self):
         """
@@ -166,8 +207,12 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
 
         Reference:
             func: express.parsers.mixins.electronic.ElectronicDataMixin.convergence_electronic
+
+        Note: the stdout file is parsed incrementally, hence only the content appended since the last call is parsed
+        when the calculation is still running. See `EspressoConvergenceStream`.
         """
-        return self.txt_parser.convergence_electronic(self._get_file_content(self.stdout_file))
+        self.convergence_stream.update()
+        return self.convergence_stream.convergence_electronic()
 
     def convergence_ionic(self):
         """
@@ -175,8 +220,11 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
 
         Reference:
             func: express.parsers.mixins.ionic.IonicDataMixin.convergence_ionic
+
+        Note: the stdout file is parsed incrementally, see `convergence_electronic`.
         """
-        return self.txt_parser.convergence_ionic(self._get_file_content(self.stdout_file))
+        self.convergence_stream.update()
+        return self.convergence_stream.convergence_ionic()
 
     def stress_tensor(self):
         """
@@ -271,7 +319,7 @@ class EspressoParser(BaseParser, IonicDataMixin, ElectronicDataMixin, Reciprocal
         return self.txt_parser.reaction_energies(self._get_file_content(neb_dat_file))
 
     def _get_esm_file(self):
-        return find_file(".esm1", self.work_dir)
+        return self.work_dir_index.find(".esm1")
 
     def potential_profile(self):
         return self.txt_parser.potential_profile(self._get_file_content(self._get_esm_file()))
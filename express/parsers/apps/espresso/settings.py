@@ -12,9 +12,25 @@ DOUBLE_REGEX = GENERAL_REGEX.double_number
 STERNHEIMER_GW0_DIR_PATTERN = "/_gw0/"
 STERNHEIMER_GW_TITLE = "SternheimerGW"
 
+# number of bytes read from the top of stdout file to probe the run metadata, see `EspressoParser.run_metadata`
+STDOUT_HEADER_SIZE = 8 * 1024
+
+# number of bytes read at once by the convergence stream, see `EspressoConvergenceStream`
+CONVERGENCE_STREAM_CHUNK_SIZE = 16 * 1024 ** 2
+
+# number of bytes at the top of stdout file compared by the convergence stream to detect overwritten files
+CONVERGENCE_STREAM_PREFIX_SIZE = 1024
+
+# number of threads used to load per kpoint eigenvalue files, 1 to load them sequentially
+EIGENVALUE_FILES_LOADING_WORKERS = 8
+
 REGEX = {
+    "program": {
+        "regex": r"Program\s+(?P<code>\S+)\s+v\.(?P<version>\S+)\s+starts"
+    },
     "total_energy": {
         "regex": COMMON_REGEX.format("total energy"),
+        "anchor": "total energy",
         "start_flag": "!",
         "occurrences": -1,
         "output_type": "float"
@@ -23,8 +39,12 @@ REGEX = {
         "regex": r'.*\.pdos_atm#(?P<atom_num>\d+)\((?P<atom_name>\w+)\)'
                  r'_wfc#(?P<orbit_num>\d+)\((?P<orbit_symbol>\w)\)',
     },
+    "dos_data_line": {
+        "regex": r"^ *{0}.*$".format(DOUBLE_REGEX)
+    },
     "convergence_electronic": {
         "regex": r"estimated scf accuracy\s+<\s+({0})".format(DOUBLE_REGEX),
+        "anchor": "estimated scf accuracy",
         "output_type": "float",
     },
     "convergence_ionic_blocks": {
@@ -32,6 +52,7 @@ REGEX = {
     },
     "convergence_ionic_energies": {
         "regex": r"total energy\s+=\s+({0})".format(DOUBLE_REGEX),
+        "anchor": "total energy",
         "output_type": "float",
     },
     "bfgs_block": {
@@ -55,10 +76,12 @@ REGEX = {
     },
     "lattice_parameter_alat": {
         "regex": r"lattice parameter \(alat\)\s+=\s+({0})\s+".format(DOUBLE_REGEX),
+        "anchor": "lattice parameter",
         "output_type": "float",
     },
     "number_of_atoms": {
         "regex": r"number of atoms/cell\s+=\s+(\d+)",
+        "anchor": "number of atoms/cell",
         "output_type": "int",
     },
     "basis_alat": lambda number_of_atoms: {
@@ -80,18 +103,21 @@ REGEX = {
     },
     "pressure": {
         "regex": r"\s*total\s+stress\s+\(Ry/bohr\*\*3\)\s*\(kbar\)\s*P=\s*({0})".format(DOUBLE_REGEX),
+        "anchor": "stress",
         "start_flag": "Forces acting on atoms",
         "occurrences": -1,
         "output_type": "float"
     },
     "total_force": {
         "regex": COMMON_REGEX.format("Total force"),
+        "anchor": "Total force",
         "start_flag": "Total force",
         "occurrences": -1,
         "output_type": "float"
     },
     "forces_on_atoms": {
         "regex": r"^\s*atom\s+\d+\s+type\s+\d+\s+force\s+=\s+({0})\s+({0})\s+({0})".format(DOUBLE_REGEX),
+        "anchor": "force",
         "start_flag": "Forces acting on atoms",
         "occurrences": 0,
         "output_type": "float",
@@ -99,6 +125,7 @@ REGEX = {
     },
     "zero_point_energy": {
         "regex": r"freq\s\(\s+\d+\)\s+\=\s+\d+\.\d+\s+\[THz\]\s+\=\s+({0})\s+\[cm\-1\]".format(DOUBLE_REGEX),
+        "anchor": "cm-1",
         "start_flag": "Diagonalizing the dynamical matrix",
         "output_type": "float"
     },
@@ -130,12 +157,14 @@ REGEX = {
     },
     "sternheimer_gw_kpoint": {
         "regex": r"^\s+GWKpoint cart :\s+({0})\s+({0})\s+({0})".format(DOUBLE_REGEX),
+        "anchor": "GWKpoint cart",
         "occurrences": 0,
         "output_type": "float",
         "match_groups": [1, 2, 3]
     },
     "sternheimer_gw_eigenvalues": {
         "regex": r"^\s+GW qp energy \(eV\)(.*)",
+        "anchor": "GW qp energy",
         "occurrences": 0,
         "output_type": "str",
     },
@@ -144,36 +173,42 @@ REGEX = {
 TOTAL_ENERGY_CONTRIBUTIONS = {
     "harris_foulkes": {
         "regex": COMMON_REGEX.format("Harris-Foulkes estimate"),
+        "anchor": "Harris-Foulkes estimate",
         "start_flag": "!",
         "occurrences": -1,
         "output_type": "float"
     },
     "one_electron": {
         "regex": COMMON_REGEX.format("one-electron contribution"),
+        "anchor": "one-electron contribution",
         "start_flag": "!",
         "occurrences": -1,
         "output_type": "float"
     },
     "hartree": {
         "regex": COMMON_REGEX.format("hartree contribution"),
+        "anchor": "hartree contribution",
         "start_flag": "!",
         "occurrences": -1,
         "output_type": "float"
     },
     "exchange_correlation": {
         "regex": COMMON_REGEX.format("xc contribution"),
+        "anchor": "xc contribution",
         "start_flag": "!",
         "occurrences": -1,
         "output_type": "float"
     },
     "ewald": {
         "regex": COMMON_REGEX.format("ewald contribution"),
+        "anchor": "ewald contribution",
         "start_flag": "!",
         "occurrences": -1,
         "output_type": "float"
     },
     "smearing": {
         "regex": COMMON_REGEX.format("smearing contrib\.\s+\(-TS\)"),
+        "anchor": "smearing contrib",
         "start_flag": "!",
         "occurrences": -1,
         "output_type": "float"
@@ -4,6 +4,12 @@ from pymatgen.io.vasp import Outcar
 
 from express.parsers.apps.vasp import settings
 from express.parsers.formats.txt import BaseTXTParser
+from express.parsers.formats.patterns import RegexRegistry
+from express.parsers.formats.extractor import RegexTableExtractor
+
+PATTERNS = RegexRegistry(settings.REGEX)
+
+TOTAL_ENERGY_CONTRIBUTIONS_EXTRACTOR = RegexTableExtractor(settings.TOTAL_ENERGY_CONTRIBUTIONS)
 
 
 class VaspTXTParser(BaseTXTParser):
@@ -11,8 +17,8 @@ class VaspTXTParser(BaseTXTParser):
     Vasp text parser class.
     """
 
-    def __init__(self, work_dir):
-        super(VaspTXTParser, self).__init__(work_dir)
+    def __init__(self, work_dir, work_dir_index=None, read_files=None):
+        super(VaspTXTParser, self).__init__(work_dir, work_dir_index, read_files)
 
     def ibz_kpoints(self, text, space):
         """
@@ -35,9 +41,10 @@ class VaspTXTParser(BaseTXTParser):
                 'end': 'Following cartesian coordinates'
             }
         }
-        start_index = text.find(text_range[space]['start'])
-        end_index = text.find(text_range[space]['end'])
-        ibz_kpts = re.findall(settings.REGEX["ibz_kpoints"]["regex"], text[start_index:end_index])
+        # the text is searched in place within the same bounds as text[start_index:end_index], not found flags included.
+        start_index, end_index = [text.find(text_range[space][_]) for _ in ('start', 'end')]
+        start_index, end_index = [i + len(text) if i < 0 else i for i in (start_index, end_index)]
+        ibz_kpts = PATTERNS.pattern("ibz_kpoints", 0).findall(text, start_index, end_index)
         ibz_kpts = [map(float, kp) for kp in ibz_kpts]
         return np.array(ibz_kpts)
 
@@ -86,7 +93,7 @@ class VaspTXTParser(BaseTXTParser):
         """
 
         lattices = []
-        match = re.findall(settings.REGEX["lattice_vectors"]["regex"], text)
+        match = PATTERNS.pattern("lattice_vectors", 0).findall(text)
         if match:
             for lattice in match:
                 lattice = [float(_) for _ in lattice]
@@ -127,10 +134,11 @@ class VaspTXTParser(BaseTXTParser):
             ]
         """
         results = []
-        matches = re.findall(settings.REGEX["ion_positions_block"]["regex"], text, re.DOTALL | re.MULTILINE)
+        matches = PATTERNS.pattern("ion_positions_block", re.DOTALL | re.MULTILINE).findall(text)
         if matches:
+            basis_vectors_pattern = PATTERNS.pattern("basis_vectors", 0)
             for match in matches:
-                ions = re.findall(settings.REGEX["basis_vectors"]["regex"], match)
+                ions = basis_vectors_pattern.findall(match)
                 results.append({
                     "units": "angstrom",
                     "elements": [{"id": idx, "value": atom_names[idx]} for idx in range(len(ions))],
@@ -254,8 +262,7 @@ class VaspTXTParser(BaseTXTParser):
             dict
         """
         energy_contributions = {}
-        for contribution in settings.TOTAL_ENERGY_CONTRIBUTIONS:
-            value = self._general_output_parser(text, **settings.TOTAL_ENERGY_CONTRIBUTIONS[contribution])
+        for contribution, value in TOTAL_ENERGY_CONTRIBUTIONS_EXTRACTOR.extract(text).items():
             if value:
                 energy_contributions.update({contribution: {
                     'name': contribution,
@@ -1,8 +1,8 @@
 import string
 import numpy as np
-from operator import itemgetter
 
-from express.parsers.formats.xml import BaseXMLParser
+from express.parsers.eigenvalues import EigenvalueData
+from express.parsers.formats.xml import BaseXMLParser, decode_rows
 
 SPIN_MAP_COLLINEAR = {
     1: 'up',
@@ -23,12 +23,67 @@ class VaspXMLParser(BaseXMLParser):
     """
     Vasp XML parser class.
 
+    Note: vasprun.xml is parsed in streaming mode, only the subtrees below and the last ionic step are kept in memory.
+    The elements of `INDEXED_TAGS` are parsed directly from their byte offsets instead, see `BaseXMLParser.index`, hence
+    the whole file is only parsed if it can not be indexed.
+
     Args:
         xml_file_path (str): path to the xml file.
+        read_files (set): absolute paths of the files read by the parser, shared with the application parser.
     """
 
-    def __init__(self, xml_file_path):
-        super(VaspXMLParser, self).__init__(xml_file_path)
+    STREAMING_PATHS = [
+        "kpoints",
+        "parameters",
+        "atominfo",
+        "structure",
+        "calculation/eigenvalues",
+        "calculation/dos",
+        "calculation/varray",
+    ]
+
+    INDEXED_TAGS = ["kpoints", "parameters", "atominfo", "structure", "calculation", "eigenvalues", "dos"]
+
+    def __init__(self, xml_file_path, read_files=None):
+        super(VaspXMLParser, self).__init__(xml_file_path, read_files)
+        self._atom_info = None
+        self._eigenvalue_data = None
+
+    def _find(self, tag, path=None, name=None):
+        """
+        Finds the first top level element with a given tag, similar to `root.find`.
+
+        Args:
+            tag (str): element tag.
+            path (str): path of the sub-element to return.
+            name (str): value of the name attribute of the element.
+
+        Returns:
+            xml.etree.ElementTree.Element
+        """
+        element = self._find_indexed(tag, name=name)
+        if element is None:
+            element = self.root.find('{0}[@name="{1}"]'.format(tag, name) if name else tag)
+        return element.find(path) if path and element is not None else element
+
+    def _find_in_last_calculation(self, path):
+        """
+        Finds an element of the last ionic step, similar to `root.findall('calculation')[-1].find(path)`.
+
+        Args:
+            path (str): element path relative to the calculation element.
+
+        Returns:
+            xml.etree.ElementTree.Element
+        """
+        tag, _, sub_path = path.partition("/")
+        calculations = self.index.get("calculation")
+        if calculations:
+            within = calculations[-1][:2]
+            element = self._find_indexed(tag, within=within, last=True) if tag in self.INDEXED_TAGS else None
+            if element is not None: return element.find(sub_path) if sub_path else element
+            return self._find_indexed("calculation", last=True).find(path)
+        return self.root.findall('calculation')[-1].find(path)
 
     def eigenvalues_at_kpoints(self):
         """
@@ -53,26 +108,38 @@ class VaspXMLParser(BaseXMLParser):
                 ...
             ]
         """
-        kpoints_list = self.root.find('kpoints').find('.//varray[@name="kpointlist"]')
-        kpoints_weight = self.root.find('kpoints').find('.//varray[@name="weights"]')
-        eigenvalues, occupations = self._parse_eigenvalues_occupations()
+        return self.eigenvalue_data().to_list()
 
-        eigenvalues_at_kpoints = []
-        for kp_id, (kpoint, weight) in enumerate(zip(kpoints_list, kpoints_weight)):
-            eigenvalues_at_kpoint = {
-                "kpoint": map(float, kpoint.text.split()),
-                "weight": float(weight.text),
-                "eigenvalues": []
-            }
-            for spin in eigenvalues:
-                eigenvalues_at_kpoint['eigenvalues'].append({
-                    'energies': eigenvalues[spin][kp_id].tolist(),
-                    'occupations': occupations[spin][kp_id].tolist(),
-                    'spin': 0.5 if spin == 0 else -0.5
-                })
-            eigenvalues_at_kpoints.append(eigenvalues_at_kpoint)
+    def eigenvalue_data(self):
+        """
+        Returns eigenvalues for all kpoints in columnar form. Eigenvalues are parsed once, hence the returned data must
+        not be modified.
+
+        Returns:
+             EigenvalueData
+        """
+        if self._eigenvalue_data is None: self._eigenvalue_data = self._parse_eigenvalue_data()
+        return self._eigenvalue_data
 
-        return eigenvalues_at_kpoints
+    def _parse_eigenvalue_data(self):
+        """
+        Parses eigenvalues for all kpoints into columnar form.
+
+        Returns:
+             EigenvalueData
+        """
+        kpoints = decode_rows(list(self._find('kpoints', './/varray[@name="kpointlist"]')))
+        weights = decode_rows(list(self._find('kpoints', './/varray[@name="weights"]')))
+        eigenvalues, occupations = self._parse_eigenvalues_occupations()
+        spins = sorted(eigenvalues)
+        nkpoints = len(kpoints)
+        return EigenvalueData(
+            kpoints,
+            weights,
+            [[eigenvalues[spin][kp_id] for kp_id in range(nkpoints)] for spin in spins],
+            [[occupations[spin][kp_id] for kp_id in range(nkpoints)] for spin in spins],
+            [0.5 if spin == 0 else -0.5 for spin in spins]
+        )
 
     def _parse_eigenvalues_occupations(self):
         """
@@ -83,16 +150,16 @@ class VaspXMLParser(BaseXMLParser):
         """
         eigenvalues = {}
         occupations = {}
-        eigenvalues_tag = self.root.findall('calculation')[-1].find('eigenvalues/array/set')
+        eigenvalues_tag = self._find_in_last_calculation('eigenvalues/array/set')
         for id_spin, eigen_spin in enumerate(eigenvalues_tag):
             eigenvalues[id_spin] = {}
             occupations[id_spin] = {}
             for id_kpt, eigen_kpt in enumerate(eigen_spin):
                 # TODO: strip out the non-numeric values (*) for all kpoints instead of replacing them with last number.
-                kpt_data = [list(map(float, _.text.split())) for _ in eigen_kpt if "*" not in _.text]
-                kpt_data.extend([kpt_data[-1] for i in range(len(eigen_kpt) - len(kpt_data))])
-                # eigenvalues mayn't be sorted properly.
-                kpt_data = np.array(sorted(sorted(kpt_data, key=itemgetter(0)), key=itemgetter(1), reverse=True))
+                kpt_data = decode_rows([_ for _ in eigen_kpt if "*" not in _.text])
+                kpt_data = np.concatenate([kpt_data, np.repeat(kpt_data[-1:], len(eigen_kpt) - len(kpt_data), axis=0)])
+                # eigenvalues mayn't be sorted properly: by occupation in descending order, then by energy.
+                kpt_data = kpt_data[np.lexsort((kpt_data[:, 0], -kpt_data[:, 1]))]
                 eigenvalues[id_spin][id_kpt] = kpt_data[:, 0]
                 occupations[id_spin][id_kpt] = kpt_data[:, 1]
         return eigenvalues, occupations
@@ -104,7 +171,7 @@ class VaspXMLParser(BaseXMLParser):
         Returns:
             float
         """
-        tag = self.root.findall('calculation')[-1].find('dos/i')
+        tag = self._find_in_last_calculation('dos/i')
         return float(tag.text)
 
     def nspins(self):
@@ -114,7 +181,7 @@ class VaspXMLParser(BaseXMLParser):
         Returns:
              int
         """
-        tag = self.root.find('parameters').find('.//separator[@name="electronic spin"]').find('.//i[@name="ISPIN"]')
+        tag = self._find('parameters', './/separator[@name="electronic spin"]').find('.//i[@name="ISPIN"]')
         return int(tag.text)
 
     def dos(self, combined=True):
@@ -149,21 +216,10 @@ class VaspXMLParser(BaseXMLParser):
         """
         total_dos, partial_dos_values, partial_dos_infos, electronic_states = self._extract_dos()
         if combined:
-            combined_pdos_values = []
-            combined_pdos_infos = []
-            for atom_type in set(self.atom_names()):
-                for elec_state in electronic_states:
-                    matched_pdos = []
-                    for pdos_idx, pdos_info_item in enumerate(partial_dos_infos):
-                        if pdos_info_item['electronicState'] == elec_state and atom_type == pdos_info_item['element']:
-                            matched_pdos.append(partial_dos_values[pdos_idx])
-                    combined_pdos_values.append(np.sum(matched_pdos, axis=0).tolist())
-                    combined_pdos_infos.append({
-                        'element': atom_type,
-                        'electronicState': elec_state,
-                        'spin': 0.5 if 'up' in elec_state else -0.5
-                    })
-            partial_dos_values, partial_dos_infos = combined_pdos_values, combined_pdos_infos
+            partial_dos_values, partial_dos_infos = self._combine_partial_dos(partial_dos_values, partial_dos_infos,
+                                                                              electronic_states)
+        else:
+            partial_dos_values = partial_dos_values.tolist()
 
         # TODO: extract and return total dos for all the spins
         return {
@@ -173,20 +229,78 @@ class VaspXMLParser(BaseXMLParser):
             'partial_info': partial_dos_infos
         }
 
+    def _combine_partial_dos(self, partial_dos_values, partial_dos_infos, electronic_states):
+        """
+        Adds PDOS values of all atoms with the same element and electronic state together. Rows of each group are
+        selected by a mask and reduced with a single `sum` call along the first axis, which adds rows in the given order
+        and hence gives exactly the same sums as adding them one by one (`np.add.reduceat` does not, `np.add.at` is
+        unbuffered and slow).
+
+        Args:
+            partial_dos_values (ndarray): PDOS values, one row per atom, spin and orbital, see `_partial_dos`.
+            partial_dos_infos (list): PDOS information for each row of values.
+            electronic_states (set): electronic states.
+
+        Returns:
+            tuple: combined PDOS values and information, one entry per element and electronic state.
+        """
+        groups = [(atom_type, elec_state) for atom_type in set(self.atom_names()) for elec_state in electronic_states]
+        combined_pdos_infos = [{
+            'element': atom_type,
+            'electronicState': elec_state,
+            'spin': 0.5 if 'up' in elec_state else -0.5
+        } for atom_type, elec_state in groups]
+        if not partial_dos_infos: return [0.0] * len(groups), combined_pdos_infos
+        group_ids = dict((group, index) for index, group in enumerate(groups))
+        ids = np.array([group_ids[(info['element'], info['electronicState'])] for info in partial_dos_infos])
+        # groups without any values are set to 0.0, the same as summing an empty list.
+        combined_pdos_values = [0.0] * len(groups)
+        for group_index in np.unique(ids):
+            combined_pdos_values[group_index] = partial_dos_values[ids == group_index].sum(axis=0).tolist()
+        return combined_pdos_values, combined_pdos_infos
+
+    def atom_info(self):
+        """
+        Parses atoms information once per parser and returns names, type indices and masses of atoms.
+
+        Returns:
+            dict
+
+        Example:
+            {
+                'names': array(['Si', 'Si', 'C']),
+                'types': array([0, 0, 1]),
+                'masses': array([28.085, 28.085, 12.011])
+            }
+        """
+        if self._atom_info is None:
+            atominfo = self._find('atominfo')
+            atoms = [atom.findall('c') for atom in atominfo.find('array/set').findall('rc')]
+            types = np.array([int(atom[1].text) - 1 if len(atom) > 1 else 0 for atom in atoms], dtype=np.int)
+            atom_types = atominfo.find('array[@name="atomtypes"]/set')
+            atom_types = atom_types.findall('rc') if atom_types is not None else []
+            type_masses = [float(atom_type.findall('c')[2].text) for atom_type in atom_types]
+            self._atom_info = {
+                'names': np.array([atom[0].text.strip() for atom in atoms]),
+                'types': types,
+                'masses': np.array(type_masses)[types] if type_masses else np.array([])
+            }
+        return self._atom_info
+
     def atom_names(self):
         """
-        Parses atoms information and returns name of atoms.
+        Returns name of atoms.
 
         Returns:
             list: list of atom names.
         """
-        return [atom.find('c').text.strip() for atom in self.root.find('atominfo/array/set').findall('rc')]
+        return self.atom_info()['names'].tolist()
 
     def _extract_total_dos(self, dos_root):
         total_dos = []
         total_dos_root = dos_root.find('total/array/set')
         for index, spin in enumerate(total_dos_root):
-            tdos_spin = np.array([map(float, tdos.text.split()) for tdos in spin.findall('r')])
+            tdos_spin = decode_rows(spin.findall('r'))
             total_dos.append({
                 "spin": index + 1,
                 "energy": tdos_spin[:, 0],
@@ -202,7 +316,7 @@ class VaspXMLParser(BaseXMLParser):
         Returns:
             tuple: energy levels, total dos, partial dos and electronic states values
         """
-        dos_root = self.root.findall('calculation')[-1].find('dos')
+        dos_root = self._find_in_last_calculation('dos')
         total_dos = self._extract_total_dos(dos_root)
         partial_dos_values, partial_dos_infos, electronic_states = self._partial_dos(dos_root)
         return total_dos, partial_dos_values, partial_dos_infos, electronic_states
@@ -212,6 +326,8 @@ class VaspXMLParser(BaseXMLParser):
         Parses partial DOS for each element with its orbit value. DOS value for each atom with the same element and
         orbit number will be added together and packed in a dictionary.
 
+        Note: values are returned as a matrix with one row per atom, spin and orbital, see `_partial_dos_array`.
+
         Args:
             dos_root (xml.etree.ElementTree.Element): dos root Element instance of ElementTree XML class.
 
@@ -232,35 +348,54 @@ class VaspXMLParser(BaseXMLParser):
                     ]
         """
         # TODO: simplify the logic and break it down into multiple functions
-        partial_dos_values = []
+        indices = []
         partial_dos_infos = []
         electronic_states = set()
-        if dos_root.find('partial') is not None:
-            orbit_symbols = [orbit.text.strip() for orbit in dos_root.find('partial/array').findall('field')[1:]]
-            partial_root = dos_root.find('partial/array/set')
-            for atom_id, atom in enumerate(partial_root):
-                for spin_id, spin in enumerate(atom):
-                    # extract partial dos only for the first spin in case of non-collinear calculation
-                    if spin_id > 0 and len(atom) == 4 and not EXTRACT_PARTIAL_DOS_FOR_ALL_SPINS: continue
-                    pdos_spin = np.array([map(float, pdos.text.split()[1:]) for pdos in spin.findall('r')])
-                    for column_id, column in enumerate(pdos_spin.T):
-                        elec_state = orbit_symbols[column_id - 1]
-                        if len(atom) == 2:
-                            elec_state = '{0}-{1}'.format(orbit_symbols[column_id], SPIN_MAP_COLLINEAR[spin_id + 1])
-                        elif len(atom) == 4:
-                            elec_state = '{0}-{1}'.format(orbit_symbols[column_id], SPIN_MAP_NON_COLLINEAR[spin_id + 1])
-                        # orbit_symbol is missed in VASP 5.4.4, hence the below
-                        elec_state = "".join(("d", elec_state)) if "x2-y2" in elec_state else elec_state
-                        electronic_states.add(elec_state)
-                        partial_dos_values.append(column.tolist())
-                        partial_dos_infos.append({
-                            'element': self.atom_names()[atom_id],
-                            'index': atom_id,
-                            'electronicState': elec_state,
-                            'spin': 0.5 if spin_id == 0 else -0.5
-                        })
+        if dos_root.find('partial') is None: return np.array([]), partial_dos_infos, electronic_states
+        orbit_symbols = [orbit.text.strip() for orbit in dos_root.find('partial/array').findall('field')[1:]]
+        pdos = self._partial_dos_array(dos_root)
+        atom_names = self.atom_names()
+        number_of_atoms, number_of_spins, number_of_orbitals = pdos.shape[:3]
+        for atom_id in range(number_of_atoms):
+            for spin_id in range(number_of_spins):
+                # extract partial dos only for the first spin in case of non-collinear calculation
+                if spin_id > 0 and number_of_spins == 4 and not EXTRACT_PARTIAL_DOS_FOR_ALL_SPINS: continue
+                for column_id in range(number_of_orbitals):
+                    elec_state = orbit_symbols[column_id - 1]
+                    if number_of_spins == 2:
+                        elec_state = '{0}-{1}'.format(orbit_symbols[column_id], SPIN_MAP_COLLINEAR[spin_id + 1])
+                    elif number_of_spins == 4:
+                        elec_state = '{0}-{1}'.format(orbit_symbols[column_id], SPIN_MAP_NON_COLLINEAR[spin_id + 1])
+                    # orbit_symbol is missed in VASP 5.4.4, hence the below
+                    elec_state = "".join(("d", elec_state)) if "x2-y2" in elec_state else elec_state
+                    electronic_states.add(elec_state)
+                    indices.append((atom_id, spin_id, column_id))
+                    partial_dos_infos.append({
+                        'element': atom_names[atom_id],
+                        'index': atom_id,
+                        'electronicState': elec_state,
+                        'spin': 0.5 if spin_id == 0 else -0.5
+                    })
+        partial_dos_values = pdos[tuple(np.array(indices).T)] if indices else np.array([])
         return partial_dos_values, partial_dos_infos, electronic_states
 
+    def _partial_dos_array(self, dos_root):
+        """
+        Decodes partial DOS of all atoms and spins at once.
+
+        Args:
+            dos_root (xml.etree.ElementTree.Element): dos root Element instance of ElementTree XML class.
+
+        Returns:
+            ndarray: PDOS values with (atoms, spins, orbitals, energies) shape.
+        """
+        partial_root = dos_root.find('partial/array/set')
+        number_of_atoms, number_of_spins = len(partial_root), len(partial_root[0])
+        number_of_energies = len(partial_root[0][0])
+        pdos = decode_rows(partial_root.findall('set/set/r'))
+        pdos = pdos.reshape((number_of_atoms, number_of_spins, number_of_energies, pdos.shape[-1]))[..., 1:]
+        return pdos.transpose((0, 1, 3, 2))
+
     def final_lattice_vectors(self):
         """
         Extracts lattice.
@@ -280,7 +415,7 @@ class VaspXMLParser(BaseXMLParser):
         """
         vectors = {}
         for idx, vector in enumerate(
-                self._parse_varray(self.root.find('structure[@name="finalpos"]/crystal/varray[@name="basis"]'))):
+                self._parse_varray(self._find('structure', 'crystal/varray[@name="basis"]', name="finalpos"))):
             vectors.update({
                 string.ascii_lowercase[idx]: vector.tolist()
             })
@@ -308,11 +443,12 @@ class VaspXMLParser(BaseXMLParser):
         lattice_matrix = np.array([lattice["vectors"][key] for key in ["a", "b", "c"]], dtype=np.float64).reshape(
             (3, 3))
         elements, coordinates = [], []
+        atom_names = self.atom_names()
         for idx, vector in enumerate(
-                self._parse_varray(self.root.find('structure[@name="finalpos"]/varray[@name="positions"]'))):
+                self._parse_varray(self._find('structure', 'varray[@name="positions"]', name="finalpos"))):
             elements.append({
                 'id': idx,
-                'value': self.atom_names()[idx]
+                'value': atom_names[idx]
             })
             coordinates.append({
                 'id': idx,
@@ -345,8 +481,7 @@ class VaspXMLParser(BaseXMLParser):
         Returns:
             ndarray: a matrix containing all the values found in the varray.
         """
-        return np.array([v.text.split() for v in varray.findall('v')],
-                        dtype=np.float) if varray is not None else np.array([])
+        return decode_rows(varray.findall('v')) if varray is not None else np.array([])
 
     def stress_tensor(self):
         """
@@ -355,7 +490,7 @@ class VaspXMLParser(BaseXMLParser):
         Returns:
             list
         """
-        return self._parse_varray(self.root.findall('calculation')[-1].find('.//varray[@name="stress"]')).tolist()
+        return self._parse_varray(self._find_in_last_calculation('.//varray[@name="stress"]')).tolist()
 
     def atomic_forces(self):
         """
@@ -364,4 +499,4 @@ class VaspXMLParser(BaseXMLParser):
         Returns:
             list
         """
-        return self._parse_varray(self.root.findall('calculation')[-1].find('.//varray[@name="forces"]')).tolist()
+        return self._parse_varray(self._find_in_last_calculation('.//varray[@name="forces"]')).tolist()
@@ -1,8 +1,7 @@
 import os
-import numpy as np
 
 from express.parsers import BaseParser
-from express.parsers.utils import find_file
+from express.parsers.utils import WorkDirIndex
 from express.parsers.apps.vasp import settings
 from express.parsers.mixins.ionic import IonicDataMixin
 from express.parsers.apps.vasp.formats.txt import VaspTXTParser
@@ -15,14 +14,31 @@ from express.parsers.apps.vasp.settings import NEB_DIR_PREFIX, NEB_STD_OUT_FILE
 class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalDataMixin):
     """
     Vasp parser class.
+
+    Note: text and XML parsers are constructed on first access, hence properties extracted from stdout only do not
+    look up vasprun.xml.
     """
 
     def __init__(self, *args, **kwargs):
         super(VaspParser, self).__init__(*args, **kwargs)
         self.work_dir = self.kwargs["work_dir"]
         self.stdout_file = self.kwargs["stdout_file"]
-        self.txt_parser = VaspTXTParser(self.work_dir)
-        self.xml_parser = VaspXMLParser(find_file(settings.XML_DATA_FILE, self.work_dir))
+        self.work_dir_index = WorkDirIndex(self.work_dir)
+        self._txt_parser = None
+        self._xml_parser = None
+
+    @property
+    def txt_parser(self):
+        if self._txt_parser is None:
+            self._txt_parser = VaspTXTParser(self.work_dir, self.work_dir_index, self.read_files)
+        return self._txt_parser
+
+    @property
+    def xml_parser(self):
+        if self._xml_parser is None:
+            xml_path = self.work_dir_index.find(settings.XML_DATA_FILE, exact=True)
+            self._xml_parser = VaspXMLParser(xml_path, self.read_files)
+        return self._xml_parser
 
     def _get_outcar_content(self):
         """
@@ -31,12 +47,7 @@ class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalData
         Returns:
             str
         """
-        outcar_content = ''
-        outcar_path = os.path.join(self.work_dir, "OUTCAR")
-        if os.path.exists(outcar_path):
-            with open(outcar_path) as f:
-                outcar_content = f.read()
-        return outcar_content
+        return self._get_file_content(os.path.join(self.work_dir, "OUTCAR"))
 
     def total_energy(self):
         """
@@ -74,6 +85,15 @@ class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalData
         """
         return self.xml_parser.eigenvalues_at_kpoints()
 
+    def eigenvalue_data(self):
+        """
+        Returns eigenvalues for all kpoints in columnar form.
+
+        Reference:
+            func: express.parsers.mixins.electronic.ElectronicDataMixin.eigenvalue_data
+        """
+        return self.xml_parser.eigenvalue_data()
+
     def ibz_k_points(self):
         """
         Returns ibz_k_points.
@@ -85,7 +105,7 @@ class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalData
         Reference:
             func: express.parsers.mixins.reciprocal.ReciprocalDataMixin.ibz_k_points
         """
-        return np.array([eigenvalueData["kpoint"] for eigenvalueData in self.eigenvalues_at_kpoints()])
+        return self.eigenvalue_data().kpoints
 
     def dos(self):
         """
@@ -215,11 +235,8 @@ class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalData
              list[str]
         """
         paths = []
-        for root, dirs, files in os.walk(self.work_dir):
-            for dir_ in [d for d in dirs if str(d).startswith(prefix)]:
-                path = os.path.join(root, dir_)
-                paths.append({"path": path, "index": int(dir_)})
-            break
+        for dir_ in [d for d in self.work_dir_index.list_dir(dirs=True) if str(d).startswith(prefix)]:
+            paths.append({"path": os.path.join(self.work_dir, dir_), "index": int(dir_)})
         return map(lambda p: p["path"], sorted(paths, key=lambda p: p["index"]))
 
     def _get_neb_image_stdout_files(self, prefix="0", output_file="stdout"):
@@ -264,6 +281,7 @@ class VaspParser(BaseParser, IonicDataMixin, ElectronicDataMixin, ReciprocalData
         """
         structures = []
         for path in self._get_neb_image_dirs():
+            self.read_files.add(os.path.abspath(os.path.join(path, "CONTCAR")))
             with open(os.path.join(path, "CONTCAR")) as f:
                 structures.append(f.read())
         return self.reaction_coordinates_from_poscars(structures)
@@ -9,6 +9,7 @@ _COMMON_REGEX = r"{0}\s+({1})\s+({1})\s+({1})\s+({1})\s+({1})\s+({1})"
 REGEX = {
     "total_energy": {
         "regex": r"F=\s+({0})".format(GENERAL_REGEX.double_number),
+        "anchor": "F=",
         "start_flag": "entering main loop",
         "occurrences": -1,
         "output_type": "float",
@@ -36,17 +37,20 @@ REGEX = {
     },
     "pressure": {
         "regex": r"external pressure\s+=\s+({0})\s+kB".format(GENERAL_REGEX.double_number),
+        "anchor": "external pressure",
         "occurrences": -1,
         "output_type": "float",
     },
     "total_force": {
         "regex": r"total drift:\s+({0})\s+({0})\s+({0})".format(GENERAL_REGEX.double_number),
+        "anchor": "total drift",
         "occurrences": -1,
         "output_type": "float",
         "match_groups": [1, 2, 3]
     },
     "zero_point_energy": {
         "regex": r"f\s\s=.*2PiTHz\s+\d+\.\d+\s+cm\-1\s+({0})\s+meV".format(GENERAL_REGEX.double_number),
+        "anchor": "2PiTHz",
         "start_flag": "Eigenvectors and eigenvalues of the dynamical matrix",
         "output_type": "float",
     }
@@ -55,18 +59,21 @@ REGEX = {
 TOTAL_ENERGY_CONTRIBUTIONS = {
     "hartree": {
         "regex": _COMMON_REGEX.format("Hartree", GENERAL_REGEX.double_number),
+        "anchor": "Hartree",
         "occurrences": -1,
         "output_type": "float",
         "match_groups": [1, 2, 3, 4, 5, 6]
     },
     "ewald": {
         "regex": _COMMON_REGEX.format("Ewald", GENERAL_REGEX.double_number),
+        "anchor": "Ewald",
         "occurrences": -1,
         "output_type": "float",
         "match_groups": [1, 2, 3, 4, 5, 6]
     },
     "exchange_correlation": {
         "regex": _COMMON_REGEX.format("E\(xc\)", GENERAL_REGEX.double_number),
+        "anchor": "E(xc)",
         "occurrences": -1,
         "output_type": "float",
         "match_groups": [1, 2, 3, 4, 5, 6]
@@ -0,0 +1,108 @@
+import numpy as np
+
+SPINS = [0.5, -0.5]
+
+
+class EigenvalueData(object):
+    """
+    Columnar store of eigenvalues for all kpoints and spins.
+
+    Eigenvalues are kept in numpy arrays to be consumed by properties directly. The legacy list of dictionaries
+    returned by `ElectronicDataMixin.eigenvalues_at_kpoints` is only built on demand, see `to_list`.
+
+    Args:
+        kpoints (ndarray): kpoints in crystal coordinates with (nk, 3) shape.
+        weights (ndarray): kpoint weights with (nk,) shape.
+        energies (ndarray): eigenvalues in eV with (ns, nk, nb) shape.
+        occupations (ndarray): occupations with (ns, nk, nb) shape, (ns, nk, 0) if occupations are not available.
+        spins (list): spin values, [0.5, -0.5] for spin-polarized calculations, [0.5] otherwise.
+    """
+
+    def __init__(self, kpoints, weights, energies, occupations, spins=None):
+        self.kpoints = np.asarray(kpoints, dtype=np.float64).reshape((-1, 3))
+        self.weights = np.asarray(weights, dtype=np.float64).reshape(-1)
+        self.energies = np.asarray(energies, dtype=np.float64)
+        self.occupations = np.asarray(occupations, dtype=np.float64)
+        self.spins = list(spins) if spins is not None else SPINS[:self.energies.shape[0]]
+
+    @property
+    def nkpoints(self):
+        return len(self.weights)
+
+    @property
+    def nspins(self):
+        return self.energies.shape[0]
+
+    @property
+    def nbands(self):
+        return self.energies.shape[2]
+
+    def select(self, mask):
+        """
+        Returns eigenvalues of the selected kpoints.
+
+        Args:
+            mask (ndarray): boolean mask or indices of kpoints to select.
+
+        Returns:
+            EigenvalueData
+        """
+        return EigenvalueData(self.kpoints[mask], self.weights[mask], self.energies[:, mask],
+                              self.occupations[:, mask], self.spins)
+
+    def to_list(self):
+        """
+        Builds the legacy list of dictionaries. A new list is built on each call, hence it can be safely modified.
+
+        Returns:
+            list
+
+        Example:
+            [
+                {
+                    'kpoint': [-0.5, 0.5, 0.5],
+                    'weight': 9.5238095E-002,
+                    'eigenvalues': [
+                        {
+                            'energies': [-1.4498446E-001, ..., 4.6507387E-001],
+                            'occupations': [1, ... , 0],
+                            'spin': 0.5
+                        }
+                    ]
+                },
+                ...
+            ]
+        """
+        kpoints, weights = self.kpoints.tolist(), self.weights.tolist()
+        energies, occupations = self.energies.tolist(), self.occupations.tolist()
+        return [{
+            'kpoint': kpoints[k],
+            'weight': weights[k],
+            'eigenvalues': [{
+                'energies': energies[s][k],
+                'occupations': occupations[s][k],
+                'spin': spin
+            } for s, spin in enumerate(self.spins)]
+        } for k in range(len(kpoints))]
+
+    @classmethod
+    def from_list(cls, eigenvalues_at_kpoints):
+        """
+        Creates the columnar store from the legacy list of dictionaries.
+
+        Args:
+            eigenvalues_at_kpoints (list): eigenvalues for all kpoints, see `to_list`.
+
+        Returns:
+            EigenvalueData
+        """
+        nkpoints = len(eigenvalues_at_kpoints)
+        spins = sorted(set(e['spin'] for _ in eigenvalues_at_kpoints for e in _['eigenvalues']), reverse=True)
+        energies, occupations = np.zeros((0, nkpoints, 0)), np.zeros((0, nkpoints, 0))
+        if spins:
+            spin_eigenvalues = [[[e for e in _['eigenvalues'] if e['spin'] == spin][0] for _ in eigenvalues_at_kpoints]
+                                for spin in spins]
+            energies = np.array([[e['energies'] for e in _] for _ in spin_eigenvalues], dtype=np.float64)
+            occupations = np.array([[e['occupations'] for e in _] for _ in spin_eigenvalues], dtype=np.float64)
+        return cls([_['kpoint'] for _ in eigenvalues_at_kpoints], [_['weight'] for _ in eigenvalues_at_kpoints],
+                   energies, occupations, spins)
@@ -0,0 +1,91 @@
+import re
+
+from express.parsers.formats.txt import cast_matches
+from express.parsers.formats.patterns import compile_pattern
+
+
+class RegexTableExtractor(object):
+    """
+    Extracts all entries of a regex table (e.g. `express.parsers.apps.espresso.settings.REGEX`) in a single pass over
+    the text with the same semantics as `BaseTXTParser._general_output_parser`.
+
+    Entries defining an `anchor` keyword are matched line by line: a single combined regex of all anchors and start
+    flags is run over the text and only the lines it hits are searched with the entry patterns. Entries without anchor
+    are searched over the whole text. Entries without `output_type` and entry factories (callables) are not extracted.
+
+    Note: entries with anchor are expected to match within a single line.
+
+    Args:
+        table (dict): regex table, entry name as key and `_general_output_parser` kwargs as value.
+    """
+
+    def __init__(self, table):
+        self.line_entries = []
+        self.text_entries = []
+        keywords = set()
+        for name, entry in table.items():
+            if callable(entry) or "output_type" not in entry: continue
+            entry = dict(entry, name=name, pattern=compile_pattern(entry["regex"], re.I | re.MULTILINE))
+            if entry.get("anchor"):
+                entry["anchor"] = entry["anchor"].lower()
+                keywords.update([entry["anchor"], entry.get("start_flag") or entry["anchor"]])
+                self.line_entries.append(entry)
+            else:
+                self.text_entries.append(entry)
+        keywords = sorted(keywords, key=len, reverse=True)
+        self.trigger = re.compile("|".join(map(re.escape, keywords)), re.I) if keywords else None
+
+    def extract(self, text):
+        """
+        Extracts all entries from a given text.
+
+        Args:
+            text (str|mmap.mmap): text to extract data from.
+
+        Returns:
+            dict: entry name as key and the extracted data as value.
+        """
+        matches = self._match_lines(text)
+        for entry in self.text_entries:
+            start_index = text.rfind(entry["start_flag"]) if entry.get("start_flag") else 0
+            if start_index < 0: start_index = max(len(text) - 1, 0)
+            matches[entry["name"]] = entry["pattern"].findall(text, start_index)
+
+        results = {}
+        for entry in self.line_entries + self.text_entries:
+            kwargs = {k: entry[k] for k in ("occurrences", "match_groups") if k in entry}
+            results[entry["name"]] = cast_matches(matches[entry["name"]], entry["output_type"], **kwargs)
+        return results
+
+    def _match_lines(self, text):
+        """
+        Finds the matches of line entries. Lines which do not contain any anchor or start flag are skipped.
+
+        Args:
+            text (str|mmap.mmap): text to search.
+
+        Returns:
+            dict: entry name as key and the list of matches as value.
+        """
+        matches = dict((entry["name"], []) for entry in self.line_entries)
+        # entries with start flag only collect matches after the last occurrence of the flag.
+        started = dict((entry["name"], not entry.get("start_flag")) for entry in self.line_entries)
+        if self.trigger is None: return matches
+
+        line_end = -1
+        for hit in self.trigger.finditer(text):
+            if hit.start() <= line_end: continue
+            line_start = text.rfind("\n", 0, hit.start()) + 1
+            line_end = text.find("\n", hit.end())
+            line_end = len(text) if line_end < 0 else line_end
+            line = text[line_start:line_end + 1]
+            lower_line = line.lower()
+            for entry in self.line_entries:
+                name, start_index = entry["name"], 0
+                if entry.get("start_flag"):
+                    flag_index = line.rfind(entry["start_flag"])
+                    if flag_index >= 0:
+                        matches[name], started[name], start_index = [], True, flag_index
+                if started[name] and entry["anchor"] in lower_line:
+                    matches[name].extend(entry["pattern"].findall(line, start_index))
+        return matches
@@ -0,0 +1,79 @@
+import re
+
+# compiled patterns keyed on (regex, flags). Unlike the internal cache of `re` module, entries are never purged.
+COMPILED_PATTERNS = {}
+
+
+def compile_pattern(regex, flags=0):
+    """
+    Compiles a given regex once and returns the same compiled pattern on subsequent calls.
+
+    Args:
+        regex (str): regex pattern.
+        flags (int): regex flags.
+
+    Returns:
+        re.RegexObject
+    """
+    key = (regex, flags)
+    pattern = COMPILED_PATTERNS.get(key)
+    if pattern is None: pattern = COMPILED_PATTERNS[key] = re.compile(regex, flags)
+    return pattern
+
+
+class RegexRegistry(object):
+    """
+    Registry of compiled patterns of a regex table (e.g. `express.parsers.apps.espresso.settings.REGEX`).
+
+    Patterns of plain entries are compiled with the default flags once the registry is created. Entry factories (e.g.
+    `basis_alat`) are called once per set of arguments, the resulting entries and their patterns are memoized.
+
+    Args:
+        table (dict): regex table, entry name as key and `_general_output_parser` kwargs (or a factory thereof) as value.
+        flags (int): default regex flags, the same as used by `BaseTXTParser._general_output_parser`.
+
+    Example:
+        PATTERNS = RegexRegistry(settings.REGEX)
+        PATTERNS.pattern("bfgs_block", re.DOTALL).findall(text)
+        self._general_output_parser(text, **PATTERNS.entry("basis_alat", number_of_atoms))
+    """
+
+    def __init__(self, table, flags=re.I | re.MULTILINE):
+        self.table = table
+        self.flags = flags
+        self._entries = {}
+        for name, entry in table.items():
+            if not callable(entry) and "regex" in entry: compile_pattern(entry["regex"], flags)
+
+    def entry(self, name, *args):
+        """
+        Returns the table entry with a given name. Factories are called with the given arguments once.
+
+        Args:
+            name (str): entry name.
+            args (tuple): factory arguments.
+
+        Returns:
+            dict
+        """
+        entry = self.table[name]
+        if not callable(entry): return entry
+        key = (name, args)
+        if key not in self._entries:
+            entry = self._entries[key] = entry(*args)
+            compile_pattern(entry["regex"], self.flags)
+        return self._entries[key]
+
+    def pattern(self, name, flags=None, *args):
+        """
+        Returns the compiled pattern of the entry with a given name.
+
+        Args:
+            name (str): entry name.
+            flags (int): regex flags, default flags are used if not given.
+            args (tuple): factory arguments.
+
+        Returns:
+            re.RegexObject
+        """
+        return compile_pattern(self.entry(name, *args)["regex"], self.flags if flags is None else flags)
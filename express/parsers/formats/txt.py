@@ -1,6 +1,9 @@
 import re
 import __builtin__
 
+from express.parsers.utils import WorkDirIndex
+from express.parsers.formats.patterns import compile_pattern
+
 
 class BaseTXTParser(object):
     """
@@ -8,19 +11,27 @@ class BaseTXTParser(object):
 
     Args:
         work_dir (str): path to the working directory.
+        work_dir_index (WorkDirIndex): index of the working directory, shared with the application parser.
+        read_files (set): absolute paths of the files read by the parser, shared with the application parser.
     """
 
-    def __init__(self, work_dir):
+    def __init__(self, work_dir, work_dir_index=None, read_files=None):
         self.work_dir = work_dir
+        self.work_dir_index = work_dir_index or WorkDirIndex(work_dir)
+        self.read_files = set() if read_files is None else read_files
 
-    def _general_output_parser(self, text, regex, output_type, start_flag=None, occurrences=0, match_groups=[]):
+    def _general_output_parser(self, text, regex, output_type, start_flag=None, occurrences=0, match_groups=[],
+                               anchor=None):
         """
         General function for extracting data from a text output. It extracts basic values using regex patterns. Based
         on the input regex pattern, this function uses re.findall method to find every instance of the pattern inside
         the text.
 
+        Note: the text is scanned in place starting from `start_flag` without slicing it, hence a memory-mapped file
+        (see `express.parsers.utils.map_file`) can be passed as text to keep the memory footprint constant.
+
         Args:
-            text (str): text to search
+            text (str|mmap.mmap): text to search
             regex (str): regex pattern.
             output_type (str): output type.
             start_flag (str): a symbol in the output file to be used as the starting point (for speedup and accuracy).
@@ -29,23 +40,42 @@ class BaseTXTParser(object):
                                 - N = 0: extract all of of the occurred instances and forms a list.
                                 - N > 0: extract the first N instance(s). Forms a list if |N| > 1
             match_groups (list): list of match groups to be used for the regex.
+            anchor (str): keyword present on every line matching the regex. Only used by `RegexTableExtractor`.
 
         Return:
             any
         """
         start_index = text.rfind(start_flag) if start_flag else 0
-        pattern = re.compile(regex, re.I | re.MULTILINE)
-        cast = getattr(__builtin__, output_type)
-        # output type depends on the number of values required. List or single number.
-        result = [] if len(match_groups) > 1 or abs(occurrences) > 1 or occurrences == 0 else None
-
-        match = pattern.findall(text[start_index:])
-        if match:
-            occurrences = len(match) if occurrences == 0 else occurrences
-            match = match[occurrences:] if occurrences < 0 else match[:occurrences]
-            if isinstance(result, list):
-                for m in match:
-                    result.append([cast(m[i - 1]) for i in match_groups]) if match_groups else result.append(cast(m))
-            else:
-                result = cast(match[0][0]) if isinstance(match[0], tuple) else cast(match[0])
-        return result
+        # the text is only searched at its last character if start_flag is not found.
+        if start_index < 0: start_index = max(len(text) - 1, 0)
+        pattern = compile_pattern(regex, re.I | re.MULTILINE)
+        return cast_matches(pattern.findall(text, start_index), output_type, occurrences, match_groups)
+
+
+def cast_matches(match, output_type, occurrences=0, match_groups=[]):
+    """
+    Casts the matches found by re.findall to the output type and selects the occurrences and match groups of interest.
+    See `BaseTXTParser._general_output_parser` for the meaning of the arguments.
+
+    Args:
+        match (list): list of matches returned by re.findall.
+        output_type (str): output type.
+        occurrences (int): number of desired occurrences.
+        match_groups (list): list of match groups to be used.
+
+    Returns:
+        any
+    """
+    cast = getattr(__builtin__, output_type)
+    # output type depends on the number of values required. List or single number.
+    result = [] if len(match_groups) > 1 or abs(occurrences) > 1 or occurrences == 0 else None
+
+    if match:
+        occurrences = len(match) if occurrences == 0 else occurrences
+        match = match[occurrences:] if occurrences < 0 else match[:occurrences]
+        if isinstance(result, list):
+            for m in match:
+                result.append([cast(m[i - 1]) for i in match_groups]) if match_groups else result.append(cast(m))
+        else:
+            result = cast(match[0][0]) if isinstance(match[0], tuple) else cast(match[0])
+    return result
@@ -1,22 +1,280 @@
 from __future__ import absolute_import
 
 import os
+import re
+import json
+import mmap
+import tempfile
+import numpy as np
 import xml.etree.ElementTree as ET
 
+from express.parsers.utils import map_file
+from express.parsers.settings import XML_INDEX_FILE_SUFFIX
+
+
+def decode_rows(elements):
+    """
+    Decodes whitespace separated numbers held by a list of elements, e.g. <v> or <r> tags of a varray, into a matrix
+    with one row per element. All texts are parsed at once by numpy instead of converting each number in Python.
+
+    Note: rows are converted one by one if the elements do not hold the same number of valid numbers each, e.g. when
+    a value is overflowed ("*******"), hence malformed rows fail the same way as with a per row conversion.
+
+    Args:
+        elements (list): list of xml.etree.ElementTree.Element instances.
+
+    Returns:
+        ndarray
+    """
+    if not elements: return np.array([])
+    columns = len(elements[0].text.split())
+    values = np.fromstring(" ".join(element.text for element in elements), sep=" ")
+    if columns and values.size == len(elements) * columns: return values.reshape((len(elements), columns))
+    return np.array([map(float, element.text.split()) for element in elements])
+
 
 class BaseXMLParser(object):
     """
     Base XML parser class.
+
+    The XML file is parsed lazily on first access to `root`. Parsers declaring `STREAMING_PATHS` parse the file with
+    `iterparse` and only keep the subtrees at the declared paths, everything else is cleared as soon as it is parsed.
+    See `_iterparse_root` for details.
+
+    Parsers declaring `INDEXED_TAGS` keep the byte offsets of these elements in a sidecar file next to the XML file
+    (see `index`), so that single elements can be parsed directly from the file without parsing the whole tree.
+
+    Args:
+        xml_file_path (str): path to the xml file.
+        read_files (set): absolute paths of the files read by the parser, shared with the application parser.
     """
 
-    def __init__(self, xml_file_path):
+    # paths relative to the root of the subtrees to keep, e.g. "calculation/dos". The whole tree is kept if empty.
+    STREAMING_PATHS = []
+
+    # tags of the elements to index by byte offsets.
+    INDEXED_TAGS = []
+
+    def __init__(self, xml_file_path, read_files=None):
         self.xml_path = xml_file_path
-        self.root = None
+        self.read_files = set() if read_files is None else read_files
         self.xml_dir_name = None
+        self._root = None
+        self._root_parsed = False
+        self._index = None
+        self._fragments = {}
         if self.xml_path and os.path.exists(self.xml_path):
-            try:
-                self.xml_dir_name = os.path.dirname(self.xml_path)
-                self.root = ET.parse(self.xml_path).getroot()
-            except:
-                # safely ignore broken xml file
-                pass
+            self.xml_dir_name = os.path.dirname(self.xml_path)
+
+    @property
+    def root(self):
+        """
+        Returns the root element of the XML file, None if the file does not exist or is broken.
+
+        Returns:
+             xml.etree.ElementTree.Element
+        """
+        if not self._root_parsed:
+            self._root_parsed = True
+            if self.xml_path and os.path.exists(self.xml_path):
+                self.read_files.add(os.path.abspath(self.xml_path))
+                try:
+                    self._root = self._iterparse_root() if self.STREAMING_PATHS else ET.parse(self.xml_path).getroot()
+                except:
+                    # safely ignore broken xml file
+                    pass
+        return self._root
+
+    @root.setter
+    def root(self, root):
+        self._root = root
+        self._root_parsed = True
+
+    def _iterparse_root(self):
+        """
+        Parses the XML file incrementally and returns its root with the subtrees at `STREAMING_PATHS` only.
+
+        Elements which are neither on a streaming path nor an ancestor of one are removed from the tree and cleared
+        right after they are parsed. Ancestors of streaming paths (e.g. "calculation" of "calculation/dos") only keep
+        their last occurrence, hence `root.findall("calculation")[-1]` works as with the complete tree while the memory
+        footprint does not grow with the number of ionic steps.
+
+        Returns:
+             xml.etree.ElementTree.Element
+        """
+        paths = set(self.STREAMING_PATHS)
+        ancestors = set("/".join(path.split("/")[:i]) for path in paths for i in range(1, path.count("/") + 1))
+        root, kept_depth = None, None
+        elements, tags, last_ancestors = [], [], {}
+        for event, element in ET.iterparse(self.xml_path, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = element
+                    continue
+                elements.append(element)
+                tags.append(element.tag)
+                if kept_depth is None and "/".join(tags) in paths: kept_depth = len(tags)
+                continue
+            if element is root: break
+            path = "/".join(tags)
+            depth = len(tags)
+            elements.pop()
+            tags.pop()
+            parent = elements[-1] if elements else root
+            if kept_depth is not None:
+                if depth == kept_depth: kept_depth = None
+            elif path in ancestors:
+                previous = last_ancestors.get((id(parent), path))
+                if previous is not None:
+                    parent.remove(previous)
+                    previous.clear()
+                last_ancestors[(id(parent), path)] = element
+            else:
+                parent.remove(element)
+                element.clear()
+        return root
+
+    @property
+    def index(self):
+        """
+        Returns the byte offsets of `INDEXED_TAGS` elements. The index is built on first access and stored in a sidecar
+        file (XML file path followed by `XML_INDEX_FILE_SUFFIX`), which is reused as long as the size and modification
+        time of the XML file do not change. An empty index is returned if the file can not be indexed.
+
+        Returns:
+            dict: tag as key and the list of [start, end, name attribute] of its elements in document order as value.
+
+        Example:
+            {
+                'calculation': [[1024, 52302, None], [52303, 103581, None]],
+                'structure': [[512, 1023, 'initialpos'], ..., [103582, 104096, 'finalpos']]
+            }
+        """
+        if self._index is None:
+            self._index = {}
+            if self.INDEXED_TAGS and self.xml_path and os.path.exists(self.xml_path):
+                stat = os.stat(self.xml_path)
+                signature = [stat.st_size, stat.st_mtime]
+                self._index = self._load_index(signature)
+                if self._index is None:
+                    self._index = self._build_index()
+                    self._store_index(signature, self._index)
+        return self._index
+
+    def _load_index(self, signature):
+        """
+        Loads the index from the sidecar file if it is up to date.
+
+        Args:
+            signature (list): size and modification time of the XML file.
+
+        Returns:
+            dict
+        """
+        try:
+            with open(self.xml_path + XML_INDEX_FILE_SUFFIX) as f:
+                content = json.load(f)
+            if content["signature"] == signature and content["tags"] == sorted(self.INDEXED_TAGS):
+                return content["index"]
+        except:
+            # missing or broken index file
+            pass
+
+    def _store_index(self, signature, index):
+        """
+        Stores the index in the sidecar file. Failures, e.g. a read-only directory, are safely ignored.
+
+        Note: the index is written to a temporary file in the same directory which is then renamed to the sidecar file,
+        hence concurrent parsers (e.g. bulk extraction workers) never read a partially written index.
+
+        Args:
+            signature (list): size and modification time of the XML file.
+            index (dict): index, see `index`.
+        """
+        index_path = self.xml_path + XML_INDEX_FILE_SUFFIX
+        try:
+            fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(index_path) + ".",
+                                             dir=os.path.dirname(os.path.abspath(index_path)))
+        except (IOError, OSError):
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"signature": signature, "tags": sorted(self.INDEXED_TAGS), "index": index}, f)
+            os.chmod(temp_path, 0o644)
+            os.rename(temp_path, index_path)
+        except (IOError, OSError):
+            if os.path.exists(temp_path): os.remove(temp_path)
+
+    def _build_index(self):
+        """
+        Scans the memory-mapped XML file for start and end tags of `INDEXED_TAGS` elements. Elements which are not
+        closed, e.g. the last ionic step of a running calculation, are not indexed.
+
+        Returns:
+            dict
+        """
+        self.read_files.add(os.path.abspath(self.xml_path))
+        text = map_file(self.xml_path)
+        tags = "|".join(re.escape(tag) for tag in self.INDEXED_TAGS)
+        pattern = re.compile(r'<(/?)({0})\b([^>]*)>'.format(tags))
+        name_pattern = re.compile(r'name\s*=\s*"([^"]*)"')
+        index, open_elements = dict((tag, []) for tag in self.INDEXED_TAGS), {}
+        try:
+            for match in pattern.finditer(text):
+                closing, tag, attributes = match.groups()
+                if not closing:
+                    if attributes.endswith("/"):
+                        index[tag].append([match.start(), match.end(), None])
+                        continue
+                    name = name_pattern.search(attributes)
+                    open_elements.setdefault(tag, []).append([match.start(), None, name.group(1) if name else None])
+                elif open_elements.get(tag):
+                    element = open_elements[tag].pop()
+                    element[1] = match.end()
+                    index[tag].append(element)
+        finally:
+            # empty files are not mapped, see `map_file`
+            if isinstance(text, mmap.mmap): text.close()
+        for tag in index:
+            index[tag].sort()
+        return index
+
+    def _find_indexed(self, tag, name=None, within=None, last=False):
+        """
+        Parses an indexed element directly from the XML file.
+
+        Args:
+            tag (str): element tag.
+            name (str): value of the name attribute of the element.
+            within (list): [start, end] byte range of an enclosing element.
+            last (bool): whether to return the last matching element instead of the first one.
+
+        Returns:
+            xml.etree.ElementTree.Element: None if there is no such element in the index.
+        """
+        elements = [e for e in self.index.get(tag, []) if (name is None or e[2] == name) and (
+                within is None or (within[0] <= e[0] and e[1] <= within[1]))]
+        if not elements: return None
+        start, end = elements[-1 if last else 0][:2]
+        if (start, end) not in self._fragments:
+            self._fragments[(start, end)] = self._parse_fragment(start, end)
+        return self._fragments[(start, end)]
+
+    def _parse_fragment(self, start, end):
+        """
+        Parses the element at a given byte range of the XML file. The declaration of the XML file is prepended to keep
+        its encoding.
+
+        Args:
+            start (int): start byte offset.
+            end (int): end byte offset.
+
+        Returns:
+            xml.etree.ElementTree.Element
+        """
+        self.read_files.add(os.path.abspath(self.xml_path))
+        with open(self.xml_path, "rb") as f:
+            declaration = re.match(r"<\?xml[^>]*\?>", f.read(1024).lstrip())
+            f.seek(start)
+            fragment = f.read(end - start)
+        return ET.fromstring((declaration.group(0) if declaration else "") + fragment)
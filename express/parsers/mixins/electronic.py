@@ -3,6 +3,8 @@ import pymatgen as mg
 
 from abc import abstractmethod
 
+from express.parsers.eigenvalues import EigenvalueData
+
 
 class ElectronicDataMixin(object):
     """
@@ -85,6 +87,22 @@ class ElectronicDataMixin(object):
         """
         pass
 
+    def eigenvalue_data(self):
+        """
+        Returns eigenvalues for all kpoints in columnar form, see `express.parsers.eigenvalues.EigenvalueData`.
+
+        Note: parsers should override this method to build the arrays directly from the parsed source. The default
+        implementation converts the result of `eigenvalues_at_kpoints`.
+
+        Units:
+            energy: eV
+            kpoint coordinate: crystal
+
+        Returns:
+             EigenvalueData
+        """
+        return EigenvalueData.from_list(self.eigenvalues_at_kpoints())
+
     @abstractmethod
     def dos(self):
         """
@@ -1,6 +1,18 @@
 from math import pi
 from bunch import Bunch
 
+# maximum total size (in bytes) of file contents cached by a single parser instance
+FILE_CONTENT_CACHE_MAX_SIZE = 1024 ** 3
+
+# files larger than this size (in bytes) are memory-mapped instead of being read into memory
+MMAP_FILE_SIZE_THRESHOLD = 64 * 1024 ** 2
+
+# suffix of the sidecar file holding byte offsets of indexed XML elements, see `BaseXMLParser.index`
+XML_INDEX_FILE_SUFFIX = ".index.json"
+
+# entries skipped while indexing working directories, fnmatch patterns of "<parent directory name>/<entry name>"
+WORK_DIR_INDEX_PRUNE_PATTERNS = ["*.save/wfc*"]
+
 
 class Constant(object):
     """
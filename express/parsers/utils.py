@@ -1,4 +1,15 @@
 import os
+import re
+import mmap
+from fnmatch import fnmatch
+
+from express.parsers.settings import WORK_DIR_INDEX_PRUNE_PATTERNS
+
+try:
+    from os import scandir
+except ImportError:
+    # Python 2, see requirements.txt
+    from scandir import scandir
 
 
 def find_file(name, path):
@@ -9,10 +20,161 @@ def find_file(name, path):
         name (str): file name.
         path (str): starting path for search.
 
+    Note: the directory tree is walked lazily and the walk stops at the first match, see `WorkDirIndex.walk`.
+
     Returns:
         str: absolute file path (if found)
     """
-    for root, dirs, files in os.walk(path, followlinks=True):
-        for file in files:
-            if name in file:
-                return os.path.join(root, file)
+    for dir_path, files, dirs in WorkDirIndex(path).walk():
+        for file_name in files:
+            if name in file_name:
+                return os.path.join(dir_path, file_name)
+
+
+class WorkDirIndex(object):
+    """
+    Index of the files and directories inside a working directory.
+
+    The directory tree is walked once on the first lookup, in the same order as `os.walk(path, followlinks=True)`,
+    hence lookups return the same file as `find_file` did. Entries matching `prune_patterns` (fnmatch patterns of
+    "<parent directory name>/<entry name>", e.g. "*.save/wfc*") are skipped without being stat-ed, so that large
+    scratch directories with many wavefunction files do not slow down the walk. Directories are listed with
+    `os.scandir` (`scandir` package on Python 2), which reports entry types without a stat call per entry.
+
+    Args:
+        path (str): working directory.
+        prune_patterns (list): patterns of the entries to skip.
+
+    Example:
+        index = WorkDirIndex("/path/to/job")
+        index.find("vasprun.xml")
+        index.find_all(r"\.pdos_atm#\d+", regex=True)
+    """
+
+    def __init__(self, path, prune_patterns=WORK_DIR_INDEX_PRUNE_PATTERNS):
+        self.path = path
+        self.prune_patterns = prune_patterns
+        self._files = None
+        self._entries = None
+
+    def _is_pruned(self, dir_path, name):
+        relative_path = "/".join((os.path.basename(dir_path), name))
+        return any(fnmatch(relative_path, pattern) for pattern in self.prune_patterns)
+
+    def _list_dir(self, dir_path):
+        """
+        Returns the names of the files and directories inside a given directory.
+
+        Returns:
+            tuple: (file names, directory names)
+        """
+        files, dirs = [], []
+        try:
+            for entry in scandir(dir_path):
+                if self._is_pruned(dir_path, entry.name): continue
+                (dirs if entry.is_dir() else files).append(entry.name)
+        except OSError:
+            pass
+        return files, dirs
+
+    def walk(self):
+        """
+        Walks the working directory top-down without building the index. Symbolic links to directories are followed
+        once to avoid cycles.
+
+        Returns:
+            generator: (directory path, file names, directory names) tuples in the order of `os.walk`.
+        """
+        visited = set()
+        stack = [self.path]
+        while stack:
+            dir_path = stack.pop()
+            real_path = os.path.realpath(dir_path)
+            if real_path in visited: continue
+            visited.add(real_path)
+            files, dirs = self._list_dir(dir_path)
+            yield dir_path, files, dirs
+            stack.extend(os.path.join(dir_path, name) for name in reversed(dirs))
+
+    def _build(self):
+        """
+        Walks the working directory once and indexes its entries.
+        """
+        self._files, self._entries = [], {}
+        for dir_path, files, dirs in self.walk():
+            self._entries[dir_path] = (files, dirs)
+            self._files.extend(os.path.join(dir_path, name) for name in files)
+
+    @property
+    def files(self):
+        """
+        Returns the paths of all indexed files in walk order.
+
+        Returns:
+            list
+        """
+        if self._files is None: self._build()
+        return self._files
+
+    def _matches(self, pattern, regex=False, exact=False):
+        if regex:
+            pattern = re.compile(pattern)
+            return lambda name: pattern.search(name) is not None
+        if exact: return lambda name: name == pattern
+        return lambda name: pattern in name
+
+    def find_all(self, pattern, regex=False, exact=False):
+        """
+        Returns the paths of the files whose name matches a given pattern.
+
+        Args:
+            pattern (str): substring of the file name by default.
+            regex (bool): whether the pattern is a regular expression searched in the file name.
+            exact (bool): whether the pattern is the exact file name.
+
+        Returns:
+            list
+        """
+        matches = self._matches(pattern, regex, exact)
+        return [path for path in self.files if matches(os.path.basename(path))]
+
+    def find(self, pattern, regex=False, exact=False):
+        """
+        Returns the path of the first file whose name matches a given pattern, see `find_all`.
+
+        Returns:
+            str: None if there is no such file.
+        """
+        matches = self._matches(pattern, regex, exact)
+        return next((path for path in self.files if matches(os.path.basename(path))), None)
+
+    def list_dir(self, path=None, dirs=False):
+        """
+        Returns the names of the files (or directories) directly inside a given indexed directory.
+
+        Args:
+            path (str): directory path, the working directory by default.
+            dirs (bool): whether to return directory names instead of file names.
+
+        Returns:
+            list
+        """
+        if self._entries is None: self._build()
+        files_, dirs_ = self._entries.get(path or self.path, ([], []))
+        return list(dirs_ if dirs else files_)
+
+
+def map_file(file_path):
+    """
+    Maps a given file into memory in read-only mode. The returned object supports `find`, `rfind`, slicing and can be
+    scanned by the regex engine directly, hence the file content is never copied into a Python string as a whole.
+
+    Args:
+        file_path (str): file path.
+
+    Returns:
+        mmap.mmap: memory-mapped file content or an empty string if the file is empty.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0: return ""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
@@ -1,5 +1,82 @@
 from esse import ESSE
 from abc import abstractmethod
+from jsonschema.validators import validator_for
+
+from express import settings
+
+# ESSE instance shared by all properties.
+ESSE_INSTANCE = ESSE()
+
+# schemas keyed on schemaId.
+SCHEMAS = {}
+
+# validators with checked schemas keyed on schemaId.
+VALIDATORS = {}
+
+
+def get_schema(schema_id):
+    """
+    Returns the schema with a given id. Schemas are looked up once.
+
+    Args:
+        schema_id (str): schema id.
+
+    Returns:
+        dict
+    """
+    if schema_id not in SCHEMAS: SCHEMAS[schema_id] = ESSE_INSTANCE.get_schema_by_id(schema_id)
+    return SCHEMAS[schema_id]
+
+
+def get_validator(schema):
+    """
+    Returns the validator of a given schema. The schema is checked and its validator is created once per schemaId.
+
+    Args:
+        schema (dict): schema.
+
+    Returns:
+        jsonschema.IValidator
+    """
+    key = schema.get("schemaId") or id(schema)
+    if key not in VALIDATORS:
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        VALIDATORS[key] = cls(schema)
+    return VALIDATORS[key]
+
+
+def sample_instance(instance, size=settings.VALIDATION_SAMPLE_SIZE):
+    """
+    Returns a copy of a given instance in which lists longer than size are reduced to size evenly spaced items.
+
+    Args:
+        instance (dict|list): instance to sample.
+        size (int): maximum number of items in lists.
+
+    Returns:
+        dict|list
+    """
+    if isinstance(instance, dict): return dict((k, sample_instance(v, size)) for k, v in instance.items())
+    if isinstance(instance, list):
+        step = max(1, -(-len(instance) // size))
+        return [sample_instance(item, size) for item in instance[::step]]
+    return instance
+
+
+def sample_array(array, size=settings.VALIDATION_SAMPLE_SIZE):
+    """
+    Returns a given array as nested lists reduced to size evenly spaced items along each axis, the same as
+    `sample_instance` of the array converted to lists, without converting the whole array.
+
+    Args:
+        array (ndarray): array to sample.
+        size (int): maximum number of items along each axis.
+
+    Returns:
+        list
+    """
+    return array[tuple(slice(None, None, max(1, -(-n // size))) for n in array.shape)].tolist()
 
 
 class BaseProperty(object):
@@ -11,13 +88,17 @@ class BaseProperty(object):
         parser: an instance of parser class.
         args (list): property-specific args.
         kwargs (dict): property-specific kwargs.
+            validation_level (str): schema validation level, see `express.settings.VALIDATION_LEVELS`.
     """
 
     def __init__(self, name, parser, *args, **kwargs):
         self.name, self.parser = name, parser
         self.args, self.kwargs = args, kwargs
-        self.esse = ESSE()
+        self.esse = ESSE_INSTANCE
         self.manifest = self.esse.get_property_manifest(self.name)
+        self.validation_level = kwargs.get("validation_level", settings.VALIDATION_LEVEL)
+        if self.validation_level not in settings.VALIDATION_LEVELS:
+            raise ValueError("validation_level must be one of {0}".format(", ".join(settings.VALIDATION_LEVELS)))
 
     @abstractmethod
     def _serialize(self):
@@ -25,19 +106,41 @@ class BaseProperty(object):
 
     @property
     def schema(self):
-        return self.esse.get_schema_by_id(self.manifest["schemaId"])
+        return get_schema(self.manifest["schemaId"])
 
     def serialize_and_validate(self):
         """
         Serialize the property and validates it against the schema.
 
+        Validation level:
+            full: the whole instance is validated.
+            sampled: long lists are reduced to `settings.VALIDATION_SAMPLE_SIZE` items before validation.
+            off: the instance is not validated.
+
         Returns:
             dict
+
+        Raises:
+            jsonschema.exceptions.ValidationError
         """
         instance = self._serialize()
-        self.esse.validate(instance, self.schema)
+        self.validate(instance)
         return instance
 
+    def validate(self, instance):
+        """
+        Validates a given instance against the schema according to `validation_level`.
+
+        Args:
+            instance (dict): serialized property.
+
+        Raises:
+            jsonschema.exceptions.ValidationError
+        """
+        if self.validation_level == "off": return
+        sample = sample_instance(instance) if self.validation_level == "sampled" else instance
+        get_validator(self.schema).validate(sample)
+
     def safely_invoke_parser_method(self, method_name, *args, **kwargs):
         if hasattr(self.parser, method_name):
             return getattr(self.parser, method_name)(*args, **kwargs)
@@ -25,7 +25,9 @@ class Material(BaseProperty):
         if not structure_string:
             if kwargs.get("is_initial_structure"):
                 if isinstance(self.parser, VaspParser):
-                    with open(os.path.join(self.parser.work_dir, "POSCAR")) as f:
+                    file_path = os.path.join(self.parser.work_dir, "POSCAR")
+                    self.parser.read_files.add(os.path.abspath(file_path))
+                    with open(file_path) as f:
                         structure_string = f.read()
                 else:
                     basis = self.parser.initial_basis()
@@ -34,7 +36,9 @@ class Material(BaseProperty):
 
             if kwargs.get("is_final_structure"):
                 if isinstance(self.parser, VaspParser):
-                    with open(os.path.join(self.parser.work_dir, "CONTCAR")) as f:
+                    file_path = os.path.join(self.parser.work_dir, "CONTCAR")
+                    self.parser.read_files.add(os.path.abspath(file_path))
+                    with open(file_path) as f:
                         structure_string = f.read()
                 else:
                     basis = self.parser.final_basis()
@@ -56,9 +60,10 @@ class Material(BaseProperty):
     def derived_properties(self):
         derived_properties = []
         try:
-            volume = Volume("volume", self.parser).serialize_and_validate()
-            density = Density("density", self.parser).serialize_and_validate()
-            symmetry = Symmetry("symmetry", self.parser).serialize_and_validate()
+            kwargs = {"validation_level": self.validation_level}
+            volume = Volume("volume", self.parser, **kwargs).serialize_and_validate()
+            density = Density("density", self.parser, **kwargs).serialize_and_validate()
+            symmetry = Symmetry("symmetry", self.parser, **kwargs).serialize_and_validate()
             derived_properties = [volume, density, symmetry]
             derived_properties.extend(self._elemental_ratios())
             derived_properties.extend(self._p_norms())
@@ -113,7 +118,8 @@ class Material(BaseProperty):
         """
         elemental_ratios = []
         for element in self.parser.elemental_ratios().keys():
-            elemental_ratio = ElementalRatio("elemental_ratio", self.parser, element=element).serialize_and_validate()
+            elemental_ratio = ElementalRatio("elemental_ratio", self.parser, element=element,
+                                             validation_level=self.validation_level).serialize_and_validate()
             elemental_ratios.append(elemental_ratio)
         return elemental_ratios
 
@@ -129,7 +135,8 @@ class Material(BaseProperty):
         """
         p_norms = []
         for degree in [0, 2, 3, 5, 7, 10]:
-            p_norms.append(PNorm("p-norm", self.parser, degree=degree).serialize_and_validate())
+            p_norm = PNorm("p-norm", self.parser, degree=degree, validation_level=self.validation_level)
+            p_norms.append(p_norm.serialize_and_validate())
         return p_norms
 
     def _get_element_counts(self, basis):
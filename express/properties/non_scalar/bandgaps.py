@@ -1,8 +1,7 @@
 import numpy as np
 
-from copy import deepcopy
 from express import settings
-from express.properties.utils import eigenvalues
+from express.properties.utils import get_eigenvalue_data
 from express.properties.non_scalar import NonScalarProperty
 
 
@@ -19,12 +18,13 @@ class BandGaps(NonScalarProperty):
         super(BandGaps, self).__init__(name, parser, *args, **kwargs)
 
         self.values = None
+        self._bands_info = None
         self.nspins = self.safely_invoke_parser_method("nspins")
         self.ibz_k_points = self.safely_invoke_parser_method("ibz_k_points")
         self.fermi_energy = self.safely_invoke_parser_method("fermi_energy")
         self.band_gaps_direct = self.safely_invoke_parser_method("band_gaps_direct")
         self.band_gaps_indirect = self.safely_invoke_parser_method("band_gaps_indirect")
-        self.eigenvalues_at_kpoints = self.safely_invoke_parser_method("eigenvalues_at_kpoints")
+        self.eigenvalue_data = get_eigenvalue_data(self)
 
         if self.band_gaps_direct is not None and self.band_gaps_indirect is not None:
             self.values = [
@@ -35,7 +35,7 @@ class BandGaps(NonScalarProperty):
     def _serialize(self):
         return {
             'name': self.name,
-            'values': self.values if self.values else [self.compute_on_mesh(type_) for type_ in ["direct", "indirect"]],
+            'values': self.values if self.values else self._gaps_on_mesh(),
             'eigenvalues': self._eigenvalues() if not self.values else []
         }
 
@@ -46,6 +46,10 @@ class BandGaps(NonScalarProperty):
             'value': gap
         }
 
+    def _gaps_on_mesh(self):
+        gaps = self.compute_all_gaps()
+        return [gaps["direct"], gaps["indirect"]]
+
     def compute_on_mesh(self, type_="indirect"):
         """
         Calculates the band gap on the material's mesh.
@@ -56,21 +60,63 @@ class BandGaps(NonScalarProperty):
         Returns:
             dict
         """
+        return self.compute_all_gaps()[type_]
+
+    def compute_all_gaps(self):
+        """
+        Calculates direct and indirect band gaps on the material's mesh, in total and for each spin separately. Bands
+        information is extracted once and shared by all gaps.
+
+        Returns:
+            dict
+
+        Example:
+            {
+                'direct': {'type': 'direct', 'units': 'eV', 'value': 2.5, 'kpointValence': [0, 0, 0], ...},
+                'indirect': {'type': 'indirect', 'units': 'eV', 'value': 0.6, 'kpointValence': [0, 0, 0], ...},
+                'spins': [
+                    {
+                        'direct': {'type': 'direct', 'units': 'eV', 'value': 2.5, ...},
+                        'indirect': {'type': 'indirect', 'units': 'eV', 'value': 0.6, ...},
+                        'spin': 0.5
+                    },
+                    ...
+                ]
+            }
+        """
         nk, ns, N_sk, e_skn = self._get_bands_info()
         ev_sk, ec_sk = self._get_valence_conduction_bands(e_skn)
+        types = ["direct", "indirect"]
+
+        # spins are flattened into one (ns * nk) axis, kpoint index of a flat index is its remainder of nk division.
+        gaps = dict((t, self._gap_on_mesh(N_sk.ravel(), ev_sk.ravel(), ec_sk.ravel(), nk, t)) for t in types)
+        gaps["spins"] = []
+        for s in range(ns):
+            spin_gaps = dict((t, self._gap_on_mesh(N_sk[s], ev_sk[s], ec_sk[s], nk, t)) for t in types)
+            spin_gaps["spin"] = self.eigenvalue_data.spins[s]
+            gaps["spins"].append(spin_gaps)
+        return gaps
+
+    def _gap_on_mesh(self, N_k, ev_k, ec_k, nk, type_):
+        """
+        Finds the band gap of given bands and serializes it together with the valence and conduction kpoints.
 
-        if ns == 1:
-            gap, k1, k2 = self._find_gap(N_sk[0], ev_sk[0], ec_sk[0], type=type_)
-        else:
-            gap, k1, k2 = self._find_gap(N_sk.ravel(), ev_sk.ravel(), ec_sk.ravel(), type=type_)
-            k1 = divmod(k1, nk)
-            k2 = divmod(k2, nk)
+        Args:
+            N_k (ndarray): numbers of occupied bands.
+            ev_k (ndarray): valence band.
+            ec_k (ndarray): conduction band.
+            nk (int): number of kpoints.
+            type_ (str): band gap type, either direct or indirect.
 
+        Returns:
+            dict
+        """
+        gap, k1, k2 = self._find_gap(N_k, ev_k, ec_k, type=type_)
         result = self._serialize_band_gaps(gap, type_)
         if k1 is not None and k2 is not None:
             result.update({
-                'kpointValence': self._round(self.ibz_k_points[k1[1] if isinstance(k1, tuple) else k1]),
-                'kpointConduction': self._round(self.ibz_k_points[k2[1] if isinstance(k2, tuple) else k2])
+                'kpointValence': self._round(self.ibz_k_points[k1 % nk]),
+                'kpointConduction': self._round(self.ibz_k_points[k2 % nk])
             })
         return result
 
@@ -79,20 +125,26 @@ class BandGaps(NonScalarProperty):
         Extracts bands information:
             - number of kpoints (nk)
             - number of spins (ns)
-            - eigenvalue mesh (e_skn)
+            - highest occupied and lowest unoccupied eigenvalues relative to fermi energy (e_skn) with (ns, nk, 2) shape
             - number of occupied bands (N_sk)
 
+        Note: bands information is extracted once and reused by subsequent calls.
+
+        Note: band indices are clipped to the available bands, hence the lowest (highest) band is used as valence
+        (conduction) band at kpoints without occupied (unoccupied) bands.
+
         Returns:
             tuple: bands information containing nk, ns, e_skn and N_sk explained above.
 
         """
-        nk = len(self.ibz_k_points)
-        ns = self.nspins
-        e_skn = np.array([[eigenvalues(self.eigenvalues_at_kpoints, k, s) for k in range(nk)] for s in range(ns)])
-        e_skn -= self.fermi_energy
-        N_sk = (e_skn < 0.0).sum(2)
-        e_skn = np.array([[e_skn[s, k, N_sk[s, k] - 1:N_sk[s, k] + 1] for k in range(nk)] for s in range(ns)])
-        return nk, ns, N_sk, e_skn
+        if self._bands_info is None:
+            nk = len(self.ibz_k_points)
+            ns = self.nspins
+            e_skn = self.eigenvalue_data.energies[:ns, :nk] - self.fermi_energy
+            N_sk = (e_skn < 0.0).sum(2)
+            band_indices = np.clip(N_sk[:, :, np.newaxis] + np.array([-1, 0]), 0, e_skn.shape[2] - 1)
+            self._bands_info = nk, ns, N_sk, np.take_along_axis(e_skn, band_indices, axis=2)
+        return self._bands_info
 
     def _get_valence_conduction_bands(self, e_skn):
         """
@@ -134,22 +186,44 @@ class BandGaps(NonScalarProperty):
         """
         Extracts eigenvalues between last value in occupation 1 and first value in occupation 0.
 
+        Note: only the trimmed eigenvalues are converted to lists, windows are found on the occupation arrays.
+
         Returns:
              dict
         """
-        eigens_at_kpoints = deepcopy(self.eigenvalues_at_kpoints)
-        for eigens_at_kpoint in eigens_at_kpoints:
-            eigens_at_kpoint["kpoint"] = self._round(eigens_at_kpoint["kpoint"])
-            for eigens_at_spin in eigens_at_kpoint["eigenvalues"]:
-                eigens_at_spin["energies"] = self._round(eigens_at_spin["energies"])
-                eigens_at_spin["occupations"] = self._round(eigens_at_spin["occupations"])
-                # occupations are empty in case of QE GW, hence sending all values.
-                if len(eigens_at_spin["occupations"]) == 0: continue
-                start = max(0, len(eigens_at_spin["occupations"]) - eigens_at_spin["occupations"][::-1].index(1.0) - 2)
-                end = min(len(eigens_at_spin["occupations"]), eigens_at_spin["occupations"].index(0.0) + 2)
-                eigens_at_spin["energies"] = eigens_at_spin["energies"][start:end]
-                eigens_at_spin["occupations"] = eigens_at_spin["occupations"][start:end]
-        return eigens_at_kpoints
+        data = self.eigenvalue_data
+        kpoints, weights = self._round(data.kpoints), data.weights.tolist()
+        starts, ends = self._occupation_windows()
+        return [{
+            'kpoint': kpoints[k],
+            'weight': weights[k],
+            'eigenvalues': [{
+                'energies': self._round(data.energies[s, k, starts[s, k]:ends[s, k]]),
+                'occupations': self._round(data.occupations[s, k, starts[s, k]:ends[s, k]]),
+                'spin': spin
+            } for s, spin in enumerate(data.spins)]
+        } for k in range(data.nkpoints)]
+
+    def _occupation_windows(self):
+        """
+        Finds the band windows from one band below the last fully occupied band to one band above the first empty band.
+        Occupations are compared after rounding to `settings.PRECISION`. Windows start at the first band if there are
+        no fully occupied bands and end at the last band if there are no empty bands.
+
+        Note: occupations are empty in case of QE GW, hence all bands are included.
+
+        Returns:
+            tuple: start and end band indices with (ns, nk) shape.
+        """
+        occupations = np.round(self.eigenvalue_data.occupations, settings.PRECISION)
+        nbands = self.eigenvalue_data.energies.shape[2]
+        if occupations.shape[2] == 0:
+            shape = self.eigenvalue_data.energies.shape[:2]
+            return np.zeros(shape, dtype=int), np.full(shape, nbands, dtype=int)
+        occupied, empty = occupations == 1.0, occupations == 0.0
+        last_occupied = np.where(occupied.any(2), nbands - 1 - occupied[:, :, ::-1].argmax(2), 0)
+        first_empty = np.where(empty.any(2), empty.argmax(2), nbands)
+        return np.maximum(0, last_occupied - 1), np.minimum(nbands, first_empty + 2)
 
     def _round(self, array):
         return np.round(array, settings.PRECISION).tolist()
@@ -1,9 +1,26 @@
+import os
+import hashlib
+import numpy as np
+
+from express.properties import sample_array
+from express.properties.utils import encode_array
 from express.properties.non_scalar import NonScalarProperty
+from express.settings import PLOT_DATA_DTYPE, PLOT_DATA_ENCODINGS, PLOT_DATA_FILE_SUFFIX
+
+PLOT_DATA_KEYS = ["xDataArray", "yDataSeries"]
 
 
 class TwoDimensionalPlotProperty(NonScalarProperty):
     """
     Base 2D-plot property class.
+
+    xDataArray and yDataSeries are set by subclasses as nested lists or numpy arrays and serialized as nested lists by
+    default. Compact output is enabled by passing `data_encoding` kwarg, see `express.settings.PLOT_DATA_ENCODINGS`:
+        - base64: data is embedded as base64 string of little-endian float32 buffer.
+        - npy: data is stored in "<name>.<key>.<content hash>.plot.npy" files inside `data_dir` (working directory of
+          the parser by default), hence concurrent jobs never overwrite each other's files.
+    Data is encoded from the arrays directly, without converting them to nested lists. Ragged data is kept as nested
+    lists.
     """
 
     def __init__(self, name, parser, *args, **kwargs):
@@ -11,6 +28,20 @@ class TwoDimensionalPlotProperty(NonScalarProperty):
         self.legend = None
         self.xDataArray = None
         self.yDataSeries = None
+        self.data_encoding = kwargs.get("data_encoding")
+        self.data_dir = kwargs.get("data_dir") or self._get_default_data_dir()
+        if self.data_encoding and self.data_encoding not in PLOT_DATA_ENCODINGS:
+            raise ValueError("data_encoding must be one of {0}".format(", ".join(PLOT_DATA_ENCODINGS)))
+
+    def _get_default_data_dir(self):
+        """
+        Returns the working directory of the parser, the current directory if the parser has none.
+
+        Returns:
+            str
+        """
+        work_dir = getattr(self.parser, "work_dir", None)
+        return work_dir if isinstance(work_dir, basestring) and os.path.isdir(work_dir) else os.getcwd()
 
     def _serialize(self):
         serialized_data = {
@@ -23,3 +54,60 @@ class TwoDimensionalPlotProperty(NonScalarProperty):
         if self.legend:
             serialized_data.update({"legend": self.legend})
         return serialized_data
+
+    def serialize_and_validate(self):
+        """
+        Serialize the property, encodes the data if `data_encoding` is set and validates it against the schema.
+
+        Note: encoded data is validated on a sample of its values (see `express.properties.sample_array`), as encoding
+        already guarantees a rectangular array of numbers.
+
+        Returns:
+            dict
+        """
+        instance = self._serialize()
+        sample = dict(instance)
+        for key in PLOT_DATA_KEYS:
+            array = self._to_array(instance[key]) if self.data_encoding else None
+            if array is None:
+                data = instance[key]
+                instance[key] = sample[key] = data.tolist() if isinstance(data, np.ndarray) else data
+            else:
+                instance[key] = self._encode_data(key, array)
+                sample[key] = sample_array(array)
+        self.validate(sample)
+        return instance
+
+    def _to_array(self, data):
+        """
+        Converts given data to an array of `PLOT_DATA_DTYPE`.
+
+        Args:
+            data (list|ndarray): data to convert.
+
+        Returns:
+            ndarray: None if the data is ragged or not an array.
+        """
+        try:
+            array = np.asarray(data, dtype=PLOT_DATA_DTYPE)
+        except (TypeError, ValueError):
+            return None
+        return array if array.ndim else None
+
+    def _encode_data(self, key, array):
+        """
+        Encodes a given array with `data_encoding`.
+
+        Args:
+            key (str): data key, xDataArray or yDataSeries.
+            array (ndarray): array of `PLOT_DATA_DTYPE` to encode.
+
+        Returns:
+            dict
+        """
+        file_path = None
+        if self.data_encoding == "npy":
+            digest = hashlib.sha1(str(array.shape) + array.tobytes()).hexdigest()[:16]
+            file_name = "{0}.{1}.{2}{3}".format(self.name, key, digest, PLOT_DATA_FILE_SUFFIX)
+            file_path = os.path.join(self.data_dir, file_name)
+        return encode_array(array, self.data_encoding, file_path)
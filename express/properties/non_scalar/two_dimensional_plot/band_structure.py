@@ -1,6 +1,6 @@
 import numpy as np
 
-from express.properties.utils import eigenvalues
+from express.properties.utils import get_eigenvalue_data
 from express.settings import ZERO_WEIGHT_KPOINT_THRESHOLD
 from express.properties.non_scalar.two_dimensional_plot import TwoDimensionalPlotProperty
 
@@ -18,27 +18,43 @@ class BandStructure(TwoDimensionalPlotProperty):
         super(BandStructure, self).__init__(name, parser, *args, **kwargs)
         self.nspins = self.parser.nspins()
 
-        self.eigenvalues_at_kpoints = self.parser.eigenvalues_at_kpoints()
-        if kwargs.get("remove_non_zero_weight_kpoints", False):
-            self.eigenvalues_at_kpoints = [e for e in self.eigenvalues_at_kpoints if e['weight'] <= ZERO_WEIGHT_KPOINT_THRESHOLD]
+        self.eigenvalue_data = get_eigenvalue_data(self)
+        self.kpoint_indices = self._get_kpoint_indices(kwargs.get("remove_non_zero_weight_kpoints", False))
 
-        self.nkpoints = len(self.eigenvalues_at_kpoints)
+        kpoints = self.eigenvalue_data.kpoints[self.kpoint_indices]
+        self.nkpoints = len(kpoints)
         self.bands = self._get_band()
-        self.xDataArray = [eigenvalueData["kpoint"] for eigenvalueData in self.eigenvalues_at_kpoints]
-        self.yDataSeries = self.bands.tolist()
+        self.xDataArray = kpoints
+        self.yDataSeries = self.bands
 
     def _serialize(self):
         data = super(BandStructure, self)._serialize()
         data.update({'spin': [0.5, -0.5] * len(self.bands) if self.nspins > 1 else [0.5] * len(self.bands)})
         return data
 
+    def _get_kpoint_indices(self, remove_non_zero_weight_kpoints=False):
+        """
+        Returns indices of the kpoints to include in the band structure.
+
+        Args:
+            remove_non_zero_weight_kpoints (bool): whether to exclude kpoints with non-zero weights, e.g. HSE self
+                consistent kpoints.
+
+        Returns:
+            slice|ndarray: a slice over all kpoints or the indices of zero weight kpoints.
+        """
+        if not remove_non_zero_weight_kpoints: return slice(None)
+        return np.flatnonzero(self.eigenvalue_data.weights <= ZERO_WEIGHT_KPOINT_THRESHOLD)
+
     def _get_band(self):
         """
-        Returns bands.
+        Returns bands with (nbands * nspins, nkpoints) shape, rows are ordered by band and then by spin.
+
+        Note: kpoints are selected on the (band, spin, kpoint) view of the eigenvalue tensor, hence the eigenvalues are
+        copied once into the resulting array.
 
         Returns:
             ndarray
         """
-        bands = np.array([[eigenvalues(self.eigenvalues_at_kpoints, k, s) for s in range(self.nspins)] for k in range(self.nkpoints)])
-        bands = np.transpose(bands).reshape(len(bands[0][0]) * self.nspins, self.nkpoints)
-        return bands
+        bands = self.eigenvalue_data.energies.transpose(2, 0, 1)[:, :self.nspins, self.kpoint_indices]
+        return bands.reshape(bands.shape[0] * bands.shape[1], self.nkpoints)
@@ -1,3 +1,25 @@
+import os
+import base64
+import tempfile
+import numpy as np
+
+from express.settings import PLOT_DATA_DTYPE
+from express.parsers.eigenvalues import EigenvalueData
+
+
+def to_array_with_ids(array):
+    """
+    Converts a given array to an array of objects with id.
+
+    Args:
+        array (list): array to convert
+
+    Returns:
+        list
+    """
+    return [{"id": index + 1, "value": value} for index, value in enumerate(array)]
+
+
 def eigenvalues(eigenvalues_at_kpoints, kpoint_index=0, spin_index=0):
     """
     Returns eigenvalues for a given kpoint and spin.
@@ -8,22 +30,67 @@ def eigenvalues(eigenvalues_at_kpoints, kpoint_index=0, spin_index=0):
         spin_index (int): spin index.
 
     Returns:
-         ndarray
+         list: None if there are no eigenvalues for the given spin.
     """
-    spin_map = {0: 0.5, 1: -0.5}
-    for eigenvalue in eigenvalues_at_kpoints[kpoint_index]["eigenvalues"]:
-        if eigenvalue['spin'] == spin_map[spin_index]:
-            return eigenvalue['energies']
+    data = EigenvalueData.from_list(eigenvalues_at_kpoints[kpoint_index:kpoint_index + 1])
+    spin = {0: 0.5, 1: -0.5}[spin_index]
+    if spin in data.spins: return data.energies[data.spins.index(spin), 0].tolist()
 
 
-def to_array_with_ids(array):
+def get_eigenvalue_data(property_):
     """
-    Converts a given array to an array of objects with id.
+    Returns eigenvalues for all kpoints of the parser of a given property in columnar form. Parser methods are invoked
+    through `safely_invoke_parser_method`, parsers not implementing `eigenvalue_data` are supported by converting the
+    result of `eigenvalues_at_kpoints`.
 
     Args:
-        array (list): array to convert
+        property_ (express.properties.BaseProperty): property instance.
 
     Returns:
-        list
+         EigenvalueData: None if the parser does not provide eigenvalues.
     """
-    return [{"id": index + 1, "value": value} for index, value in enumerate(array)]
+    eigenvalue_data = property_.safely_invoke_parser_method("eigenvalue_data")
+    if isinstance(eigenvalue_data, EigenvalueData): return eigenvalue_data
+    eigenvalues_at_kpoints = property_.safely_invoke_parser_method("eigenvalues_at_kpoints")
+    if eigenvalues_at_kpoints is not None: return EigenvalueData.from_list(eigenvalues_at_kpoints)
+
+
+def encode_array(array, encoding, file_path=None):
+    """
+    Encodes a given rectangular array into a compact form holding little-endian float32 values.
+
+    Args:
+        array (list|ndarray): array to encode.
+        encoding (str): either "base64" to embed the raw buffer or "npy" to store the array in a .npy file.
+        file_path (str): path to the .npy file, required for "npy" encoding. The file is written to a temporary file
+            which is then renamed, hence concurrent writers never leave a partially written file.
+
+    Returns:
+        dict
+
+    Example:
+        {
+            'encoding': 'base64',
+            'dtype': '<f4',
+            'shape': [2, 3],
+            'data': 'AACAPwAAAEAAAEBAAACAQAAAoEAAAMBA'
+        }
+    """
+    array = np.asarray(array, dtype=PLOT_DATA_DTYPE)
+    encoded = {'encoding': encoding, 'dtype': PLOT_DATA_DTYPE, 'shape': list(array.shape)}
+    if encoding == "base64":
+        encoded['data'] = base64.b64encode(array.tobytes())
+    elif encoding == "npy":
+        fd, temp_path = tempfile.mkstemp(suffix=".npy", dir=os.path.dirname(os.path.abspath(file_path)))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, array)
+            os.chmod(temp_path, 0o644)
+            os.rename(temp_path, file_path)
+        except:
+            if os.path.exists(temp_path): os.remove(temp_path)
+            raise
+        encoded['path'] = file_path
+    else:
+        raise ValueError("unknown encoding: {0}".format(encoding))
+    return encoded
@@ -1,3 +1,5 @@
+from express.parsers.settings import XML_INDEX_FILE_SUFFIX
+
 ZERO_WEIGHT_KPOINT_THRESHOLD = 1e-7
 
 SCALAR_PROPERTIES_MANIFEST = {
@@ -109,3 +111,37 @@ PARSERS_REGISTRY = {
 }
 
 PRECISION = 4
+
+# encodings of compact 2D plot data (xDataArray and yDataSeries), see `TwoDimensionalPlotProperty`.
+PLOT_DATA_ENCODINGS = ["base64", "npy"]
+
+# numpy dtype of compact 2D plot data, little-endian float32.
+PLOT_DATA_DTYPE = "<f4"
+
+# suffix of the .npy files of 2D plot data encoded with "npy" encoding.
+PLOT_DATA_FILE_SUFFIX = ".plot.npy"
+
+# levels of schema validation of properties, see `BaseProperty.serialize_and_validate`.
+VALIDATION_LEVELS = ["full", "sampled", "off"]
+
+# default schema validation level, overridden by `validation_level` kwarg of properties.
+VALIDATION_LEVEL = "full"
+
+# maximum number of items of lists validated with "sampled" validation level.
+VALIDATION_SAMPLE_SIZE = 10
+
+# number of jobs a bulk extraction worker process handles before it is replaced, see `express.bulk`.
+BULK_MAX_TASKS_PER_CHILD = 50
+
+# interval (in seconds) at which bulk extraction worker processes are checked for being alive, see `express.bulk`.
+BULK_WORKER_POLL_INTERVAL = 1.0
+
+# maximum total size (in bytes) of results stored in the persistent property cache, see `express.cache`.
+PROPERTY_CACHE_MAX_SIZE = 1024 ** 3
+
+# name of the SQLite database of the persistent property cache inside the cache directory.
+PROPERTY_CACHE_FILE = "properties.sqlite"
+
+# suffixes of the files written into job directories by express itself, e.g. XML index sidecars. They are derived from
+# the input files, hence ignored when the working directory listing is hashed into property cache keys.
+GENERATED_FILE_SUFFIXES = [XML_INDEX_FILE_SUFFIX, PLOT_DATA_FILE_SUFFIX]
@@ -8,6 +8,11 @@ setup(
     author='Exabyte Inc.',
     author_email='info@exabyte.io',
     packages=find_packages(exclude=["tests.*", "tests"]),
+    entry_points={
+        'console_scripts': [
+            'express-bulk=express.bulk:main',
+        ],
+    },
     install_requires=[
         "mock==1.3.0",
         "bunch==1.0.1",
@@ -16,6 +21,7 @@ setup(
         "pymatgen==2018.5.3",
         "ase==3.17.0",
         "esse==2.2.0",
+        "scandir==1.10.0; python_version < '3.5'",
     ],
     classifiers=[
         'Programming Language :: Python',
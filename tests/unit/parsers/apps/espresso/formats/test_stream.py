@@ -0,0 +1,130 @@
+import os
+import shutil
+import tempfile
+
+from tests.unit import UnitTestBase
+from express.parsers.apps.espresso.formats.txt import EspressoTXTParser
+from express.parsers.apps.espresso.formats.stream import EspressoConvergenceStream
+
+STDOUT = """
+     lattice parameter (alat)  =      10.2000  a.u.
+     number of atoms/cell      =            2
+     crystal axes: (cart. coord. in units of alat)
+               a(1) = (  -0.500000   0.000000   0.500000 )
+               a(2) = (   0.000000   0.500000   0.500000 )
+               a(3) = (  -0.500000   0.500000   0.000000 )
+
+     site n.     atom                  positions (alat units)
+         1           Si  tau(   1) = (   0.0000000   0.0000000   0.0000000  )
+         2           Si  tau(   2) = (   0.2500000   0.2500000   0.2500000  )
+
+     Self-consistent Calculation
+
+     iteration #  1     ecut=    30.00 Ry     beta= 0.70
+     total energy              =     -15.71343642 Ry
+     estimated scf accuracy    <       0.76377462 Ry
+
+     iteration #  2     ecut=    30.00 Ry     beta= 0.70
+     total energy              =     -15.72550690 Ry
+     estimated scf accuracy    <       0.04494911 Ry
+
+     End of self-consistent calculation
+
+!    total energy              =     -15.84000000 Ry
+     estimated scf accuracy    <       0.00000049 Ry
+
+     convergence has been achieved in   2 iterations
+
+     Writing output data file ./__prefix__.save/
+
+     BFGS Geometry Optimization
+
+     new unit-cell volume =    265.30 a.u.^3 (    39.31 Ang^3 )
+
+CELL_PARAMETERS (angstrom)
+  -2.700000000   0.000000000   2.700000000
+   0.000000000   2.700000000   2.700000000
+  -2.700000000   2.700000000   0.000000000
+
+ATOMIC_POSITIONS (crystal)
+Si            0.0000000000        0.0000000000        0.0000000000
+Si            0.2500000000        0.2500000000        0.2500000000
+
+     Self-consistent Calculation
+
+     iteration #  1     ecut=    30.00 Ry     beta= 0.70
+     total energy              =     -15.74327671 Ry
+     estimated scf accuracy    <       0.00210605 Ry
+
+     iteration #  2     ecut=    30.00 Ry     beta= 0.70
+     total energy              =     -15.74453872 Ry
+     estimated scf accuracy    <       0.02287622 Ry
+
+     End of self-consistent calculation
+
+!    total energy              =     -15.84100000 Ry
+     estimated scf accuracy    <       0.00000049 Ry
+
+     convergence has been achieved in   2 iterations
+
+     Writing output data file ./__prefix__.save/
+
+"""
+
+
+class EspressoConvergenceStreamTest(UnitTestBase):
+    def setUp(self):
+        super(EspressoConvergenceStreamTest, self).setUp()
+        self.tempDir = tempfile.mkdtemp()
+        self.filePath = os.path.join(self.tempDir, "pw.out")
+        self.parser = EspressoTXTParser(self.tempDir)
+        self.stream = EspressoConvergenceStream(self.parser, self.filePath)
+
+    def tearDown(self):
+        super(EspressoConvergenceStreamTest, self).setUp()
+        shutil.rmtree(self.tempDir)
+
+    def write(self, content):
+        with open(self.filePath, "w") as f:
+            f.write(content)
+
+    def test_growing_file_matches_full_text_parser(self):
+        for end in range(0, len(STDOUT), 97) + [len(STDOUT)]:
+            self.write(STDOUT[:end])
+            self.stream.update()
+            text = STDOUT[:STDOUT[:end].rfind("\n") + 1]
+            self.assertEqual(self.stream.convergence_electronic(), self.parser.convergence_electronic(text))
+            if "Self-consistent Calculation" in text:
+                self.assertEqual(self.stream.convergence_ionic(), self.parser.convergence_ionic(text))
+        self.assertEqual(len(self.stream.convergence_ionic()), 2)
+        self.assertEqual(self.stream.offset, len(STDOUT))
+
+    def test_partial_line_is_not_consumed(self):
+        self.write(STDOUT[:STDOUT.find("0.76377462")])
+        self.stream.update()
+        self.assertEqual(self.stream.convergence_electronic(), [])
+        self.write(STDOUT)
+        self.stream.update()
+        self.assertEqual(len(self.stream.convergence_electronic()), 2)
+
+    def test_state_is_reset_when_file_shrinks(self):
+        self.write(STDOUT)
+        self.stream.update()
+        self.write(STDOUT[:STDOUT.find("BFGS Geometry Optimization")])
+        self.stream.update()
+        self.assertEqual(len(self.stream.convergence_ionic()), 1)
+
+    def test_state_is_reset_when_file_is_overwritten(self):
+        self.write(STDOUT[:STDOUT.find("BFGS Geometry Optimization")])
+        self.stream.update()
+        text = STDOUT.replace("10.2000", "10.4000")
+        self.write(text)
+        self.stream.update()
+        self.assertEqual(self.stream.convergence_ionic(), self.parser.convergence_ionic(text))
+
+    def test_file_is_read_in_chunks(self):
+        stream = EspressoConvergenceStream(self.parser, self.filePath, chunk_size=64)
+        self.write(STDOUT)
+        stream.update()
+        self.assertEqual(stream.convergence_electronic(), self.parser.convergence_electronic(STDOUT))
+        self.assertEqual(stream.convergence_ionic(), self.parser.convergence_ionic(STDOUT))
@@ -0,0 +1,46 @@
+import os
+import shutil
+import tempfile
+
+from tests.unit import UnitTestBase
+from express.parsers.apps.espresso.formats.xml import EspressoXMLParser, get_loading_pool
+
+EIGENVAL_XML = """<?xml version="1.0"?>
+<Root>
+  <EIGENVALUES type="real" size="2">{0}</EIGENVALUES>
+  <OCCUPATIONS type="real" size="2">1.0 0.0</OCCUPATIONS>
+</Root>
+"""
+
+
+class EspressoXMLParserTest(UnitTestBase):
+    def setUp(self):
+        super(EspressoXMLParserTest, self).setUp()
+        self.tempDir = tempfile.mkdtemp()
+        self.eigenvalFiles = []
+        for index in range(4):
+            self.eigenvalFiles.append(os.path.join(self.tempDir, "eigenval{0}.xml".format(index)))
+            with open(self.eigenvalFiles[-1], "w") as f:
+                f.write(EIGENVAL_XML.format("-{0}.0 {0}.0".format(index)))
+
+    def tearDown(self):
+        super(EspressoXMLParserTest, self).setUp()
+        shutil.rmtree(self.tempDir)
+
+    def test_eigenvalue_files_are_loaded_in_order(self):
+        sequential = EspressoXMLParser(None, 1)._parse_eigenvalue_files(self.eigenvalFiles)
+        parser = EspressoXMLParser(None, 2)
+        self.assertEqual(parser._parse_eigenvalue_files(self.eigenvalFiles), sequential)
+        self.assertEqual(sequential[1], ([-1.0, 1.0], [1.0, 0.0]))
+        self.assertEqual(parser.read_files, set(self.eigenvalFiles))
+
+    def test_loading_pool_is_reused(self):
+        self.assertIs(get_loading_pool(2), get_loading_pool(2))
+
+    def test_missing_spin_channel_is_rejected(self):
+        parser = EspressoXMLParser(None)
+        with self.assertRaises(ValueError):
+            parser._check_eigenvalue_shapes([[[1.0], [1.0]], [[1.0], None]], [[[1.0], [1.0]], [[1.0], None]])
+        with self.assertRaises(ValueError):
+            parser._check_eigenvalue_shapes([[[1.0], [1.0, 2.0]]], [[[1.0], [1.0, 0.0]]])
+        parser._check_eigenvalue_shapes([[[1.0], [2.0]], [[1.0], [2.0]]], [[[1.0], [0.0]], [[1.0], [0.0]]])
@@ -0,0 +1,49 @@
+import os
+import shutil
+import tempfile
+
+from tests.unit import UnitTestBase
+from express.parsers.apps.espresso.parser import EspressoParser
+
+STDOUT = """
+     Program PWSCF v.6.3 starts on 13Jun2019 at 12:00:00
+
+!    total energy              =     -19.10845646 Ry
+"""
+
+
+class EspressoParserTest(UnitTestBase):
+    def setUp(self):
+        super(EspressoParserTest, self).setUp()
+        self.tempDir = tempfile.mkdtemp()
+        self.stdoutFile = os.path.join(self.tempDir, "pw.out")
+        with open(self.stdoutFile, "w") as f:
+            f.write(STDOUT)
+
+    def tearDown(self):
+        super(EspressoParserTest, self).setUp()
+        shutil.rmtree(self.tempDir)
+
+    def get_parser(self):
+        return EspressoParser(work_dir=self.tempDir, stdout_file=self.stdoutFile)
+
+    def test_xml_parser_is_constructed_lazily(self):
+        parser = self.get_parser()
+        self.assertAlmostEqual(parser.total_energy(), -259.98388455)
+        self.assertIsNone(parser._xml_parser)
+        self.assertIsNone(parser.work_dir_index._files)
+        self.assertIs(parser.xml_parser, parser.xml_parser)
+        self.assertIsNone(parser.xml_parser.xml_path)
+
+    def test_run_metadata(self):
+        metadata = self.get_parser().run_metadata()
+        self.assertEqual((metadata["code"], metadata["version"]), ("pwscf", "6.3"))
+        self.assertFalse(metadata["is_sternheimer_gw"])
+
+    def test_run_metadata_is_probed_once(self):
+        parser = self.get_parser()
+        metadata = parser.run_metadata()
+        with open(self.stdoutFile, "w") as f:
+            f.write(" SternheimerGW\n")
+        self.assertIs(parser.run_metadata(), metadata)
+        self.assertTrue(self.get_parser().run_metadata()["is_sternheimer_gw"])
@@ -0,0 +1,40 @@
+import os
+import shutil
+import tempfile
+
+from mock import MagicMock, patch
+
+from tests.unit import UnitTestBase
+from express.parsers.apps.vasp.parser import VaspParser
+from express.parsers.apps.vasp.formats.xml import VaspXMLParser
+
+
+class VaspParserTest(UnitTestBase):
+    def setUp(self):
+        super(VaspParserTest, self).setUp()
+        self.tempDir = tempfile.mkdtemp()
+        self.stdoutFile = os.path.join(self.tempDir, "vasp.out")
+        for file_name in ["vasp.out", "vasprun.xml.index.json"]:
+            open(os.path.join(self.tempDir, file_name), "w").close()
+
+    def tearDown(self):
+        super(VaspParserTest, self).setUp()
+        shutil.rmtree(self.tempDir)
+
+    def get_parser(self):
+        return VaspParser(work_dir=self.tempDir, stdout_file=self.stdoutFile)
+
+    def test_xml_index_file_is_not_taken_for_vasprun(self):
+        self.assertIsNone(self.get_parser().xml_parser.xml_path)
+
+    def test_vasprun_is_found(self):
+        xml_path = os.path.join(self.tempDir, "vasprun.xml")
+        open(xml_path, "w").close()
+        self.assertEqual(self.get_parser().xml_parser.xml_path, xml_path)
+
+    def test_eigenvalue_data_is_parsed_once(self):
+        parser = self.get_parser()
+        with patch.object(VaspXMLParser, "_parse_eigenvalue_data", return_value=MagicMock()) as parse:
+            parser.ibz_k_points()
+            parser.eigenvalue_data()
+        self.assertEqual(parse.call_count, 1)
@@ -0,0 +1,45 @@
+from tests.unit import UnitTestBase
+from express.parsers.formats.txt import BaseTXTParser
+from express.parsers.apps.espresso.settings import REGEX
+from express.parsers.formats.extractor import RegexTableExtractor
+
+STDOUT = """
+     lattice parameter (alat)  =      10.2000  a.u.
+     number of atoms/cell      =            2
+     total energy              =     -15.79103983 Ry
+     estimated scf accuracy    <       0.06375741 Ry
+     total energy              =     -15.80239000 Ry
+     estimated scf accuracy    <       0.00219289 Ry
+
+!    total energy              =     -15.84104000 Ry
+     estimated scf accuracy    <       0.00000049 Ry
+
+     Forces acting on atoms (cartesian axes, Ry/au):
+
+     atom    1 type  1   force =     0.00100000    0.00000000   -0.00100000
+     atom    2 type  1   force =    -0.00100000    0.00000000    0.00100000
+
+     Total force =     0.002000     Total SCF correction =     0.000000
+
+          total   stress  (Ry/bohr**3)                   (kbar)     P=      -12.34
+  -0.00008400   0.00000000   0.00000000        -12.34        0.00        0.00
+   0.00000000  -0.00008400   0.00000000          0.00      -12.34        0.00
+   0.00000000   0.00000000  -0.00008400          0.00        0.00      -12.34
+"""
+
+
+class RegexTableExtractorTest(UnitTestBase):
+    def setUp(self):
+        super(RegexTableExtractorTest, self).setUp()
+
+    def tearDown(self):
+        super(RegexTableExtractorTest, self).setUp()
+
+    def test_extract_matches_general_output_parser(self):
+        parser = BaseTXTParser(None)
+        results = RegexTableExtractor(REGEX).extract(STDOUT)
+        for name, value in results.items():
+            self.assertEqual(value, parser._general_output_parser(STDOUT, **REGEX[name]))
+        self.assertEqual(results["total_energy"], -15.84104)
+        self.assertEqual(results["forces_on_atoms"], [[0.001, 0.0, -0.001], [-0.001, 0.0, 0.001]])
+        self.assertEqual(results["pressure"], -12.34)
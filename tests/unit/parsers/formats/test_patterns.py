@@ -0,0 +1,29 @@
+import re
+
+from tests.unit import UnitTestBase
+from express.parsers.apps.espresso.settings import REGEX
+from express.parsers.formats.patterns import RegexRegistry, compile_pattern
+
+
+class RegexRegistryTest(UnitTestBase):
+    def setUp(self):
+        super(RegexRegistryTest, self).setUp()
+
+    def tearDown(self):
+        super(RegexRegistryTest, self).setUp()
+
+    def test_compile_pattern_is_memoized(self):
+        self.assertIs(compile_pattern(r"\d+", re.I), compile_pattern(r"\d+", re.I))
+        self.assertIsNot(compile_pattern(r"\d+", re.I), compile_pattern(r"\d+"))
+
+    def test_entry_factory_is_memoized(self):
+        registry = RegexRegistry(REGEX)
+        self.assertIs(registry.entry("basis_alat", 2), registry.entry("basis_alat", 2))
+        self.assertEqual(registry.entry("basis_alat", 3)["occurrences"], 3)
+        self.assertIs(registry.pattern("basis_alat", None, 2), compile_pattern(REGEX["basis_alat"](2)["regex"],
+                                                                                re.I | re.MULTILINE))
+
+    def test_pattern_flags(self):
+        registry = RegexRegistry(REGEX)
+        self.assertEqual(registry.pattern("bfgs_block", re.DOTALL).flags & re.DOTALL, re.DOTALL)
+        self.assertEqual(registry.pattern("bfgs_block").flags & re.I, re.I)
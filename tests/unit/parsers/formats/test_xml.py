@@ -0,0 +1,84 @@
+import os
+import shutil
+import tempfile
+import xml.etree.ElementTree as ET
+
+from tests.unit import UnitTestBase
+from express.parsers.formats.xml import BaseXMLParser, decode_rows
+from express.parsers.settings import XML_INDEX_FILE_SUFFIX
+
+XML = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<modeling>
+ <generator><i name="program">vasp</i></generator>
+ <calculation>
+  <scstep><i name="e">-1.0</i></scstep>
+  <dos><i name="efermi">1.0</i></dos>
+ </calculation>
+ <calculation>
+  <scstep><i name="e">-2.0</i></scstep>
+  <dos><i name="efermi">2.0</i></dos>
+ </calculation>
+</modeling>
+"""
+
+
+class StreamingXMLParser(BaseXMLParser):
+    STREAMING_PATHS = ["calculation/dos"]
+
+
+class IndexedXMLParser(BaseXMLParser):
+    INDEXED_TAGS = ["calculation", "dos"]
+
+
+class BaseXMLParserTest(UnitTestBase):
+    def setUp(self):
+        super(BaseXMLParserTest, self).setUp()
+        self.tempDir = tempfile.mkdtemp()
+        self.filePath = os.path.join(self.tempDir, "vasprun.xml")
+        with open(self.filePath, "w") as f:
+            f.write(XML)
+
+    def tearDown(self):
+        super(BaseXMLParserTest, self).setUp()
+        shutil.rmtree(self.tempDir)
+
+    def test_root_is_parsed_lazily(self):
+        parser = BaseXMLParser(self.filePath)
+        self.assertIsNone(parser._root)
+        self.assertEqual(len(parser.root.findall("calculation")), 2)
+
+    def test_streaming_root_keeps_last_step_of_streaming_paths_only(self):
+        root = StreamingXMLParser(self.filePath).root
+        self.assertEqual([element.tag for element in root], ["calculation"])
+        self.assertEqual([element.tag for element in root.find("calculation")], ["dos"])
+        self.assertEqual(root.findall("calculation")[-1].find("dos/i").text, "2.0")
+
+    def test_broken_xml_file_is_ignored(self):
+        with open(self.filePath, "w") as f:
+            f.write(XML[:100])
+        self.assertIsNone(StreamingXMLParser(self.filePath).root)
+
+    def test_index_holds_byte_offsets_of_indexed_tags(self):
+        parser = IndexedXMLParser(self.filePath)
+        self.assertEqual([XML[e[0]:e[1]][:5] for e in parser.index["dos"]], ["<dos>", "<dos>"])
+        self.assertEqual(len(parser.index["calculation"]), 2)
+        self.assertEqual(parser._find_indexed("dos", last=True).find("i").text, "2.0")
+        self.assertFalse(parser._root_parsed)
+
+    def test_index_is_stored_in_sidecar_file(self):
+        index = IndexedXMLParser(self.filePath).index
+        self.assertTrue(os.path.exists(self.filePath + XML_INDEX_FILE_SUFFIX))
+        parser = IndexedXMLParser(self.filePath)
+        parser._build_index = None
+        self.assertEqual(parser.index, index)
+        # the sidecar file is written through a temporary file which is renamed
+        self.assertEqual(sorted(os.listdir(self.tempDir)), ["vasprun.xml", "vasprun.xml" + XML_INDEX_FILE_SUFFIX])
+
+    def test_decode_rows(self):
+        rows = [ET.fromstring("<r> -1.5  1.0E-002 </r>"), ET.fromstring("<r> 2.0  3 </r>")]
+        self.assertEqual(decode_rows(rows).tolist(), [[-1.5, 0.01], [2.0, 3.0]])
+        self.assertEqual(decode_rows([]).tolist(), [])
+
+    def test_decode_rows_with_overflowed_value(self):
+        with self.assertRaises(ValueError):
+            decode_rows([ET.fromstring("<r> -1.5  1.0 </r>"), ET.fromstring("<r> ********  3 </r>")])
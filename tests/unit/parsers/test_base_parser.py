@@ -0,0 +1,70 @@
+import os
+import mmap
+import shutil
+import tempfile
+
+from tests.unit import UnitTestBase
+from express.parsers import BaseParser
+
+
+class BaseParserTest(UnitTestBase):
+    def setUp(self):
+        super(BaseParserTest, self).setUp()
+        self.tempDir = tempfile.mkdtemp()
+        self.filePath = os.path.join(self.tempDir, "stdout")
+        self.write("total energy = -15.8")
+
+    def tearDown(self):
+        super(BaseParserTest, self).setUp()
+        shutil.rmtree(self.tempDir)
+
+    def write(self, content):
+        with open(self.filePath, "w") as f:
+            f.write(content)
+
+    def test_file_content_is_cached(self):
+        parser = BaseParser()
+        content = parser._get_file_content(self.filePath)
+        self.assertIs(parser._get_file_content(self.filePath), content)
+        os.remove(self.filePath)
+        self.write("total energy = -15.9")
+        os.utime(self.filePath, (0, 0))
+        self.assertEqual(parser._get_file_content(self.filePath), "total energy = -15.9")
+        self.assertEqual(len(parser._file_content_cache), 1)
+
+    def test_file_content_cache_invalidation(self):
+        parser = BaseParser()
+        parser._get_file_content(self.filePath)
+        parser.invalidate_file_content_cache(self.filePath)
+        self.assertEqual(len(parser._file_content_cache), 0)
+        self.assertEqual(parser._file_content_cache_size, 0)
+
+    def test_file_content_cache_max_size(self):
+        parser = BaseParser(file_content_cache_max_size=10)
+        self.assertEqual(parser._get_file_content(self.filePath), "total energy = -15.8")
+        self.assertEqual(len(parser._file_content_cache), 0)
+
+    def test_large_file_content_is_memory_mapped(self):
+        parser = BaseParser(mmap_file_size_threshold=1)
+        content = parser._get_file_content(self.filePath)
+        self.assertIsInstance(content, mmap.mmap)
+        self.assertEqual(content[:], "total energy = -15.8")
+        self.assertEqual(parser._file_content_cache_size, len(content))
+
+    def test_memory_maps_are_closed_on_invalidation(self):
+        parser = BaseParser(mmap_file_size_threshold=1)
+        open_files = len(os.listdir("/proc/self/fd"))
+        parser._get_file_content(self.filePath)
+        self.assertEqual(len(os.listdir("/proc/self/fd")), open_files + 1)
+        parser.invalidate_file_content_cache()
+        self.assertEqual(len(os.listdir("/proc/self/fd")), open_files)
+
+    def test_evicted_memory_maps_in_use_are_kept_open(self):
+        other_file_path = os.path.join(self.tempDir, "OUTCAR")
+        with open(other_file_path, "w") as f:
+            f.write("total energy = -15.9")
+        parser = BaseParser(mmap_file_size_threshold=1, file_content_cache_max_size=30)
+        content = parser._get_file_content(self.filePath)
+        parser._get_file_content(other_file_path)
+        self.assertEqual(parser._file_content_cache.keys(), [other_file_path])
+        self.assertEqual(content[:], "total energy = -15.8")
@@ -0,0 +1,52 @@
+from tests.unit import UnitTestBase
+from express.parsers.eigenvalues import EigenvalueData
+
+EIGENVALUES_AT_KPOINTS = [
+    {
+        "kpoint": [0.0, 0.0, 0.0],
+        "weight": 0.25,
+        "eigenvalues": [
+            {"energies": [-1.0, 1.0, 2.0], "occupations": [1.0, 0.0, 0.0], "spin": 0.5},
+            {"energies": [-2.0, 0.5, 3.0], "occupations": [1.0, 0.0, 0.0], "spin": -0.5}
+        ]
+    },
+    {
+        "kpoint": [0.5, 0.0, 0.0],
+        "weight": 0.0,
+        "eigenvalues": [
+            {"energies": [-3.0, 0.5, 3.0], "occupations": [1.0, 0.0, 0.0], "spin": -0.5},
+            {"energies": [-1.5, 1.5, 2.5], "occupations": [1.0, 0.0, 0.0], "spin": 0.5}
+        ]
+    }
+]
+
+
+class EigenvalueDataTest(UnitTestBase):
+    def setUp(self):
+        super(EigenvalueDataTest, self).setUp()
+
+    def tearDown(self):
+        super(EigenvalueDataTest, self).setUp()
+
+    def test_from_list(self):
+        data = EigenvalueData.from_list(EIGENVALUES_AT_KPOINTS)
+        self.assertEqual((data.nspins, data.nkpoints, data.nbands), (2, 2, 3))
+        self.assertEqual(data.energies[1, 1].tolist(), [-3.0, 0.5, 3.0])
+        self.assertEqual(data.weights.tolist(), [0.25, 0.0])
+
+    def test_to_list(self):
+        data = EigenvalueData.from_list(EIGENVALUES_AT_KPOINTS).to_list()
+        self.assertEqual(data[0], EIGENVALUES_AT_KPOINTS[0])
+        self.assertEqual(data[1]["eigenvalues"][0], EIGENVALUES_AT_KPOINTS[1]["eigenvalues"][1])
+
+    def test_select(self):
+        data = EigenvalueData.from_list(EIGENVALUES_AT_KPOINTS)
+        selected = data.select(data.weights == 0.0)
+        self.assertEqual(selected.kpoints.tolist(), [[0.5, 0.0, 0.0]])
+        self.assertEqual(selected.energies.shape, (2, 1, 3))
+
+    def test_empty_occupations(self):
+        data = EigenvalueData.from_list([{"kpoint": [0, 0, 0], "weight": 1.0, "eigenvalues": [
+            {"energies": [-1.0, 1.0], "occupations": [], "spin": 0.5}]}])
+        self.assertEqual(data.occupations.shape, (1, 1, 0))
+        self.assertEqual(data.to_list()[0]["eigenvalues"][0]["occupations"], [])
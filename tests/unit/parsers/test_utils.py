@@ -0,0 +1,50 @@
+import os
+import shutil
+import tempfile
+
+from mock import patch
+
+from tests.unit import UnitTestBase
+from express.parsers.utils import WorkDirIndex, find_file
+
+
+class WorkDirIndexTest(UnitTestBase):
+    def setUp(self):
+        super(WorkDirIndexTest, self).setUp()
+        self.tempDir = tempfile.mkdtemp()
+        for path in ["pw.out", "01/stdout", "02/stdout", "tmp/_gw0/si.save/data-file.xml", "tmp/si.save/data-file.xml",
+                     "tmp/si.save/wfc1.dat", "si.pdos_tot"]:
+            path = os.path.join(self.tempDir, path)
+            if not os.path.isdir(os.path.dirname(path)): os.makedirs(os.path.dirname(path))
+            open(path, "w").close()
+        os.symlink(self.tempDir, os.path.join(self.tempDir, "link"))
+
+    def tearDown(self):
+        super(WorkDirIndexTest, self).setUp()
+        shutil.rmtree(self.tempDir)
+
+    def test_find(self):
+        index = WorkDirIndex(self.tempDir)
+        self.assertEqual(index.find("pdos_tot"), os.path.join(self.tempDir, "si.pdos_tot"))
+        self.assertEqual(index.find(r"\.pdos_\w+$", regex=True), os.path.join(self.tempDir, "si.pdos_tot"))
+        self.assertIsNone(index.find("pdos", exact=True))
+        self.assertEqual(find_file("pdos_tot", self.tempDir), index.find("pdos_tot"))
+
+    def test_find_all(self):
+        files = WorkDirIndex(self.tempDir).find_all("data-file.xml", exact=True)
+        self.assertEqual(sorted(files), [os.path.join(self.tempDir, "tmp/_gw0/si.save/data-file.xml"),
+                                         os.path.join(self.tempDir, "tmp/si.save/data-file.xml")])
+
+    def test_pruned_files(self):
+        self.assertIsNone(WorkDirIndex(self.tempDir).find("wfc"))
+
+    def test_list_dir(self):
+        index = WorkDirIndex(self.tempDir)
+        self.assertEqual(sorted(index.list_dir()), ["pw.out", "si.pdos_tot"])
+        self.assertEqual(sorted(index.list_dir(dirs=True)), ["01", "02", "link", "tmp"])
+
+    def test_find_file_stops_at_first_match(self):
+        list_dir = WorkDirIndex._list_dir
+        with patch.object(WorkDirIndex, "_list_dir", autospec=True, side_effect=list_dir) as mocked_list_dir:
+            self.assertEqual(find_file("pw.out", self.tempDir), os.path.join(self.tempDir, "pw.out"))
+        self.assertEqual(mocked_list_dir.call_count, 1)
@@ -1,6 +1,7 @@
 from mock import MagicMock
 
 from tests.unit import UnitTestBase
+from express.parsers.eigenvalues import EigenvalueData
 from express.properties.non_scalar.bandgaps import BandGaps
 from tests.fixtures.data import EIGENVALUES_AT_KPOINTS, IBZ_K_POINTS
 
@@ -210,3 +211,42 @@ class BandGapsTest(UnitTestBase):
         parser.attach_mock(MagicMock(return_value=EIGENVALUES_AT_KPOINTS), "eigenvalues_at_kpoints")
         property_ = BandGaps("band_gaps", parser)
         self.assertDeepAlmostEqual(property_.serialize_and_validate(), BAND_GAPS)
+
+    def _get_spin_polarized_band_gaps(self, energies):
+        parser = MagicMock()
+        parser.attach_mock(MagicMock(return_value=2), "nspins")
+        parser.attach_mock(MagicMock(return_value=0.0), "fermi_energy")
+        parser.attach_mock(MagicMock(return_value=[[0, 0, 0], [0.5, 0, 0]]), "ibz_k_points")
+        eigenvalue_data = EigenvalueData([[0, 0, 0], [0.5, 0, 0]], [0.5, 0.5], energies, [[[]] * 2] * 2)
+        parser.attach_mock(MagicMock(return_value=eigenvalue_data), "eigenvalue_data")
+        return BandGaps("band_gaps", parser)
+
+    def test_band_gaps_spin_polarized(self):
+        property_ = self._get_spin_polarized_band_gaps([[[-2.0, 1.0], [-1.0, 3.0]], [[-1.5, 2.0], [-3.0, 0.5]]])
+        direct, indirect = property_.compute_on_mesh("direct"), property_.compute_on_mesh("indirect")
+        self.assertAlmostEqual(direct["value"], 3.0)
+        self.assertAlmostEqual(indirect["value"], 1.5)
+        self.assertEqual((indirect["kpointValence"], indirect["kpointConduction"]), ([0.5, 0, 0], [0.5, 0, 0]))
+
+    def test_band_gaps_metal(self):
+        property_ = self._get_spin_polarized_band_gaps([[[-2.0, 1.0], [-1.0, -0.5]], [[-1.5, 2.0], [-3.0, 0.5]]])
+        self.assertEqual(property_.compute_on_mesh("indirect")["value"], 0.0)
+
+    def test_compute_all_gaps(self):
+        property_ = self._get_spin_polarized_band_gaps([[[-2.0, 1.0], [-1.0, 3.0]], [[-1.5, 2.0], [-3.0, 0.5]]])
+        gaps = property_.compute_all_gaps()
+        self.assertAlmostEqual(gaps["indirect"]["value"], 1.5)
+        self.assertEqual([_["spin"] for _ in gaps["spins"]], [0.5, -0.5])
+        self.assertAlmostEqual(gaps["spins"][0]["indirect"]["value"], 2.0)
+        self.assertAlmostEqual(gaps["spins"][1]["direct"]["value"], 3.5)
+        self.assertEqual(gaps["spins"][1]["indirect"]["kpointValence"], [0, 0, 0])
+
+    def test_eigenvalues_window(self):
+        parser = MagicMock()
+        parser.attach_mock(MagicMock(return_value=1), "nspins")
+        eigenvalue_data = EigenvalueData([[0, 0, 0]], [1.0], [[[-3.0, -2.0, -1.0, 1.0, 2.0, 3.0]]],
+                                         [[[1.0, 1.0, 0.5, 0.0, 0.0, 0.0]]])
+        parser.attach_mock(MagicMock(return_value=eigenvalue_data), "eigenvalue_data")
+        eigenvalues = BandGaps("band_gaps", parser)._eigenvalues()[0]["eigenvalues"][0]
+        self.assertEqual(eigenvalues["energies"], [-3.0, -2.0, -1.0, 1.0, 2.0])
+        self.assertEqual(eigenvalues["occupations"], [1.0, 1.0, 0.5, 0.0, 0.0])
@@ -1,6 +1,7 @@
 from mock import MagicMock
 
 from tests.unit import UnitTestBase
+from express.parsers.eigenvalues import EigenvalueData
 from express.properties.non_scalar.two_dimensional_plot.band_structure import BandStructure
 from tests.fixtures.data import BAND_STRUCTURE, HSE_EIGENVALUES_AT_KPOINTS, HSE_BAND_STRUCTURE, EIGENVALUES_AT_KPOINTS
 
@@ -25,3 +26,13 @@ class BandStructureTest(UnitTestBase):
         parser.attach_mock(MagicMock(return_value=HSE_EIGENVALUES_AT_KPOINTS), "eigenvalues_at_kpoints")
         property_ = BandStructure("band_structure", parser, remove_non_zero_weight_kpoints=True)
         self.assertDeepAlmostEqual(property_.serialize_and_validate(), HSE_BAND_STRUCTURE)
+
+    def test_spin_polarized_band_structure(self):
+        parser = MagicMock()
+        parser.attach_mock(MagicMock(return_value=2), "nspins")
+        eigenvalue_data = EigenvalueData([[0, 0, 0], [0.5, 0, 0], [0.5, 0.5, 0]], [0.5, 0.0, 0.0],
+                                         [[[1, 2], [3, 4], [5, 6]], [[7, 8], [9, 10], [11, 12]]], [[[]] * 3] * 2)
+        parser.attach_mock(MagicMock(return_value=eigenvalue_data), "eigenvalue_data")
+        property_ = BandStructure("band_structure", parser, remove_non_zero_weight_kpoints=True)
+        self.assertEqual(property_.xDataArray.tolist(), [[0.5, 0, 0], [0.5, 0.5, 0]])
+        self.assertEqual(property_.yDataSeries.tolist(), [[3, 5], [9, 11], [4, 6], [10, 12]])
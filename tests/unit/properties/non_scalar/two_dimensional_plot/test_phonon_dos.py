@@ -1,4 +1,13 @@
+import os
+import base64
+import shutil
+import tempfile
+import numpy as np
+from mock import MagicMock
+from jsonschema import ValidationError
+
 from tests.unit import UnitTestBase
+from express.settings import PLOT_DATA_FILE_SUFFIX
 from tests.fixtures.data import PHONON_DOS_RAW_DATA
 from express.properties.non_scalar.two_dimensional_plot.phonon_dos import PhononDOS
 
@@ -40,3 +49,43 @@ class PhononDOSTest(UnitTestBase):
         parser = self.get_mocked_parser("phonon_dos", PHONON_DOS_RAW_DATA)
         property_ = PhononDOS("phonon_dos", parser)
         self.assertDeepAlmostEqual(property_.serialize_and_validate(), PHONON_DOS)
+
+    def test_phonon_dos_base64(self):
+        parser = self.get_mocked_parser("phonon_dos", PHONON_DOS_RAW_DATA)
+        property_ = PhononDOS("phonon_dos", parser, data_encoding="base64")
+        data = property_.serialize_and_validate()["yDataSeries"]
+        self.assertEqual(data["shape"], [1, 3])
+        values = np.frombuffer(base64.b64decode(data["data"]), dtype=data["dtype"]).reshape(data["shape"])
+        self.assertDeepAlmostEqual(values.tolist(), PHONON_DOS["yDataSeries"])
+
+    def test_phonon_dos_npy(self):
+        parser = self.get_mocked_parser("phonon_dos", PHONON_DOS_RAW_DATA)
+        data_dir = tempfile.mkdtemp()
+        try:
+            property_ = PhononDOS("phonon_dos", parser, data_encoding="npy", data_dir=data_dir)
+            data = property_.serialize_and_validate()["xDataArray"]
+            self.assertEqual(os.path.dirname(data["path"]), data_dir)
+            self.assertTrue(data["path"].endswith(PLOT_DATA_FILE_SUFFIX))
+            self.assertDeepAlmostEqual(np.load(data["path"]).tolist(), PHONON_DOS["xDataArray"])
+        finally:
+            shutil.rmtree(data_dir)
+
+    def test_phonon_dos_npy_files_are_written_into_work_dir(self):
+        parser = self.get_mocked_parser("phonon_dos", PHONON_DOS_RAW_DATA)
+        parser.work_dir = tempfile.mkdtemp()
+        try:
+            data = PhononDOS("phonon_dos", parser, data_encoding="npy").serialize_and_validate()
+            other_data = dict(PHONON_DOS_RAW_DATA, total=[1.0, 2.0, 3.0])
+            parser.attach_mock(MagicMock(return_value=other_data), "phonon_dos")
+            other = PhononDOS("phonon_dos", parser, data_encoding="npy").serialize_and_validate()
+            self.assertEqual(os.path.dirname(data["yDataSeries"]["path"]), parser.work_dir)
+            self.assertNotEqual(data["yDataSeries"]["path"], other["yDataSeries"]["path"])
+            self.assertEqual(data["xDataArray"]["path"], other["xDataArray"]["path"])
+            self.assertEqual(len(os.listdir(parser.work_dir)), 3)
+        finally:
+            shutil.rmtree(parser.work_dir)
+
+    def test_encoded_data_is_validated(self):
+        parser = self.get_mocked_parser("phonon_dos", dict(PHONON_DOS_RAW_DATA, total=[[1.0, 2.0, 3.0]]))
+        with self.assertRaises(ValidationError):
+            PhononDOS("phonon_dos", parser, data_encoding="base64").serialize_and_validate()
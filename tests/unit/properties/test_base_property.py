@@ -0,0 +1,38 @@
+from jsonschema import ValidationError
+
+from tests.unit import UnitTestBase
+from express.properties.scalar.total_energy import TotalEnergy
+from express.properties import VALIDATORS, get_validator, sample_instance
+
+
+class BasePropertyTest(UnitTestBase):
+    def setUp(self):
+        super(BasePropertyTest, self).setUp()
+
+    def tearDown(self):
+        super(BasePropertyTest, self).setUp()
+
+    def test_esse_and_validator_are_shared(self):
+        property1 = TotalEnergy("total_energy", self.get_mocked_parser("total_energy", 1))
+        property2 = TotalEnergy("total_energy", self.get_mocked_parser("total_energy", 2))
+        self.assertIs(property1.esse, property2.esse)
+        property1.serialize_and_validate()
+        self.assertIs(VALIDATORS[property1.manifest["schemaId"]], get_validator(property2.schema))
+
+    def test_validation_levels(self):
+        parser = self.get_mocked_parser("total_energy", "string")
+        with self.assertRaises(ValidationError):
+            TotalEnergy("total_energy", parser).serialize_and_validate()
+        with self.assertRaises(ValidationError):
+            TotalEnergy("total_energy", parser, validation_level="sampled").serialize_and_validate()
+        self.assertEqual(TotalEnergy("total_energy", parser, validation_level="off").serialize_and_validate()["value"],
+                         "string")
+
+    def test_unknown_validation_level(self):
+        with self.assertRaises(ValueError):
+            TotalEnergy("total_energy", self.get_mocked_parser("total_energy", 1), validation_level="partial")
+
+    def test_sample_instance(self):
+        sample = sample_instance({"values": range(100), "vector": [[1, 2, 3]] * 20}, 10)
+        self.assertEqual(sample["values"], range(0, 100, 10))
+        self.assertEqual(sample["vector"], [[1, 2, 3]] * 10)
@@ -0,0 +1,53 @@
+from mock import MagicMock
+
+from tests.unit import UnitTestBase
+from express.parsers.eigenvalues import EigenvalueData
+from express.properties.scalar.total_energy import TotalEnergy
+from express.properties.utils import eigenvalues, get_eigenvalue_data
+
+EIGENVALUES_AT_KPOINTS = [
+    {
+        "kpoint": [0.0, 0.0, 0.0],
+        "weight": 0.5,
+        "eigenvalues": [
+            {"energies": [-1.0, 1.0], "occupations": [1.0, 0.0], "spin": 0.5},
+            {"energies": [-2.0, 2.0], "occupations": [1.0, 0.0], "spin": -0.5}
+        ]
+    },
+    {
+        "kpoint": [0.5, 0.0, 0.0],
+        "weight": 0.5,
+        "eigenvalues": [
+            {"energies": [-3.0, 3.0], "occupations": [1.0, 0.0], "spin": 0.5},
+            {"energies": [-4.0, 4.0], "occupations": [1.0, 0.0], "spin": -0.5}
+        ]
+    }
+]
+
+
+class PropertiesUtilsTest(UnitTestBase):
+    def setUp(self):
+        super(PropertiesUtilsTest, self).setUp()
+
+    def tearDown(self):
+        super(PropertiesUtilsTest, self).setUp()
+
+    def get_property(self, parser):
+        parser.total_energy = MagicMock(return_value=-1.0)
+        return TotalEnergy("total_energy", parser)
+
+    def test_eigenvalues(self):
+        self.assertEqual(eigenvalues(EIGENVALUES_AT_KPOINTS), [-1.0, 1.0])
+        self.assertEqual(eigenvalues(EIGENVALUES_AT_KPOINTS, kpoint_index=1, spin_index=1), [-4.0, 4.0])
+        spin_up_only = [dict(_, eigenvalues=_["eigenvalues"][:1]) for _ in EIGENVALUES_AT_KPOINTS]
+        self.assertIsNone(eigenvalues(spin_up_only, spin_index=1))
+
+    def test_get_eigenvalue_data_from_eigenvalues_at_kpoints(self):
+        parser = MagicMock(spec=["total_energy", "eigenvalues_at_kpoints"])
+        parser.eigenvalues_at_kpoints = MagicMock(return_value=EIGENVALUES_AT_KPOINTS)
+        data = get_eigenvalue_data(self.get_property(parser))
+        self.assertIsInstance(data, EigenvalueData)
+        self.assertEqual(data.energies.shape, (2, 2, 2))
+
+    def test_get_eigenvalue_data_without_eigenvalues(self):
+        self.assertIsNone(get_eigenvalue_data(self.get_property(MagicMock(spec=["total_energy"]))))
@@ -0,0 +1,76 @@
+import os
+import json
+import signal
+import shutil
+import tempfile
+
+from express import settings
+from tests.unit import UnitTestBase
+from express.bulk import expand_job_dirs, extract_jobs, main
+
+
+class Parser(object):
+    def __init__(self, *args, **kwargs):
+        with open(kwargs["stdout_file"]) as f:
+            content = f.read()
+        if content == "kill": os.kill(os.getpid(), signal.SIGKILL)
+        if content == "allocate": content = " " * 1024 ** 3
+        self.energy = float(content)
+
+    def total_energy(self):
+        return self.energy
+
+
+class BulkTest(UnitTestBase):
+    def setUp(self):
+        super(BulkTest, self).setUp()
+        self.tempDir = tempfile.mkdtemp()
+        for name, content in [("job-1", "-1.5"), ("job-2", "-2.5"), ("job-3", None)]:
+            os.mkdir(os.path.join(self.tempDir, name))
+            if content is None: continue
+            with open(os.path.join(self.tempDir, name, "stdout"), "w") as f:
+                f.write(content)
+        settings.PARSERS_REGISTRY["bulk-test"] = "tests.unit.test_bulk.Parser"
+
+    def tearDown(self):
+        super(BulkTest, self).setUp()
+        del settings.PARSERS_REGISTRY["bulk-test"]
+        shutil.rmtree(self.tempDir)
+
+    def test_expand_job_dirs(self):
+        patterns = [os.path.join(self.tempDir, "job-*"), os.path.join(self.tempDir, "job-1")]
+        self.assertEqual([os.path.basename(_) for _ in expand_job_dirs(patterns)], ["job-1", "job-2", "job-3"])
+
+    def test_extract_jobs(self):
+        job_dirs = expand_job_dirs([os.path.join(self.tempDir, "job-*")])
+        records = dict((r["work_dir"], r) for r in extract_jobs(job_dirs, "bulk-test", ["total_energy"], "stdout", 2))
+        self.assertEqual(records[job_dirs[1]]["results"][0]["data"]["value"], -2.5)
+        self.assertEqual(records[job_dirs[2]]["error"]["type"], "IOError")
+
+    def write_stdout(self, name, content):
+        os.mkdir(os.path.join(self.tempDir, name))
+        with open(os.path.join(self.tempDir, name, "stdout"), "w") as f:
+            f.write(content)
+
+    def test_lost_worker(self):
+        self.write_stdout("job-4", "kill")
+        job_dirs = expand_job_dirs([os.path.join(self.tempDir, "job-*")])
+        records = dict((r["work_dir"], r) for r in extract_jobs(job_dirs, "bulk-test", ["total_energy"], "stdout", 2))
+        self.assertEqual(len(records), 4)
+        self.assertEqual(records[job_dirs[3]]["error"]["type"], "WorkerLostError")
+        self.assertEqual(records[job_dirs[0]]["results"][0]["data"]["value"], -1.5)
+
+    def test_max_memory_per_worker(self):
+        self.write_stdout("job-4", "allocate")
+        job_dirs = expand_job_dirs([os.path.join(self.tempDir, "job-4")])
+        records = list(extract_jobs(job_dirs, "bulk-test", ["total_energy"], "stdout", 1,
+                                    max_memory_per_worker=512 * 1024 ** 2))
+        self.assertEqual(records[0]["error"]["type"], "MemoryError")
+
+    def test_main(self):
+        output = os.path.join(self.tempDir, "results.jsonl")
+        main(["--parser", "bulk-test", "--properties", "total_energy", "--stdout-file", "stdout", "--output", output,
+              "--processes", "1", os.path.join(self.tempDir, "job-1")])
+        with open(output) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(records[0]["results"][0]["data"]["value"], -1.5)
@@ -0,0 +1,113 @@
+import os
+import json
+import shutil
+import tempfile
+
+from mock import patch
+
+from express import ExPrESS, settings
+from tests.unit import UnitTestBase
+from express.parsers import BaseParser
+from express.cache import PropertyCache
+from express.parsers.utils import WorkDirIndex
+from express.parsers.settings import XML_INDEX_FILE_SUFFIX
+
+
+class Parser(BaseParser):
+    calls = 0
+
+    def __init__(self, *args, **kwargs):
+        super(Parser, self).__init__(*args, **kwargs)
+        self.stdout_file = kwargs["stdout_file"]
+        self.work_dir_index = WorkDirIndex(kwargs["work_dir"])
+
+    def total_energy(self):
+        Parser.calls += 1
+        # write a sidecar file next to the input, as XML parsers do with their index.
+        with open(self.stdout_file + XML_INDEX_FILE_SUFFIX, "w") as f:
+            f.write(str(Parser.calls))
+        return float(self._get_file_content(self.stdout_file))
+
+
+class PropertyCacheTest(UnitTestBase):
+    def setUp(self):
+        super(PropertyCacheTest, self).setUp()
+        self.tempDir = tempfile.mkdtemp()
+        self.cacheDir = os.path.join(self.tempDir, "cache")
+        self.filePath = os.path.join(self.tempDir, "stdout")
+        self.mtime = 0
+        self.write("-1.5")
+        settings.PARSERS_REGISTRY["cache-test"] = "{0}.Parser".format(__name__)
+        Parser.calls = 0
+
+    def tearDown(self):
+        super(PropertyCacheTest, self).setUp()
+        del settings.PARSERS_REGISTRY["cache-test"]
+        shutil.rmtree(self.tempDir)
+
+    def write(self, content):
+        with open(self.filePath, "w") as f:
+            f.write(content)
+        # make sure the modification time changes
+        self.mtime += 10
+        os.utime(self.filePath, (self.mtime, self.mtime))
+
+    def test_cache_hit_and_miss(self):
+        cache = PropertyCache(self.cacheDir)
+        cache.set(["key"], [self.filePath], {"value": 1})
+        self.assertEqual(cache.get(["key"]), {"value": 1})
+        self.write("-2.5")
+        self.assertIsNone(cache.get(["key"]))
+
+    def test_cache_eviction(self):
+        cache = PropertyCache(self.cacheDir)
+        cache.set(["key", 1], [self.filePath], {"value": 1})
+        size = cache.size
+        cache.max_size = size * 3 / 2
+        cache.set(["key", 2], [self.filePath], {"value": 2})
+        self.assertIsNone(cache.get(["key", 1]))
+        self.assertEqual(cache.get(["key", 2]), {"value": 2})
+        self.assertEqual(cache.connection.execute("SELECT COUNT(*) FROM manifests").fetchone()[0], 1)
+        self.assertEqual(cache.size, size)
+
+    def test_files_are_hashed_once(self):
+        cache = PropertyCache(self.cacheDir)
+        with patch("express.cache.hash_file", return_value="sha1") as hash_file:
+            cache.set(["key", 1], [self.filePath], {"value": 1})
+            cache.set(["key", 2], [self.filePath], {"value": 2})
+            cache.get(["key", 1])
+        self.assertEqual(hash_file.call_count, 1)
+
+    def test_express_property_is_cached(self):
+        kwargs = {"work_dir": self.tempDir, "stdout_file": self.filePath, "cache_dir": self.cacheDir}
+        self.assertEqual(ExPrESS("cache-test", **kwargs).property("total_energy")["value"], -1.5)
+        self.assertEqual(ExPrESS("cache-test", **kwargs).property("total_energy")["value"], -1.5)
+        self.assertEqual(Parser.calls, 1)
+        self.write("-2.5")
+        self.assertEqual(ExPrESS("cache-test", **kwargs).property("total_energy")["value"], -2.5)
+        self.assertEqual(Parser.calls, 2)
+
+    def test_cached_extraction_runs_twice(self):
+        kwargs = {"work_dir": self.tempDir, "stdout_file": self.filePath, "cache_dir": self.cacheDir}
+        for _ in range(3):
+            data = ExPrESS("cache-test", **kwargs).property("total_energy")
+            self.assertEqual(Parser.calls, 1)
+        self.assertEqual(data, {"name": "total_energy", "units": "eV", "value": -1.5})
+        self.assertIsInstance(data["units"], str)
+
+    def test_parser_read_files_are_recorded(self):
+        kwargs = {"work_dir": self.tempDir, "stdout_file": self.filePath, "cache_dir": self.cacheDir}
+        express = ExPrESS("cache-test", **kwargs)
+        express.property("total_energy")
+        self.assertEqual(express.parser.read_files, {self.filePath})
+        manifest = express.cache.connection.execute("SELECT files FROM manifests").fetchone()[0]
+        self.assertEqual([f[0] for f in json.loads(manifest)], [self.filePath])
+
+    def test_new_work_dir_files_invalidate_cache(self):
+        kwargs = {"work_dir": self.tempDir, "stdout_file": self.filePath, "cache_dir": self.cacheDir}
+        ExPrESS("cache-test", **kwargs).property("total_energy")
+        ExPrESS("cache-test", **kwargs).property("total_energy")
+        self.assertEqual(Parser.calls, 1)
+        open(os.path.join(self.tempDir, "si.pdos_tot"), "w").close()
+        ExPrESS("cache-test", **kwargs).property("total_energy")
+        self.assertEqual(Parser.calls, 2)
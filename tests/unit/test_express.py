@@ -0,0 +1,47 @@
+from tests.unit import UnitTestBase
+from express import ExPrESS, CLASSES
+
+
+class Parser(object):
+    def __init__(self):
+        self.calls = 0
+
+    def total_energy(self):
+        self.calls += 1
+        return -19.0
+
+    def fermi_energy(self):
+        raise ValueError("no fermi energy")
+
+
+class ExPrESSTest(UnitTestBase):
+    def setUp(self):
+        super(ExPrESSTest, self).setUp()
+
+    def tearDown(self):
+        super(ExPrESSTest, self).setUp()
+
+    def get_express(self):
+        express_ = ExPrESS()
+        express_.parser = Parser()
+        return express_
+
+    def test_properties(self):
+        express_ = self.get_express()
+        results = express_.properties(["total_energy", "fermi_energy", ("total_energy", {"validation_level": "off"})])
+        self.assertEqual([r["name"] for r in results], ["total_energy", "fermi_energy", "total_energy"])
+        self.assertEqual(results[0]["data"]["value"], -19.0)
+        self.assertEqual(results[1]["error"], {"type": "ValueError", "message": "no fermi energy"})
+        self.assertTrue(all(r["time"] >= 0 for r in results))
+
+    def test_properties_memoize_parser_methods(self):
+        express_ = self.get_express()
+        express_.properties(["total_energy", "total_energy"])
+        self.assertEqual(express_.parser.calls, 1)
+        self.assertNotIn("total_energy", express_.parser.__dict__)
+
+    def test_property_class_is_resolved_once(self):
+        express_ = self.get_express()
+        express_.property("total_energy")
+        self.assertIs(CLASSES["express.properties.scalar.total_energy.TotalEnergy"],
+                      express_._get_property_class("total_energy"))